@@ -0,0 +1,11 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Benchmarks which can be run without any additional files, for example
+
+    python -m openpyxl.benchmarks.styles
+
+The full suite is run with
+
+    python -m openpyxl.benchmarks
+"""
@@ -0,0 +1,5 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from .suite import main
+
+main()
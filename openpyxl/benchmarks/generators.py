@@ -0,0 +1,119 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Synthetic workbooks for benchmarks. Each generator fills a worksheet with
+`rows` rows of `cols` values of a particular kind. The same arguments always
+produce the same workbook.
+"""
+
+from datetime import datetime, timedelta
+from random import Random
+
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+from openpyxl.styles import Font, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
+
+
+def numeric(ws, rows, cols):
+    """
+    Integers and floats
+    """
+    rnd = Random(rows * cols)
+    for row in range(rows):
+        ws.append([rnd.randint(0, 10000) if col % 2 else rnd.random() * 1000
+                   for col in range(cols)])
+
+
+def strings(ws, rows, cols):
+    """
+    Strings, half of which are repeated
+    """
+    rnd = Random(rows * cols)
+    shared = ["Category {0}".format(idx) for idx in range(50)]
+    for row in range(rows):
+        ws.append([rnd.choice(shared) if col % 2 else "Text {0} {1}".format(row, col)
+                   for col in range(cols)])
+
+
+def dates(ws, rows, cols):
+    """
+    Dates and times
+    """
+    start = datetime(2000, 1, 1)
+    for row in range(rows):
+        ws.append([start + timedelta(days=row, hours=col) for col in range(cols)])
+
+
+def styled(ws, rows, cols):
+    """
+    Numbers with a few different fonts, fills, borders and number formats
+    """
+    fonts = [Font(b=True), Font(i=True), Font(color="FF0000"), Font(sz=14)]
+    fills = [PatternFill("solid", fgColor=color) for color in ("FFFF00", "00FF00", "DDDDDD")]
+    side = Side(style="thin")
+    borders = [Border(), Border(left=side, right=side, top=side, bottom=side)]
+    formats = ["General", "0.00", "#,##0", "0.0%"]
+
+    numeric(ws, rows, cols)
+    for idx, row in enumerate(ws.iter_rows()):
+        for col, cell in enumerate(row):
+            n = idx + col
+            cell.font = fonts[n % len(fonts)]
+            cell.fill = fills[n % len(fills)]
+            cell.border = borders[n % len(borders)]
+            cell.number_format = formats[n % len(formats)]
+
+
+def formulae(ws, rows, cols):
+    """
+    A column of numbers and formulae which refer to them
+    """
+    rnd = Random(rows * cols)
+    for row in range(1, rows + 1):
+        values = [rnd.randint(0, 100)]
+        for col in range(2, cols + 1):
+            prev = get_column_letter(col - 1)
+            values.append("={0}{1}*2+1".format(prev, row))
+        ws.append(values)
+
+
+def merged(ws, rows, cols):
+    """
+    Numbers with every fifth row merged into a single cell
+    """
+    numeric(ws, rows, cols)
+    last = get_column_letter(cols)
+    for row in range(1, rows + 1, 5):
+        ws.merge_cells("A{0}:{1}{0}".format(row, last))
+
+
+def commented(ws, rows, cols):
+    """
+    Numbers with a comment on every tenth cell
+    """
+    numeric(ws, rows, cols)
+    for idx, row in enumerate(ws.iter_rows()):
+        for col, cell in enumerate(row):
+            if (idx * cols + col) % 10 == 0:
+                cell.comment = Comment("Note {0}".format(cell.coordinate), "benchmark")
+
+
+GENERATORS = {
+    "numeric": numeric,
+    "strings": strings,
+    "dates": dates,
+    "styled": styled,
+    "formulae": formulae,
+    "merged": merged,
+    "commented": commented,
+}
+
+
+def make_workbook(kind, rows, cols):
+    """
+    Create a workbook with a worksheet of the given kind
+    """
+    wb = Workbook()
+    GENERATORS[kind](wb.active, rows, cols)
+    return wb
@@ -0,0 +1,69 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Time how long `import openpyxl` takes in a new interpreter, and check that
+the modules which should only be imported when they are used have not been.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import openpyxl
+
+
+LAZY = ("openpyxl.chart", "openpyxl.chartsheet", "openpyxl.pivot.table",
+        "openpyxl.pivot.cache", "openpyxl.drawing.spreadsheet_drawing",
+        "openpyxl.styles.builtins", "numpy", "pandas", "PIL")
+
+SCRIPT = """
+import sys
+from timeit import default_timer
+start = default_timer()
+import openpyxl
+print(default_timer() - start)
+print(" ".join(m for m in {0!r} if m in sys.modules))
+""".format(LAZY)
+
+
+def measure():
+    """
+    Time taken to import openpyxl and the modules which were imported but
+    should not have been
+    """
+    root = os.path.dirname(os.path.dirname(openpyxl.__file__))
+    out = subprocess.check_output([sys.executable, "-c", SCRIPT], cwd=root)
+    timing, imported = out.decode().split("\n")[:2]
+    return float(timing), imported.split()
+
+
+def run(repeat=5):
+    timings = []
+    for _ in range(repeat):
+        timing, imported = measure()
+        timings.append(timing)
+    return min(timings), imported
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max", type=float, default=None,
+                        help="fail if importing takes longer than this many seconds")
+    args = parser.parse_args(args)
+
+    best, imported = run(args.repeat)
+    print("import openpyxl: {0:.3f}s".format(best))
+    failed = False
+    if imported:
+        print("imported up front: {0}".format(", ".join(imported)))
+        failed = True
+    if args.max is not None and best > args.max:
+        print("slower than {0:.3f}s".format(args.max))
+        failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Things to time. Each scenario is given the path of a workbook created by one
+of the generators and does any preparation which should not be timed. It
+returns a function which does the work being measured.
+"""
+
+from io import BytesIO
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font, PatternFill
+
+
+def load(path):
+    """
+    Load a workbook
+    """
+    return lambda: load_workbook(path)
+
+
+def load_read_only(path):
+    """
+    Read all the values in a worksheet in read-only mode
+    """
+
+    def run():
+        wb = load_workbook(path, read_only=True)
+        for row in wb.active.iter_rows(values_only=True):
+            pass
+        wb.close()
+
+    return run
+
+
+def load_data_only(path):
+    """
+    Load a workbook with the values of formulae rather than the formulae
+    """
+    return lambda: load_workbook(path, data_only=True)
+
+
+def iter_rows(path):
+    """
+    Visit every cell in a loaded worksheet
+    """
+    ws = load_workbook(path).active
+
+    def run():
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.value
+
+    return run
+
+
+def save(path):
+    """
+    Save a loaded workbook
+    """
+    wb = load_workbook(path)
+    return lambda: wb.save(BytesIO())
+
+
+def save_write_only(path):
+    """
+    Write the values of a worksheet to a new workbook in write-only mode
+    """
+    wb = load_workbook(path, read_only=True)
+    rows = list(wb.active.iter_rows(values_only=True))
+    wb.close()
+
+    def run():
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        for row in rows:
+            ws.append(row)
+        wb.save(BytesIO())
+
+    return run
+
+
+def insert_rows(path):
+    """
+    Insert rows near the top of a worksheet, which moves all the cells below
+    """
+    ws = load_workbook(path).active
+
+    def run():
+        for idx in range(5):
+            ws.insert_rows(2, 10)
+
+    return run
+
+
+def apply_style(path):
+    """
+    Style every cell in a worksheet
+    """
+    ws = load_workbook(path).active
+    font = Font(name="Arial", b=True)
+    fill = PatternFill("solid", fgColor="CCCCFF")
+
+    def run():
+        ws.apply_style(ws.dimensions, font=font, fill=fill, number_format="0.00")
+
+    return run
+
+
+def clone(path):
+    """
+    Clone a loaded workbook and change a cell in every worksheet
+    """
+    wb = load_workbook(path)
+
+    def run():
+        cp = wb.clone()
+        for ws in cp.worksheets:
+            ws["A1"] = "Report"
+
+    return run
+
+
+SCENARIOS = {
+    "load": load,
+    "load_read_only": load_read_only,
+    "load_data_only": load_data_only,
+    "iter_rows": iter_rows,
+    "save": save,
+    "save_write_only": save_write_only,
+    "insert_rows": insert_rows,
+    "apply_style": apply_style,
+    "clone": clone,
+}
@@ -0,0 +1,74 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Load a workbook with a very large stylesheet, as created by some
+generators: many cell styles, duplicate fonts and a few custom number
+formats shared by all of them.
+"""
+
+import argparse
+from io import BytesIO
+from timeit import default_timer
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils.indexed_list import IndexedList
+
+
+FORMATS = ["0.000", "#,##0.0000", "yyyy-mm-dd hh:mm", "0.0%", "[Red]0.00"]
+
+
+def make_workbook(xfs=60000, fonts=2000, rows=100):
+    """
+    Create a workbook with `xfs` cell styles and `fonts` fonts, which are
+    all the same, and a small worksheet using a few of the styles
+    """
+    wb = Workbook()
+    wb._fonts = IndexedList(list(wb._fonts) + [Font(name="Arial", sz=10)] * fonts)
+    for fmt in FORMATS:
+        wb._number_formats.add(fmt)
+
+    styles = list(wb._cell_styles)
+    for idx in range(xfs):
+        font = 1 + idx % fonts
+        fmt = 164 + idx % len(FORMATS)
+        styles.append(StyleArray([font, 0, 0, fmt, 0, 0, 0, 0, 0]))
+    wb._cell_styles = IndexedList(styles)
+
+    ws = wb.active
+    for row in range(1, rows+1):
+        for col in range(1, 11):
+            cell = ws.cell(row=row, column=col, value=row * col)
+            cell._style = StyleArray(wb._cell_styles[row * col])
+
+    out = BytesIO()
+    wb.save(out)
+    return out
+
+
+def run(xfs=60000, fonts=2000, repeat=3):
+    src = make_workbook(xfs, fonts)
+    timings = []
+    for _ in range(repeat):
+        src.seek(0)
+        start = default_timer()
+        load_workbook(src)
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--xfs", type=int, default=60000, help="number of cell styles")
+    parser.add_argument("--fonts", type=int, default=2000, help="number of fonts")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(args)
+
+    best = run(args.xfs, args.fonts, args.repeat)
+    print("load_workbook with {0} styles and {1} fonts: {2:.2f}s".format(
+        args.xfs, args.fonts, best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Run each scenario against synthetic workbooks of each kind and report the
+time taken, the peak memory use and the number of cells handled per second.
+
+Results can be saved and used as a baseline for later runs, which then
+fail if a scenario has become slower than the baseline allows.
+
+    python -m openpyxl.benchmarks --save baseline.json
+    python -m openpyxl.benchmarks --baseline baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from timeit import default_timer
+
+from .generators import GENERATORS, make_workbook
+from .scenarios import SCENARIOS
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+
+def peak_rss():
+    """
+    Largest amount of memory, in bytes, used by the process so far.
+    None if this cannot be determined.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        rss *= 1024 # reported in kilobytes
+    return rss
+
+
+def measure(scenario, path, cells, repeat=3):
+    """
+    Best time of several runs of a scenario, after one run which is not
+    timed so that modules imported on first use are not counted.
+    Peak memory use includes any preparation and is only meaningful when
+    each measurement is made in a new process.
+    """
+    SCENARIOS[scenario](path)()
+    timings = []
+    for _ in range(repeat):
+        fn = SCENARIOS[scenario](path)
+        start = default_timer()
+        fn()
+        timings.append(default_timer() - start)
+    best = min(timings)
+    return {
+        "time": best,
+        "rss": peak_rss(),
+        "cells_per_sec": best and cells / best or None,
+    }
+
+
+def _measure(task):
+    return measure(*task)
+
+
+def run(kinds, scenarios, rows, cols, repeat=3, isolated=True):
+    """
+    Measure each scenario for each kind of worksheet.
+    Returns a dictionary of results keyed by "kind/scenario".
+    Unless `isolated` is False each measurement is made in a new process so
+    that peak memory use is not affected by earlier ones.
+    """
+    results = {}
+    cells = rows * cols
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            path = os.path.join(tmp, "{0}.xlsx".format(kind))
+            make_workbook(kind, rows, cols).save(path)
+            for scenario in scenarios:
+                task = (scenario, path, cells, repeat)
+                if isolated:
+                    ctx = multiprocessing.get_context("spawn")
+                    with ctx.Pool(1, maxtasksperchild=1) as pool:
+                        result = pool.apply(_measure, (task,))
+                else:
+                    result = _measure(task)
+                results["{0}/{1}".format(kind, scenario)] = result
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Results which are slower than in the baseline by more than `tolerance`,
+    as a dictionary of the relative change keyed by "kind/scenario"
+    """
+    regressions = {}
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or not base["time"]:
+            continue
+        change = result["time"] / base["time"] - 1
+        if change > tolerance:
+            regressions[key] = change
+    return regressions
+
+
+def report(results, baseline=None, out=sys.stdout):
+    baseline = baseline or {}
+    line = "{0:<32} {1:>10} {2:>10} {3:>14} {4:>9}\n"
+    out.write(line.format("", "time (s)", "rss (MB)", "cells/sec", "change"))
+    for key, result in sorted(results.items()):
+        rss = result["rss"] and "{0:.1f}".format(result["rss"] / 2**20) or "-"
+        speed = result["cells_per_sec"] and "{0:,.0f}".format(result["cells_per_sec"]) or "-"
+        change = ""
+        base = baseline.get(key)
+        if base and base["time"]:
+            change = "{0:+.0%}".format(result["time"] / base["time"] - 1)
+        out.write(line.format(key, "{0:.3f}".format(result["time"]), rss, speed, change))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="python -m openpyxl.benchmarks",
+                                     description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--kinds", nargs="+", choices=sorted(GENERATORS),
+                        default=sorted(GENERATORS))
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS),
+                        default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", help="JSON file of earlier results to compare with")
+    parser.add_argument("--save", help="save the results as JSON to this file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="how much slower than the baseline a scenario may be")
+    parser.add_argument("--in-process", action="store_true",
+                        help="do not use a new process for each measurement")
+    args = parser.parse_args(args)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as src:
+            data = json.load(src)
+        size = (data.get("rows"), data.get("cols"))
+        if size != (args.rows, args.cols):
+            # timings of workbooks of different sizes cannot be compared
+            parser.error("the baseline was made with --rows {0} --cols {1}".format(*size))
+        baseline = data["results"]
+
+    results = run(args.kinds, args.scenarios, args.rows, args.cols,
+                  repeat=args.repeat, isolated=not args.in_process)
+    report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as dst:
+            json.dump({"rows": args.rows, "cols": args.cols, "results": results},
+                      dst, indent=2, sort_keys=True)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for key, change in sorted(regressions.items()):
+            print("{0} is {1:.0%} slower than the baseline".format(key, change))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2010-2019 openpyxl
+
+import json
+
+import pytest
+
+from ..generators import GENERATORS, make_workbook
+from ..scenarios import SCENARIOS
+
+
+@pytest.mark.parametrize("kind", sorted(GENERATORS))
+def test_generators(kind):
+    wb = make_workbook(kind, 6, 3)
+    ws = wb.active
+    assert ws.max_row == 6
+    assert ws.max_column == 3
+
+
+def test_deterministic():
+    ws1 = make_workbook("strings", 5, 4).active
+    ws2 = make_workbook("strings", 5, 4).active
+    assert list(ws1.values) == list(ws2.values)
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_scenarios(scenario, tmpdir):
+    path = str(tmpdir.join("styled.xlsx"))
+    make_workbook("styled", 5, 3).save(path)
+    SCENARIOS[scenario](path)()
+
+
+def test_run():
+    from ..suite import run
+    results = run(["numeric"], ["load", "save"], 5, 3, repeat=1, isolated=False)
+    assert sorted(results) == ["numeric/load", "numeric/save"]
+    result = results["numeric/load"]
+    assert result["time"] > 0
+    assert result["cells_per_sec"] == 15 / result["time"]
+
+
+def test_compare():
+    from ..suite import compare
+    baseline = {
+        "numeric/load": {"time": 1.0},
+        "numeric/save": {"time": 1.0},
+    }
+    results = {
+        "numeric/load": {"time": 1.5},
+        "numeric/save": {"time": 1.1},
+        "strings/load": {"time": 5.0},
+    }
+    assert compare(results, baseline, tolerance=0.2) == {"numeric/load": 0.5}
+
+
+def test_main(tmpdir):
+    from ..suite import main
+    saved = str(tmpdir.join("baseline.json"))
+    args = ["--rows", "5", "--cols", "2", "--repeat", "1", "--kinds", "numeric",
+            "--scenarios", "load", "--in-process"]
+    main(args + ["--save", saved])
+    with open(saved) as src:
+        data = json.load(src)
+    assert list(data["results"]) == ["numeric/load"]
+
+    # a baseline which cannot be matched
+    data["results"]["numeric/load"]["time"] = 1e-9
+    with open(saved, "w") as dst:
+        json.dump(data, dst)
+    with pytest.raises(SystemExit):
+        main(args + ["--baseline", saved])
+
+
+def test_baseline_size(tmpdir, capsys):
+    from ..suite import main
+    saved = str(tmpdir.join("baseline.json"))
+    with open(saved, "w") as dst:
+        json.dump({"rows": 5, "cols": 2, "results": {}}, dst)
+    with pytest.raises(SystemExit):
+        main(["--rows", "10", "--cols", "2", "--baseline", saved])
+    assert "--rows 5 --cols 2" in capsys.readouterr().err
@@ -10,10 +10,13 @@ from datetime import timedelta
 def _set_attributes(cell, styled=None):
     """
     Set coordinate and datatype
+    `styled` can also be the id of the style to use, if this is known
     """
     coordinate = cell.coordinate
     attrs = {'r': coordinate}
-    if styled:
+    if isinstance(styled, str):
+        attrs['s'] = styled
+    elif styled:
         attrs['s'] = f"{cell.style_id}"
 
     if cell.data_type == "s":
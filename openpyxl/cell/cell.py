@@ -20,6 +20,7 @@ from openpyxl.compat import (
     NUMERIC_TYPES,
     deprecated,
 )
+from openpyxl.compat.numbers import numeric_types
 
 from openpyxl.utils.exceptions import IllegalCharacterError
 
@@ -37,13 +38,6 @@ TIME_FORMATS = {
     datetime.time:numbers.FORMAT_DATE_TIME6,
     datetime.timedelta:numbers.FORMAT_DATE_TIMEDELTA,
                 }
-try:
-    from pandas import Timestamp
-    TIME_TYPES = TIME_TYPES + (Timestamp,)
-    TIME_FORMATS[Timestamp] = numbers.FORMAT_DATE_DATETIME
-except ImportError:
-    pass
-
 STRING_TYPES = (str, bytes)
 KNOWN_TYPES = NUMERIC_TYPES + TIME_TYPES + STRING_TYPES + (bool, type(None))
 
@@ -71,12 +65,16 @@ _TYPES = {int:'n', float:'n', str:'s', bool:'b'}
 
 
 def get_type(t, value):
-    if isinstance(value, NUMERIC_TYPES):
+    if isinstance(value, numeric_types()):
         dt = 'n'
     elif isinstance(value, STRING_TYPES):
         dt = 's'
     elif isinstance(value, TIME_TYPES):
         dt = 'd'
+        if t not in TIME_FORMATS:
+            # subclasses such as pandas.Timestamp
+            base = next(base for base in TIME_TYPES if issubclass(t, base))
+            TIME_FORMATS[t] = TIME_FORMATS[base]
     else:
         return
     _TYPES[t] = dt
@@ -220,6 +218,19 @@ class Cell(StyleableObject):
         """Always returns the value for excel."""
         return self._value
 
+
+    @property
+    def cached_value(self):
+        """
+        The value of a formula when the workbook was last calculated, if the
+        workbook was loaded with `cached_values=True`. It is not updated
+        when the formula is changed.
+        The value of any other cell.
+        """
+        if self.data_type != 'f':
+            return self._value
+        return self.parent._formula_values.get(self)
+
     @property
     def hyperlink(self):
         """Return the hyperlink target or an empty string"""
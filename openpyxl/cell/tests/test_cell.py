@@ -41,6 +41,7 @@ def DummyWorksheet():
         parent = Wb()
         title = "Dummy Worksheet"
         _comment_count = 0
+        _formula_values = {}
 
         def cell(self, column, row):
             return Cell(self, row=row, column=column)
@@ -95,6 +96,16 @@ def test_formula(dummy_cell, value):
     assert cell.data_type == 'f'
 
 
+def test_cached_value(dummy_cell):
+    cell = dummy_cell
+    cell.value = "=1+2"
+    assert cell.cached_value is None
+    cell.parent._formula_values[cell] = 3
+    assert cell.cached_value == 3
+    cell.value = 4
+    assert cell.cached_value == 4
+
+
 def test_not_formula(dummy_cell):
     dummy_cell.value = "="
     assert dummy_cell.data_type == 's'
@@ -147,6 +158,17 @@ def test_timstamp(dummy_cell):
     assert cell.number_format == "yyyy-mm-dd h:mm:ss"
 
 
+def test_datetime_subclass(dummy_cell):
+
+    class Stamp(datetime):
+        pass
+
+    cell = dummy_cell
+    cell.value = Stamp(2018, 9, 5)
+    assert cell.data_type == 'd'
+    assert cell.number_format == "yyyy-mm-dd h:mm:ss"
+
+
 def test_not_overwrite_time_format(dummy_cell):
     cell = dummy_cell
     cell.number_format = "mmm-yy"
@@ -0,0 +1,109 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Write the comments of a worksheet, and the VML shapes Excel needs to show
+them, directly to a stream without building a tree for them.
+"""
+
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import Element, whitespace, xmlfile
+
+from .shape_writer import vmlns, officens, excelns
+
+
+VML_HEADER = (
+    '<xml xmlns:v="{v}" xmlns:o="{o}" xmlns:x="{x}">'
+    '<o:shapelayout v:ext="edit"><o:idmap v:ext="edit" data="1"/></o:shapelayout>'
+    '<v:shapetype id="_x0000_t202" coordsize="21600,21600" o:spt="202" '
+    'path="m,l,21600r21600,l21600,xe">'
+    '<v:stroke joinstyle="miter"/>'
+    '<v:path gradientshapeok="t" o:connecttype="rect"/>'
+    '</v:shapetype>'
+).format(v=vmlns, o=officens, x=excelns)
+
+VML_SHAPE = (
+    '<v:shape id="_x0000_s{idx:04d}" type="#_x0000_t202" '
+    'style="position:absolute; margin-left:59.25pt;margin-top:1.5pt;'
+    'width:{width}px;height:{height}px;z-index:1;visibility:hidden" '
+    'fillcolor="#ffffe1" o:insetmode="auto">'
+    '<v:fill color2="#ffffe1"/>'
+    '<v:shadow color="black" obscured="t"/>'
+    '<v:path o:connecttype="none"/>'
+    '<v:textbox style="mso-direction-alt:auto"><div style="text-align:left"/></v:textbox>'
+    '<x:ClientData ObjectType="Note">'
+    '<x:MoveWithCells/><x:SizeWithCells/><x:AutoFill>False</x:AutoFill>'
+    '<x:Row>{row}</x:Row><x:Column>{column}</x:Column>'
+    '</x:ClientData>'
+    '</v:shape>'
+)
+
+VML_FOOTER = '</xml>'
+
+
+class CommentWriter:
+
+    """
+    Collects the comments of a worksheet while its rows are written.
+    Authors are interned as comments are added and only a reference to each
+    comment is kept.
+    """
+
+    def __init__(self):
+        self.authors = IndexedList()
+        self._comments = []
+
+
+    def add(self, cell):
+        comment = cell._comment
+        author_id = self.authors.add(comment.author)
+        self._comments.append((cell.row, cell.column, cell.coordinate, author_id, comment))
+
+
+    def __len__(self):
+        return len(self._comments)
+
+
+    def __iter__(self):
+        """
+        Coordinates and comments in the order they were added
+        """
+        for row, column, coord, author_id, comment in self._comments:
+            yield coord, comment
+
+
+    def write_comments(self, out):
+        """
+        Write the comments part to a file-like object
+        """
+        with xmlfile(out) as xf:
+            with xf.element("comments", xmlns=SHEET_MAIN_NS):
+
+                with xf.element("authors"):
+                    for author in self.authors:
+                        el = Element("author")
+                        el.text = author
+                        xf.write(el)
+
+                with xf.element("commentList"):
+                    for row, column, coord, author_id, comment in self._comments:
+                        attrs = {"ref":coord, "authorId":str(author_id), "shapeId":"0"}
+                        with xf.element("comment", attrs):
+                            with xf.element("text"):
+                                if comment.content is not None:
+                                    el = Element("t")
+                                    el.text = comment.content
+                                    whitespace(el)
+                                    xf.write(el)
+
+
+    def write_shapes(self, out):
+        """
+        Write the VML drawing for the comments to a binary file-like object
+        """
+        out.write(VML_HEADER.encode("utf-8"))
+        for idx, (row, column, coord, author_id, comment) in enumerate(self._comments, 1026):
+            shape = VML_SHAPE.format(idx=idx, row=row-1, column=column-1,
+                                     height=comment.height, width=comment.width)
+            out.write(shape.encode("utf-8"))
+        out.write(VML_FOOTER.encode("utf-8"))
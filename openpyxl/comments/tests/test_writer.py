@@ -0,0 +1,82 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import fromstring
+from openpyxl.tests.helper import compare_xml
+
+from ..comments import Comment
+from ..shape_writer import ShapeWriter
+
+
+@pytest.fixture
+def CommentWriter():
+    from .._writer import CommentWriter
+    return CommentWriter
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook()
+    ws = wb.active
+    ws["B2"].comment = Comment("text", "author")
+    ws["C7"].comment = Comment("text2", "author2")
+    ws["D9"].comment = Comment("text3", "author3")
+    ws["E1"].comment = Comment(" text4", "author")
+    return ws
+
+
+@pytest.fixture
+def writer(CommentWriter, ws):
+    writer = CommentWriter()
+    for coord in ["B2", "C7", "D9"]:
+        writer.add(ws[coord])
+    return writer
+
+
+class TestCommentWriter:
+
+
+    def test_add(self, writer):
+        assert len(writer) == 3
+        assert writer.authors == ["author", "author2", "author3"]
+
+
+    def test_add_same_author(self, writer, ws):
+        writer.add(ws["E1"])
+        assert len(writer) == 4
+        assert writer._comments[-1][3] == 0
+
+
+    def test_write_comments(self, writer, datadir):
+        datadir.chdir()
+        out = BytesIO()
+        writer.write_comments(out)
+
+        with open("comments_out.xml") as src:
+            expected = src.read()
+        diff = compare_xml(out.getvalue(), expected)
+        assert diff is None, diff
+
+
+    def test_preserve_whitespace(self, writer, ws):
+        writer.add(ws["E1"])
+        out = BytesIO()
+        writer.write_comments(out)
+        tree = fromstring(out.getvalue())
+        t = tree.findall(".//{%s}t" % SHEET_MAIN_NS)[-1]
+        assert t.text == " text4"
+        assert t.get("{http://www.w3.org/XML/1998/namespace}space") == "preserve"
+
+
+    def test_write_shapes(self, writer):
+        out = BytesIO()
+        writer.write_shapes(out)
+
+        expected = ShapeWriter(writer).write(None)
+        diff = compare_xml(out.getvalue(), expected)
+        assert diff is None, diff
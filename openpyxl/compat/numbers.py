@@ -1,51 +1,43 @@
 # Copyright (c) 2010-2019 openpyxl
 
+"""
+Numeric types, including those of numpy if it is used.
+
+numpy and pandas are not imported by openpyxl: there can be no values of
+their types until they have been imported by something else.
+"""
+
 from decimal import Decimal
+from importlib.util import find_spec
+import sys
 
 NUMERIC_TYPES = (int, float, Decimal)
 
+_NUMPY_TYPES = ("short", "ushort", "intc", "uintc", "int_", "uint",
+                "longlong", "ulonglong", "half", "float16", "single", "double",
+                "longdouble", "int8", "int16", "int32", "int64", "uint8",
+                "uint16", "uint32", "uint64", "intp", "uintp", "float32",
+                "float64", "bool_", "floating", "integer")
+
+_numeric_types = None
+
+
+def numeric_types():
+    """
+    Types of numbers, including numpy's once it has been imported
+    """
+    global _numeric_types
+    if _numeric_types is not None:
+        return _numeric_types
+
+    numpy = sys.modules.get("numpy")
+    if numpy is None or not hasattr(numpy, "integer"): # not (fully) imported
+        return NUMERIC_TYPES
+    _numeric_types = NUMERIC_TYPES + tuple(getattr(numpy, name) for name in _NUMPY_TYPES
+                                           if hasattr(numpy, name))
+    return _numeric_types
+
 
-try:
-    import numpy
-    NUMPY = True
-except ImportError:
-    NUMPY = False
-
-
-if NUMPY:
-    NUMERIC_TYPES = NUMERIC_TYPES + (numpy.short,
-                                     numpy.ushort,
-                                     numpy.intc,
-                                     numpy.uintc,
-                                     numpy.int_,
-                                     numpy.uint,
-                                     numpy.longlong,
-                                     numpy.ulonglong,
-                                     numpy.half,
-                                     numpy.float16,
-                                     numpy.single,
-                                     numpy.double,
-                                     numpy.longdouble,
-                                     numpy.int8,
-                                     numpy.int16,
-                                     numpy.int32,
-                                     numpy.int64,
-                                     numpy.uint8,
-                                     numpy.uint16,
-                                     numpy.uint32,
-                                     numpy.uint64,
-                                     numpy.intp,
-                                     numpy.uintp,
-                                     numpy.float32,
-                                     numpy.float64,
-                                     numpy.float,
-                                     numpy.bool_,
-                                     numpy.floating,
-                                     numpy.integer)
-
-
-try:
-    import pandas
-    PANDAS = True
-except ImportError:
-    PANDAS = False
+# numpy and pandas are looked for without being imported
+NUMPY = find_spec("numpy") is not None
+PANDAS = find_spec("pandas") is not None
@@ -6,20 +6,27 @@ import sys
 
 VER = sys.version_info
 
-from .numbers import NUMERIC_TYPES
+from .numbers import NUMERIC_TYPES, numeric_types
+
+
+def _format_number(value):
+    if isnan(value) or isinf(value):
+        return ""
+    return "%.16g" % value
 
 
 def safe_string(value):
     """Safely and consistently format numeric values"""
     if isinstance(value, NUMERIC_TYPES):
-        if isnan(value) or isinf(value):
-            value = ""
-        else:
-            value = "%.16g" % value
+        value = _format_number(value)
     elif value is None:
         value = "none"
     elif isinstance(value, datetime):
         value = value.isoformat()
-    elif not isinstance(value, str):
+    elif isinstance(value, str):
+        pass
+    elif isinstance(value, numeric_types()):
+        value = _format_number(value)
+    else:
         value = str(value)
     return value
@@ -22,39 +22,20 @@ def test_safe_string(value, result):
 
 @pytest.mark.numpy_required
 def test_numeric_types():
-    from ..numbers import NUMERIC_TYPES, numpy, Decimal
-    assert NUMERIC_TYPES == (int,
-                             float,
-                             Decimal,
-                             numpy.short,
-                             numpy.ushort,
-                             numpy.intc,
-                             numpy.uintc,
-                             numpy.int_,
-                             numpy.uint,
-                             numpy.longlong,
-                             numpy.ulonglong,
-                             numpy.half,
-                             numpy.float16,
-                             numpy.single,
-                             numpy.double,
-                             numpy.longdouble,
-                             numpy.int8,
-                             numpy.int16,
-                             numpy.int32,
-                             numpy.int64,
-                             numpy.uint8,
-                             numpy.uint16,
-                             numpy.uint32,
-                             numpy.uint64,
-                             numpy.intp,
-                             numpy.uintp,
-                             numpy.float32,
-                             numpy.float64,
-                             numpy.float,
-                             numpy.bool_,
-                             numpy.floating,
-                             numpy.integer)
+    import numpy
+    from ..numbers import numeric_types, Decimal
+    types = numeric_types()
+    assert types[:3] == (int, float, Decimal)
+    for t in (numpy.short, numpy.int64, numpy.uint8, numpy.float32,
+              numpy.float64, numpy.bool_, numpy.floating, numpy.integer):
+        assert t in types
+
+
+def test_numeric_types_without_numpy():
+    import sys
+    from ..numbers import numeric_types, NUMERIC_TYPES
+    if "numpy" not in sys.modules:
+        assert numeric_types() == NUMERIC_TYPES
 
 
 @pytest.mark.numpy_required
@@ -1,12 +1,16 @@
 # Copyright (c) 2010-2019 openpyxl
 
 from io import BytesIO
+import struct
 
 try:
     from PIL import Image as PILImage
 except ImportError:
     PILImage = False
 
+# enough for the header of an image unless it is a JPEG with a lot of metadata
+HEADER_SIZE = 2**16
+
 
 def _import_image(img):
     if not PILImage:
@@ -18,12 +22,52 @@ def _import_image(img):
     return img
 
 
+def _image_info(data):
+    """
+    Read the format and size of an image from its header.
+    Only formats which are written unchanged are recognised.
+    Returns None for any other format.
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", data[16:24])
+        return "png", width, height
+
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        width, height = struct.unpack("<HH", data[6:10])
+        return "gif", width, height
+
+    if data[:2] == b"\xff\xd8":
+        pos = 2
+        while pos + 9 < len(data):
+            if data[pos] != 0xFF:
+                return
+            marker = data[pos+1]
+            if marker == 0xFF: # padding
+                pos += 1
+                continue
+            if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7: # no length
+                pos += 2
+                continue
+            size = struct.unpack(">H", data[pos+2:pos+4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[pos+5:pos+9])
+                return "jpeg", width, height
+            pos += 2 + size
+        return
+
+    if data[:4] == b"\x01\x00\x00\x00" and data[40:44] == b" EMF":
+        x0, y0, x1, y1 = struct.unpack("<iiii", data[8:24])
+        return "emf", x1 - x0, y1 - y0
+
+
 class Image(object):
     """Image in a spreadsheet"""
 
     _id = 1
     _path = "/xl/media/image{0}.{1}"
     anchor = "A1"
+    _ref = None
+    _src = None
 
     def __init__(self, img):
 
@@ -41,10 +85,49 @@ class Image(object):
             image.close()
 
 
+    @classmethod
+    def _from_member(cls, member):
+        """
+        Create an image from an archive member without decoding it.
+        Returns None if the format is not recognised.
+        """
+        data = member.head(HEADER_SIZE)
+        info = _image_info(data)
+        if info is None and data[:2] == b"\xff\xd8" and len(data) == HEADER_SIZE:
+            # the size of a JPEG follows its metadata
+            info = _image_info(member.read())
+        if info is None:
+            return
+        self = cls.__new__(cls)
+        self.format, self.width, self.height = info
+        self._src = member
+        return self
+
+
+    @property
+    def ref(self):
+        """
+        The source of the image. Images read from a file are only decoded
+        when this is used.
+        """
+        if self._src is not None and self._ref is None:
+            self._ref = BytesIO(self._src.read())
+        return self._ref
+
+
+    @ref.setter
+    def ref(self, value):
+        self._ref = value
+        self._src = None
+
+
     def _data(self):
         """
         Return image data, convert to supported types if necessary
         """
+        if self._src is not None:
+            return self._src.read()
+
         img = _import_image(self.ref)
         # don't convert these file formats
         if self.format in ['gif', 'jpeg', 'png']:
@@ -26,7 +26,7 @@ from openpyxl.utils.units import (
 )
 from openpyxl.drawing.image import Image
 
-from openpyxl.xml.constants import SHEET_DRAWING_NS
+from openpyxl.xml.constants import SHEET_DRAWING_NS, DRAWING_REL_NS
 
 from openpyxl.chart._chart import ChartBase
 from .xdr import (
@@ -237,7 +237,7 @@ class SpreadsheetDrawing(Serialisable):
 
     tagname = "wsDr"
     mime_type = "application/vnd.openxmlformats-officedocument.drawing+xml"
-    _rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/drawing"
+    _rel_type = DRAWING_REL_NS
     _path = PartName="/xl/drawings/drawing{0}.xml"
     _id = None
 
@@ -57,3 +57,71 @@ class TestImage:
         datadir.chdir()
         img = Image("plain.tif")
         assert img._data()[:10] == b'\x89PNG\r\n\x1a\n\x00\x00'
+
+
+    def test_from_member(self, Image, datadir):
+        from zipfile import ZipFile
+        from io import BytesIO
+        from openpyxl.packaging._parts import RawMember
+        datadir.chdir()
+        with open("plain.png", "rb") as src:
+            data = src.read()
+        out = BytesIO()
+        archive = ZipFile(out, "w")
+        archive.writestr("xl/media/image1.png", data)
+        member = RawMember.from_archive(archive, "xl/media/image1.png")
+
+        img = Image._from_member(member)
+        assert (img.format, img.width, img.height) == ("png", 118, 118)
+        assert img._data() == data
+        assert img.ref.read() == data
+        assert img._src is member
+
+
+    def test_from_member_unknown(self, Image, datadir):
+        from openpyxl.packaging._parts import RawMember
+        datadir.chdir()
+        with open("plain.tif", "rb") as src:
+            member = RawMember(None, src.read(), raw=False)
+        assert Image._from_member(member) is None
+
+
+    def test_from_member_header(self, Image, datadir):
+        from openpyxl.packaging._parts import RawMember
+        datadir.chdir()
+        with open("plain.png", "rb") as src:
+            member = RawMember(None, src.read(), raw=False)
+        member.read = None # only the header is used
+        img = Image._from_member(member)
+        assert (img.width, img.height) == (118, 118)
+
+
+    def test_from_member_metadata(self, Image):
+        from openpyxl.packaging._parts import RawMember
+        from ..image import HEADER_SIZE
+        app = b"\xff\xe1\xff\xff" + b"\x00" * 0xFFFD
+        sof = b"\xff\xc0\x00\x11\x08\x00\x20\x00\x10\x03"
+        data = b"\xff\xd8" + app + app + sof + b"\x00" * 16
+        assert len(data) > HEADER_SIZE
+        member = RawMember(None, data, raw=False)
+        img = Image._from_member(member)
+        assert (img.format, img.width, img.height) == ("jpeg", 16, 32)
+
+
+@pytest.mark.parametrize("data, info",
+                         [
+                             (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x23\x00\x00\x01\x00",
+                              ("png", 35, 256)),
+                             (b"GIF89a\x10\x00\x20\x00", ("gif", 16, 32)),
+                             (b"\xff\xd8\xff\xe0\x00\x04\x00\x00\xff\xc0\x00\x11\x08\x00\x20\x00\x10\x03",
+                              ("jpeg", 16, 32)),
+                             (b"\x01\x00\x00\x00" + b"\x00" * 4
+                              + b"\x00\x00\x00\x00\x00\x00\x00\x00\x64\x00\x00\x00\x32\x00\x00\x00"
+                              + b"\x00" * 16 + b" EMF", ("emf", 100, 50)),
+                             (b"\x01\x00\t\x00\x00\x03", None),
+                             (b"", None),
+                         ]
+                         )
+def test_image_info(data, info):
+    from ..image import _image_info
+    assert _image_info(data) == info
@@ -14,7 +14,7 @@ from openpyxl.descriptors.serialisable import Serialisable
 
 from .rule import Rule
 
-from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.cell_range import MultiCellRange, _SqrefIndex
 
 class ConditionalFormatting(Serialisable):
 
@@ -61,6 +61,7 @@ class ConditionalFormattingList(object):
     def __init__(self):
         self._cf_rules = OrderedDict()
         self.max_priority = 0
+        self._index = _SqrefIndex()
 
 
     def add(self, range_string, cfRule):
@@ -79,6 +80,7 @@ class ConditionalFormattingList(object):
             rule.priority = self.max_priority
 
         self._cf_rules.setdefault(cf, []).append(rule)
+        self._index.changed()
 
 
     def __bool__(self):
@@ -97,6 +99,27 @@ class ConditionalFormattingList(object):
             yield cf
 
 
+    def rules_for(self, cell):
+        """
+        Return the conditional formats which apply to a cell
+        """
+        return self._find(cell)
+
+
+    def rules_in(self, cell_range):
+        """
+        Return the conditional formats which apply to any cell in a range
+        """
+        return self._find(cell_range)
+
+
+    def _find(self, coord):
+        found = self._index.find(self._cf_rules, coord)
+        for cf in found:
+            cf.rules = self._cf_rules[cf]
+        return found
+
+
     def __getitem__(self, key):
         """
         Get the rules for a cell range
@@ -109,6 +132,7 @@ class ConditionalFormattingList(object):
     def __delitem__(self, key):
         key = ConditionalFormatting(sqref=key)
         del self._cf_rules[key]
+        self._index.changed()
 
 
     def __setitem__(self, key, rule):
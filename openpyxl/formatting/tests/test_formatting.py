@@ -200,3 +200,40 @@ class TestConditionalFormatting:
     def test_contains(self, ConditionalFormatting):
         c2 = ConditionalFormatting("A1:A5 B1:B5")
         assert "B2" in c2
+
+
+class TestConditionalFormattingList:
+
+
+    def test_rules_for(self):
+        cfs = ConditionalFormattingList()
+        cfs.add("A1:B10", CellIsRule(operator="equal", formula=["1"]))
+        cfs.add("B5:D5 F1", CellIsRule(operator="equal", formula=["2"]))
+        found = cfs.rules_for("B5")
+        assert [str(cf.sqref) for cf in found] == ["A1:B10", "B5:D5 F1"]
+        assert found[0].rules[0].formula == ["1"]
+        assert cfs.rules_for("F2") == []
+
+
+    def test_rules_in(self):
+        cfs = ConditionalFormattingList()
+        cfs.add("A1:A10", CellIsRule(operator="equal", formula=["1"]))
+        cfs.add("C1:C10", CellIsRule(operator="equal", formula=["2"]))
+        found = cfs.rules_in("B1:C2")
+        assert [str(cf.sqref) for cf in found] == ["C1:C10"]
+
+
+    def test_rules_after_add(self):
+        cfs = ConditionalFormattingList()
+        cfs.add("A1", CellIsRule(operator="equal", formula=["1"]))
+        assert cfs.rules_for("B2") == []
+        cfs.add("B2", CellIsRule(operator="equal", formula=["2"]))
+        assert [str(cf.sqref) for cf in cfs.rules_for("B2")] == ["B2"]
+
+
+    def test_rules_after_delete(self):
+        cfs = ConditionalFormattingList()
+        cfs.add("A1:A10", CellIsRule(operator="equal", formula=["1"]))
+        assert len(cfs.rules_for("A1")) == 1
+        del cfs["A1:A10"]
+        assert cfs.rules_for("A1") == []
@@ -0,0 +1,286 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Copy parts of a package, and everything they depend upon, from one archive
+to another without parsing them.
+"""
+
+import posixpath
+import struct
+import zlib
+from itertools import count
+from zipfile import (
+    ZipInfo,
+    ZIP_STORED,
+    ZIP_DEFLATED,
+    ZIP64_LIMIT,
+    sizeFileHeader,
+    stringFileHeader,
+)
+
+from openpyxl.xml.functions import tostring
+
+from .manifest import Override
+from .relationship import (
+    Relationship,
+    RelationshipList,
+    get_dependents,
+    get_rels_path,
+)
+
+
+# ZipFile has no public API for copying members as they are stored so its
+# internals are used when they are available. Otherwise members are
+# decompressed and compressed again.
+_READ_INTERNALS = ("_lock", "fp")
+_WRITE_INTERNALS = ("_lock", "fp", "_writing", "_seekable", "start_dir",
+                    "_writecheck", "_didModify", "filelist", "NameToInfo")
+
+
+def _has_internals(archive, names):
+    return all(hasattr(archive, name) for name in names)
+
+
+class RawMember:
+
+    """
+    An archive member as it is stored, usually compressed. It can be copied
+    to another archive without being decompressed and compressed again.
+    Members which are encrypted or use other kinds of compression are kept
+    decompressed, as are all members if the raw data cannot be read.
+    """
+
+    def __init__(self, info, data, raw=True):
+        self.info = info
+        self.data = data
+        self.raw = raw
+
+
+    @classmethod
+    def from_archive(cls, archive, name):
+        info = archive.getinfo(name)
+        if (info.flag_bits & 0x1
+            or info.compress_type not in (ZIP_STORED, ZIP_DEFLATED)
+            or not _has_internals(archive, _READ_INTERNALS)):
+            return cls(info, archive.read(name), raw=False)
+
+        with archive._lock:
+            fp = archive.fp
+            fp.seek(info.header_offset)
+            header = fp.read(sizeFileHeader)
+            if header[:4] != stringFileHeader:
+                data = None
+            else:
+                name_length, extra_length = struct.unpack("<HH", header[26:30])
+                fp.seek(info.header_offset + sizeFileHeader + name_length + extra_length)
+                data = fp.read(info.compress_size)
+        if data is None:
+            return cls(info, archive.read(name), raw=False)
+        return cls(info, data)
+
+
+    def read(self):
+        """
+        Decompressed contents
+        """
+        if not self.raw or self.info.compress_type == ZIP_STORED:
+            return self.data
+        return zlib.decompress(self.data, -15)
+
+
+    def head(self, size):
+        """
+        The first `size` bytes of the decompressed contents. Only as much
+        as is needed is decompressed.
+        """
+        if not self.raw or self.info.compress_type == ZIP_STORED:
+            return self.data[:size]
+        return zlib.decompressobj(-15).decompress(self.data, size)
+
+
+    def write(self, archive, name):
+        """
+        Add the member to an archive under `name`
+        """
+        if not self.raw:
+            archive.writestr(name, self.data)
+            return
+
+        src = self.info
+        zinfo = ZipInfo(name, date_time=src.date_time)
+        zinfo.compress_type = src.compress_type
+        zinfo.external_attr = src.external_attr or 0o600 << 16
+        zinfo.CRC = src.CRC
+        zinfo.compress_size = src.compress_size
+        zinfo.file_size = src.file_size
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > ZIP64_LIMIT
+
+        if not _has_internals(archive, _WRITE_INTERNALS):
+            archive.writestr(zinfo, self.read())
+            return
+
+        # mirrors ZipFile.writestr but the data is already compressed
+        with archive._lock:
+            if archive._writing:
+                raise ValueError("Can't write to the ZIP file while there is another write handle open on it.")
+            if archive._seekable:
+                archive.fp.seek(archive.start_dir)
+            zinfo.header_offset = archive.fp.tell()
+            archive._writecheck(zinfo)
+            archive._didModify = True
+            archive.fp.write(zinfo.FileHeader(zip64))
+            archive.fp.write(self.data)
+            archive.filelist.append(zinfo)
+            archive.NameToInfo[name] = zinfo
+            archive.start_dir = archive.fp.tell()
+
+
+class PartSet:
+
+    """
+    A part of a package together with all the parts it refers to, directly
+    or indirectly. Parts are written back unchanged. Only the relationships
+    are rewritten because parts may have to be renamed.
+
+    Parts are either kept as they are stored in the archive or, if the
+    archive stays open, read from it when they are needed. Either way they
+    are not decompressed unless their contents are needed.
+    """
+
+    def __init__(self, path, archive=None):
+        self.path = path
+        self.archive = archive
+        self.data = {}
+        self.rels = {}
+        self.content_types = {}
+
+
+    @classmethod
+    def from_archive(cls, archive, path, manifest, cache=None, lazy=False):
+        """
+        Collect a part and its dependents from an archive.
+        `cache` can be shared between calls so that parts used by more than
+        one part are only read once.
+        If `lazy` is True parts are read from the archive when written.
+        """
+        if cache is None:
+            cache = {}
+        names = set(archive.namelist())
+        overrides = {o.PartName[1:]:o.ContentType for o in manifest.Override}
+        defaults = {d.Extension.lower():d.ContentType for d in manifest.Default}
+
+        parts = cls(path, lazy and archive or None)
+        todo = [path]
+        while todo:
+            name = todo.pop()
+            if name in parts.data or name not in names:
+                continue
+            if lazy:
+                parts.data[name] = None
+            else:
+                if name not in cache:
+                    cache[name] = RawMember.from_archive(archive, name)
+                parts.data[name] = cache[name]
+
+            ext = posixpath.splitext(name)[-1][1:].lower()
+            ct = overrides.get(name, defaults.get(ext))
+            if ct is not None:
+                parts.content_types[name] = ct
+
+            rels_path = get_rels_path(name)
+            if rels_path in names:
+                rels = get_dependents(archive, rels_path)
+                parts.rels[name] = rels
+                for r in rels.Relationship:
+                    if r.TargetMode != "External":
+                        todo.append(r.target)
+        return parts
+
+
+    def member(self, name):
+        member = self.data[name]
+        if member is None:
+            member = RawMember.from_archive(self.archive, name)
+        return member
+
+
+    def read(self, name):
+        """
+        Contents of a part
+        """
+        return self.member(name).read()
+
+
+    def find(self, content_type):
+        """
+        Paths of the parts of a particular content type
+        """
+        for name, ct in self.content_types.items():
+            if ct == content_type:
+                yield name
+
+
+    def write(self, archive, manifest, path, written=None):
+        """
+        Write the part to `path` and its dependents under their own names,
+        unless these are already in use.
+        `written` maps source paths to those in the archive and can be shared
+        between calls so that common dependents are only written once.
+        """
+        if written is None:
+            written = {}
+        taken = set(archive.namelist())
+        taken.add(path)
+
+        names = {}
+        for name in self.data:
+            if name == self.path:
+                names[name] = path
+            elif name in written:
+                names[name] = written[name]
+            else:
+                names[name] = _unique_name(name, taken)
+                taken.add(names[name])
+
+        for name in self.data:
+            target = names[name]
+            if name != self.path:
+                if name in written:
+                    continue
+                written[name] = target
+            self.member(name).write(archive, target)
+
+            ct = self.content_types.get(name)
+            if ct is not None:
+                manifest.Override.append(Override("/" + target, ct))
+
+            rels = self.rels.get(name)
+            if rels:
+                archive.writestr(get_rels_path(target), tostring(_relocate(rels, names).to_tree()))
+
+
+def _unique_name(name, taken):
+    """
+    Add a suffix to a name if it is already taken
+    """
+    if name not in taken:
+        return name
+    root, ext = posixpath.splitext(name)
+    for idx in count(1):
+        candidate = "{0}_{1}{2}".format(root, idx, ext)
+        if candidate not in taken:
+            return candidate
+
+
+def _relocate(rels, names):
+    """
+    Copy relationships pointing to the new names of the parts
+    """
+    relocated = RelationshipList()
+    for r in rels.Relationship:
+        target = r.Target
+        if r.TargetMode != "External":
+            target = "/" + names.get(target, target)
+        relocated.append(Relationship(Id=r.Id, Type=r.Type, Target=target,
+                                      TargetMode=r.TargetMode))
+    return relocated
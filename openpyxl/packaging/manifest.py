@@ -115,10 +115,12 @@ class Manifest(Serialisable):
     def extensions(self):
         """
         Map content types to file extensions
-        Skip parts without extensions
+        Skip parts without extensions or with extensions which are not
+        known, the Override is enough for these
         """
+        known = mimetypes.types_map[True]
         exts = {os.path.splitext(part.PartName)[-1] for part in self.Override}
-        return [(ext[1:], mimetypes.types_map[True][ext]) for ext in sorted(exts) if ext]
+        return [(ext[1:], known[ext]) for ext in sorted(exts) if ext in known]
 
 
     def to_tree(self):
@@ -186,11 +188,16 @@ class Manifest(Serialisable):
         """
         Make sure that the mime type for all file extensions is registered
         """
+        known = mimetypes.types_map[True]
+        overridden = set(o.PartName for o in self.Override)
         for fn in filenames:
             ext = os.path.splitext(fn)[-1]
             if not ext:
                 continue
-            mime = mimetypes.types_map[True][ext]
+            if ext not in known and "/" + fn in overridden:
+                # copied from the source with its own content type
+                continue
+            mime = known[ext]
             fe = FileExtension(ext[1:], mime)
             self.Default.append(fe)
 
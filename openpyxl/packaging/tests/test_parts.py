@@ -0,0 +1,178 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from openpyxl.xml.functions import tostring
+
+from ..manifest import Manifest, Override
+from ..relationship import Relationship, RelationshipList, get_dependents
+
+
+@pytest.fixture
+def RawMember():
+    from .._parts import RawMember
+    return RawMember
+
+
+class TestRawMember:
+
+    @pytest.mark.parametrize("compression", [ZIP_STORED, ZIP_DEFLATED])
+    def test_read(self, RawMember, compression):
+        src = ZipFile(BytesIO(), "w", compression)
+        src.writestr("xl/styles.xml", b"<styleSheet />" * 100)
+        member = RawMember.from_archive(src, "xl/styles.xml")
+        assert member.raw
+        assert len(member.data) == src.getinfo("xl/styles.xml").compress_size
+        assert member.read() == b"<styleSheet />" * 100
+
+
+    @pytest.mark.parametrize("compression", [ZIP_STORED, ZIP_DEFLATED])
+    def test_head(self, RawMember, compression):
+        src = ZipFile(BytesIO(), "w", compression)
+        src.writestr("xl/styles.xml", b"<styleSheet />" * 100)
+        member = RawMember.from_archive(src, "xl/styles.xml")
+        assert member.head(20) == b"<styleSheet /><style"
+        assert member.head(10000) == b"<styleSheet />" * 100
+
+
+    def test_write(self, RawMember):
+        src = ZipFile(BytesIO(), "w", ZIP_DEFLATED)
+        src.writestr("xl/styles.xml", b"<styleSheet />" * 100)
+        member = RawMember.from_archive(src, "xl/styles.xml")
+
+        out = BytesIO()
+        archive = ZipFile(out, "w", ZIP_DEFLATED)
+        archive.writestr("xl/workbook.xml", b"<workbook />")
+        member.write(archive, "xl/copy.xml")
+        archive.writestr("xl/theme.xml", b"<theme />")
+        archive.close()
+
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        info = archive.getinfo("xl/copy.xml")
+        assert info.compress_size == src.getinfo("xl/styles.xml").compress_size
+        assert archive.read("xl/copy.xml") == b"<styleSheet />" * 100
+        assert archive.read("xl/theme.xml") == b"<theme />"
+
+
+    def test_read_without_internals(self, RawMember, monkeypatch):
+        from .. import _parts
+        monkeypatch.setattr(_parts, "_READ_INTERNALS", ("_missing",))
+        src = ZipFile(BytesIO(), "w", ZIP_DEFLATED)
+        src.writestr("xl/styles.xml", b"<styleSheet />" * 100)
+        member = RawMember.from_archive(src, "xl/styles.xml")
+        assert not member.raw
+        assert member.read() == b"<styleSheet />" * 100
+
+
+    def test_write_without_internals(self, RawMember, monkeypatch):
+        from .. import _parts
+        monkeypatch.setattr(_parts, "_WRITE_INTERNALS", ("_missing",))
+        src = ZipFile(BytesIO(), "w", ZIP_DEFLATED)
+        src.writestr("xl/styles.xml", b"<styleSheet />" * 100)
+        member = RawMember.from_archive(src, "xl/styles.xml")
+        assert member.raw
+
+        out = BytesIO()
+        archive = ZipFile(out, "w", ZIP_DEFLATED)
+        member.write(archive, "xl/copy.xml")
+        archive.close()
+
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        assert archive.getinfo("xl/copy.xml").compress_type == ZIP_DEFLATED
+        assert archive.read("xl/copy.xml") == b"<styleSheet />" * 100
+
+
+@pytest.fixture
+def PartSet():
+    from .._parts import PartSet
+    return PartSet
+
+
+@pytest.fixture
+def source():
+    rels = RelationshipList()
+    rels.append(Relationship(type="drawing", Target="../drawings/drawing1.xml"))
+    rels.append(Relationship(type="hyperlink", Target="http://example.com",
+                             TargetMode="External"))
+    drawing_rels = RelationshipList()
+    drawing_rels.append(Relationship(type="image", Target="../media/image1.png"))
+
+    archive = ZipFile(BytesIO(), "w")
+    archive.writestr("xl/worksheets/sheet3.xml", b"<worksheet />")
+    archive.writestr("xl/worksheets/_rels/sheet3.xml.rels", tostring(rels.to_tree()))
+    archive.writestr("xl/drawings/drawing1.xml", b"<wsDr />")
+    archive.writestr("xl/drawings/_rels/drawing1.xml.rels", tostring(drawing_rels.to_tree()))
+    archive.writestr("xl/media/image1.png", b"PNG")
+    return archive
+
+
+@pytest.fixture
+def manifest():
+    manifest = Manifest()
+    manifest.Override.append(Override("/xl/worksheets/sheet3.xml", "worksheet"))
+    manifest.Override.append(Override("/xl/drawings/drawing1.xml", "drawing"))
+    return manifest
+
+
+class TestPartSet:
+
+    def test_from_archive(self, PartSet, source, manifest):
+        parts = PartSet.from_archive(source, "xl/worksheets/sheet3.xml", manifest)
+        assert set(parts.data) == {
+            "xl/worksheets/sheet3.xml",
+            "xl/drawings/drawing1.xml",
+            "xl/media/image1.png",
+        }
+        assert set(parts.rels) == {"xl/worksheets/sheet3.xml", "xl/drawings/drawing1.xml"}
+        assert list(parts.find("drawing")) == ["xl/drawings/drawing1.xml"]
+
+
+    def test_write(self, PartSet, source, manifest):
+        parts = PartSet.from_archive(source, "xl/worksheets/sheet3.xml", manifest)
+        archive = ZipFile(BytesIO(), "w")
+        out = Manifest()
+        parts.write(archive, out, "xl/worksheets/sheet1.xml")
+
+        assert set(archive.namelist()) == {
+            "xl/worksheets/sheet1.xml",
+            "xl/worksheets/_rels/sheet1.xml.rels",
+            "xl/drawings/drawing1.xml",
+            "xl/drawings/_rels/drawing1.xml.rels",
+            "xl/media/image1.png",
+        }
+        assert archive.read("xl/worksheets/sheet1.xml") == b"<worksheet />"
+        assert "/xl/worksheets/sheet1.xml" in out.filenames
+        rels = get_dependents(archive, "xl/worksheets/_rels/sheet1.xml.rels")
+        assert [r.Target for r in rels.Relationship] == [
+            "xl/drawings/drawing1.xml", "http://example.com"
+        ]
+
+
+    def test_write_clash(self, PartSet, source, manifest):
+        parts = PartSet.from_archive(source, "xl/worksheets/sheet3.xml", manifest)
+        archive = ZipFile(BytesIO(), "w")
+        archive.writestr("xl/drawings/drawing1.xml", b"<wsDr />")
+        parts.write(archive, Manifest(), "xl/worksheets/sheet1.xml")
+
+        assert "xl/drawings/drawing1_1.xml" in archive.namelist()
+        rels = get_dependents(archive, "xl/worksheets/_rels/sheet1.xml.rels")
+        assert rels["rId1"].Target == "xl/drawings/drawing1_1.xml"
+
+
+    def test_write_shared(self, PartSet, source, manifest):
+        cache = {}
+        first = PartSet.from_archive(source, "xl/worksheets/sheet3.xml", manifest, cache)
+        second = PartSet.from_archive(source, "xl/worksheets/sheet3.xml", manifest, cache)
+        assert first.data["xl/media/image1.png"] is second.data["xl/media/image1.png"]
+
+        archive = ZipFile(BytesIO(), "w")
+        written = {}
+        first.write(archive, Manifest(), "xl/worksheets/sheet1.xml", written)
+        second.write(archive, Manifest(), "xl/worksheets/sheet2.xml", written)
+        assert archive.namelist().count("xl/media/image1.png") == 1
+        assert "xl/drawings/drawing1_1.xml" not in archive.namelist()
@@ -25,7 +25,8 @@ from openpyxl.descriptors.sequence import (
     MultiSequencePart,
 )
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import tostring, fromstring
+from openpyxl.packaging.manifest import Override
 from openpyxl.packaging.relationship import (
     RelationshipList,
     Relationship,
@@ -36,6 +37,7 @@ from .table import (
     PivotArea,
     Reference,
 )
+from .record import RecordList
 from .fields import (
     Boolean,
     Error,
@@ -978,7 +980,8 @@ class CacheDefinition(Serialisable):
     rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/pivotCacheDefinition"
     _id = 1
     _path = "/xl/pivotCache/pivotCacheDefinition{0}.xml"
-    records = None
+    _records = None
+    _records_src = None # stored records which have not been parsed
 
     tagname = "pivotCacheDefinition"
 
@@ -1090,6 +1093,24 @@ class CacheDefinition(Serialisable):
         return self._path.format(self._id)
 
 
+    @property
+    def records(self):
+        """
+        Records read from a file are only parsed when they are used.
+        Otherwise they are copied unchanged.
+        """
+        if self._records_src is not None:
+            src, self._records_src = self._records_src, None
+            self._records = RecordList.from_tree(fromstring(src.read()))
+        return self._records
+
+
+    @records.setter
+    def records(self, value):
+        self._records = value
+        self._records_src = None
+
+
     def _write(self, archive, manifest):
         """
         Add to zipfile and update manifest
@@ -1104,15 +1125,21 @@ class CacheDefinition(Serialisable):
         """
         Write the relevant child objects and add links
         """
-        if self.records is None:
+        src = self._records_src
+        if src is None and self.records is None:
             return
 
+        records_path = RecordList._path.format(self._id)
         rels = RelationshipList()
-        r = Relationship(Type=self.records.rel_type, Target=self.records.path)
+        r = Relationship(Type=RecordList.rel_type, Target=records_path)
         rels.append(r)
         self.id = r.id
-        self.records._id = self._id
-        self.records._write(archive, manifest)
+        if src is not None:
+            src.write(archive, records_path[1:])
+            manifest.Override.append(Override(records_path, RecordList.mime_type))
+        else:
+            self.records._id = self._id
+            self.records._write(archive, manifest)
 
         path = get_rels_path(self.path)
         xml = tostring(rels.to_tree())
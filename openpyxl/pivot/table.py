@@ -18,7 +18,7 @@ from openpyxl.descriptors import (
 from openpyxl.descriptors.excel import ExtensionList, Relation
 from openpyxl.descriptors.nested import NestedInteger
 from openpyxl.descriptors.sequence import NestedSequence
-from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.constants import SHEET_MAIN_NS, PIVOT_TABLE_REL_NS
 from openpyxl.xml.functions import tostring
 from openpyxl.packaging.relationship import (
     RelationshipList,
@@ -861,7 +861,7 @@ class Location(Serialisable):
 class TableDefinition(Serialisable):
 
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.pivotTable+xml"
-    rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/pivotTable"
+    rel_type = PIVOT_TABLE_REL_NS
     _id = 1
     _path = "/xl/pivotTables/pivotTable{0}.xml"
 
@@ -2,7 +2,7 @@
 import pytest
 
 from io import BytesIO
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED
 
 from openpyxl.packaging.manifest import Manifest
 from openpyxl.xml.functions import fromstring, tostring
@@ -198,6 +198,35 @@ class TestPivotCacheDefinition:
         assert manifest.find(DummyCache.mime_type)
 
 
+    def test_write_stored_records(self, DummyCache, datadir):
+        from openpyxl.packaging._parts import RawMember
+        datadir.chdir()
+        src = ZipFile(BytesIO(), mode="w", compression=ZIP_DEFLATED)
+        with open("pivotCacheRecords.xml", "rb") as f:
+            src.writestr("records.xml", f.read())
+        DummyCache._records_src = RawMember.from_archive(src, "records.xml")
+
+        archive = ZipFile(BytesIO(), mode="w")
+        manifest = Manifest()
+        DummyCache._write(archive, manifest)
+
+        records = "xl/pivotCache/pivotCacheRecords1.xml"
+        assert archive.read(records) == src.read("records.xml")
+        assert manifest.find("application/vnd.openxmlformats-officedocument.spreadsheetml.pivotCacheRecords+xml")
+
+
+    def test_parse_stored_records(self, DummyCache, datadir):
+        from openpyxl.packaging._parts import RawMember
+        datadir.chdir()
+        src = ZipFile(BytesIO(), mode="w", compression=ZIP_DEFLATED)
+        with open("pivotCacheRecords.xml", "rb") as f:
+            src.writestr("records.xml", f.read())
+        DummyCache._records_src = RawMember.from_archive(src, "records.xml")
+
+        assert len(DummyCache.records.r) == 17
+        assert DummyCache._records_src is None
+
+
 
 @pytest.fixture
 def CacheHierarchy():
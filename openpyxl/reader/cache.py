@@ -0,0 +1,251 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Keep snapshots of loaded workbooks on disk so that loading the same file
+again does not mean parsing it again.
+
+Snapshots are pickles. Only use a directory which nobody else can write to.
+"""
+
+from array import array
+from copy import copy
+from hashlib import sha256
+from io import BytesIO
+import os
+import pickle
+import tempfile
+
+from openpyxl._constants import __version__
+from openpyxl.cell import Cell, MergedCell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.worksheet._cell_store import CellStore
+from openpyxl.worksheet.worksheet import Worksheet
+
+from .excel import ExcelReader
+
+
+SUFFIX = ".snapshot"
+
+
+def _dump_cells(ws):
+    """
+    The cells of a worksheet as arrays of coordinates, style ids, values
+    and data types. Comments and hyperlinks are kept separately for the few
+    cells that have them.
+    """
+    rows = array("i")
+    cols = array("i")
+    ids = array("i")
+    values = []
+    types = []
+    extras = []
+    merged = []
+    for (row, col), cell in ws._cells.items():
+        if isinstance(cell, MergedCell):
+            merged.append((row, col, cell.style_id))
+            continue
+        rows.append(row)
+        cols.append(col)
+        ids.append(cell.style_id)
+        values.append(cell._value)
+        types.append(cell.data_type)
+        if cell._hyperlink is not None or cell._comment is not None:
+            comment = cell._comment and copy(cell._comment)
+            extras.append((row, col, cell._hyperlink, comment))
+    formula_values = [(cell.row, cell.column, value)
+                      for cell, value in ws._formula_values.items()
+                      if ws._cells.get((cell.row, cell.column)) is cell]
+    return rows, cols, ids, values, types, extras, merged, formula_values
+
+
+def _restore_cells(ws, data):
+    rows, cols, ids, values, types, extras, merged, formula_values = data
+    styles = ws.parent._cell_styles
+    cells = ws._cells
+
+    # the values have already been checked so Cell.__init__ is bypassed
+    new_cell = Cell.__new__
+    new_style = array.__new__
+    restored = {}
+    for row, col, idx, value, data_type in zip(rows, cols, ids, values, types):
+        c = new_cell(Cell)
+        c.parent = ws
+        c._style = new_style(StyleArray, "i", styles[idx])
+        c.row = row
+        c.column = col
+        c._value = value
+        c.data_type = data_type
+        c._hyperlink = None
+        c._comment = None
+        restored[(row, col)] = c
+    cells.bulk_update(restored)
+
+    for row, col, hyperlink, comment in extras:
+        c = cells[(row, col)]
+        c._hyperlink = hyperlink
+        if comment is not None:
+            c.comment = comment
+
+    for row, col, idx in merged:
+        c = MergedCell(ws, row=row, column=col)
+        c._style = StyleArray(styles[idx])
+        cells[(row, col)] = c
+
+    for row, col, value in formula_values:
+        ws._formula_values[cells[(row, col)]] = value
+
+
+def snapshot(wb):
+    """
+    Serialise a workbook
+    """
+    if wb.vba_archive is not None:
+        raise ValueError("Workbooks loaded with keep_vba cannot be serialised")
+    worksheets = [ws for ws in wb._sheets if isinstance(ws, Worksheet)]
+    cells = [_dump_cells(ws) for ws in worksheets]
+
+    # the rest of the workbook is pickled without the cells
+    saved = []
+    for ws in worksheets:
+        saved.append((ws._cells, ws._formula_values))
+        ws._cells = CellStore()
+        ws._formula_values = {}
+    try:
+        return pickle.dumps((__version__, wb, cells), pickle.HIGHEST_PROTOCOL)
+    finally:
+        for ws, (store, formula_values) in zip(worksheets, saved):
+            ws._cells = store
+            ws._formula_values = formula_values
+
+
+def restore(data):
+    """
+    Recreate a workbook from a snapshot
+    """
+    version, wb, cells = pickle.loads(data)
+    if version != __version__:
+        raise ValueError("Snapshot was made by openpyxl {0}".format(version))
+    worksheets = [ws for ws in wb._sheets if isinstance(ws, Worksheet)]
+    for ws, data in zip(worksheets, cells):
+        _restore_cells(ws, data)
+    return wb
+
+
+class WorkbookCache(object):
+
+    """
+    Snapshots of loaded workbooks in `directory`, keyed by the contents of
+    the file, the options used to load it and the version of openpyxl.
+    When the snapshots take up more than `max_size` bytes the least recently
+    used are removed.
+
+    Pass it to :func:`openpyxl.reader.excel.load_workbook` as `cache`.
+    Workbooks loaded in read-only or lazy mode, with only some worksheets or
+    keeping VBA are never cached.
+    """
+
+    def __init__(self, directory, max_size=2**30):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+
+    def key(self, data, **options):
+        h = sha256(data)
+        h.update(repr((__version__, sorted(options.items()))).encode("utf-8"))
+        return h.hexdigest()
+
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+
+    def get(self, key):
+        """
+        The workbook for `key` or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as src:
+                data = src.read()
+            os.utime(path) # most recently used
+        except OSError:
+            return None
+        try:
+            return restore(data)
+        except Exception:
+            # made by another version or damaged
+            try:
+                os.remove(path)
+            except OSError: # removed by another process
+                pass
+            return None
+
+
+    def put(self, key, wb):
+        """
+        Store a snapshot of a workbook
+        """
+        data = snapshot(wb)
+        if len(data) > self.max_size:
+            return
+        # written under a temporary name so that other processes never see
+        # part of a snapshot
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                dst.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.evict()
+
+
+    def evict(self):
+        """
+        Remove the least recently used snapshots until they fit
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for mtime, size, path in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError: # removed by another process
+                pass
+            total -= size
+
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                os.remove(entry.path)
+
+
+    def load(self, filename, data_only=False, keep_links=True, cached_values=False):
+        """
+        Restore a workbook from its snapshot or load it and make one
+        """
+        if hasattr(filename, "read"):
+            data = filename.read()
+            filename = BytesIO(data)
+        else:
+            with open(filename, "rb") as src:
+                data = src.read()
+
+        key = self.key(data, data_only=data_only, keep_links=keep_links,
+                       cached_values=cached_values)
+        wb = self.get(key)
+        if wb is None:
+            reader = ExcelReader(filename, keep_vba=False, data_only=data_only,
+                                 keep_links=keep_links, cached_values=cached_values)
+            reader.read()
+            wb = reader.wb
+            self.put(key, wb)
+        return wb
@@ -8,6 +8,7 @@ from warnings import warn
 from openpyxl.xml.functions import fromstring
 from openpyxl.xml.constants import IMAGE_NS
 from openpyxl.packaging.relationship import get_rel, get_rels_path, get_dependents
+from openpyxl.packaging._parts import RawMember
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.drawing.image import Image, PILImage
 from openpyxl.chart.chartspace import ChartSpace
@@ -42,22 +43,24 @@ def find_images(archive, path):
         charts.append(chart)
 
     images = []
-    if not PILImage: # Pillow not installed, drop images
-        return charts, images
-
     for rel in drawing._blip_rels:
         dep = deps[rel.embed]
         if dep.Type == IMAGE_NS:
-            try:
-                image = Image(BytesIO(archive.read(dep.target)))
-            except OSError:
-                msg = "The image {0} will be removed because it cannot be read".format(dep.target)
-                warn(msg)
-                continue
-            if image.format.upper() == "WMF": # cannot save
-                msg = "{0} image format is not supported so the image is being dropped".format(image.format)
-                warn(msg)
-                continue
+            member = RawMember.from_archive(archive, dep.target)
+            image = Image._from_member(member)
+            if image is None:
+                if not PILImage: # Pillow not installed, drop images
+                    continue
+                try:
+                    image = Image(BytesIO(member.read()))
+                except OSError:
+                    msg = "The image {0} will be removed because it cannot be read".format(dep.target)
+                    warn(msg)
+                    continue
+                if image.format.upper() == "WMF": # cannot save
+                    msg = "{0} image format is not supported so the image is being dropped".format(image.format)
+                    warn(msg)
+                    continue
             image.anchor = rel.anchor
             images.append(image)
     return charts, images
@@ -7,11 +7,10 @@
 from zipfile import ZipFile, ZIP_DEFLATED, BadZipfile
 from sys import exc_info
 from io import BytesIO
+from functools import partial
 import os.path
 import warnings
 
-from openpyxl.pivot.table import TableDefinition
-
 # Allow blanket setting of KEEP_VBA for testing
 try:
     from ..tests import KEEP_VBA
@@ -25,9 +24,12 @@ from openpyxl.xml.constants import (
     ARC_SHARED_STRINGS,
     ARC_CORE,
     ARC_CONTENT_TYPES,
+    ARC_ROOT_RELS,
     ARC_WORKBOOK,
     ARC_THEME,
     COMMENTS_NS,
+    DRAWING_REL_NS,
+    PIVOT_TABLE_REL_NS,
     SHARED_STRINGS,
     EXTERNAL_LINK,
     XLTM,
@@ -44,6 +46,7 @@ from openpyxl.styles.stylesheet import apply_stylesheet
 
 from openpyxl.packaging.core import DocumentProperties
 from openpyxl.packaging.manifest import Manifest, Override
+from openpyxl.packaging._parts import PartSet, RawMember
 
 from openpyxl.packaging.relationship import (
     RelationshipList,
@@ -52,14 +55,15 @@ from openpyxl.packaging.relationship import (
 )
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._opaque import OpaqueWorksheet, LazyWorksheet
 from openpyxl.worksheet._reader import WorksheetReader
-from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 
 from openpyxl.xml.functions import fromstring
+from openpyxl.utils.progress import get_monitor
+from openpyxl.utils.tracing import span, counter
 
-from .drawings import find_images
+from openpyxl.writer.excel import ARC_VBA
 
 
 SUPPORTED_FORMATS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
@@ -97,6 +101,16 @@ def _validate_archive(filename):
     return archive
 
 
+def _is_vba_part(name):
+    """
+    Parts which are preserved when keeping VBA, including legacy drawings
+    which may be updated, and the package information for them.
+    """
+    return (name in (ARC_CONTENT_TYPES, ARC_ROOT_RELS)
+            or name.endswith(".vml")
+            or ARC_VBA.match(name) is not None)
+
+
 def _find_workbook_part(package):
     workbook_types = [XLTM, XLTX, XLSM, XLSX]
     for ct in workbook_types:
@@ -120,14 +134,20 @@ class ExcelReader:
     """
 
     def __init__(self,  fn, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, sheets=None, lazy=False,
+                  cached_values=False):
         self.archive = _validate_archive(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
         self.keep_vba = keep_vba
         self.data_only = data_only
         self.keep_links = keep_links
+        self.sheets = sheets
+        self.lazy = lazy and not read_only
+        self.cached_values = cached_values and not data_only
         self.shared_strings = []
+        self._shared_strings_src = None
+        self._parts_cache = {}
 
 
     def read_manifest(self):
@@ -142,6 +162,10 @@ class ExcelReader:
             strings_path = ct.PartName[1:]
             with self.archive.open(strings_path,) as src:
                 self.shared_strings = read_string_table(src)
+            counter("strings", len(self.shared_strings), part=strings_path)
+            if self.sheets is not None or self.lazy:
+                # opaque worksheets refer to the original table
+                self._shared_strings_src = self.archive.read(strings_path)
 
 
     def read_workbook(self):
@@ -151,15 +175,18 @@ class ExcelReader:
         wb = self.parser.wb
         wb._sheets = []
         wb._data_only = self.data_only
+        wb._cached_values = self.cached_values
         wb._read_only = self.read_only
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
-        # If are going to preserve the vba then attach a copy of the archive to the
-        # workbook so that is available for the save.
+        # If are going to preserve the vba then attach a copy of the parts
+        # needed for the save to the workbook. They are copied as they are
+        # stored, without decompressing them.
         if self.keep_vba:
             wb.vba_archive = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
             for name in self.valid_files:
-                wb.vba_archive.writestr(name, self.archive.read(name))
+                if _is_vba_part(name):
+                    RawMember.from_archive(self.archive, name).write(wb.vba_archive, name)
 
         if self.read_only:
             wb._archive = self.archive
@@ -167,6 +194,15 @@ class ExcelReader:
         self.wb = wb
 
 
+    def check_sheets(self):
+        if self.sheets is None:
+            return
+        names = {sheet.name for sheet in self.parser.sheets}
+        for name in self.sheets:
+            if name not in names:
+                raise KeyError("Worksheet {0} does not exist.".format(name))
+
+
     def read_properties(self):
         if ARC_CORE in self.valid_files:
             src = fromstring(self.archive.read(ARC_CORE))
@@ -188,46 +224,119 @@ class ExcelReader:
         with self.archive.open(sheet_path, "r") as src:
             xml = src.read()
         node = fromstring(xml)
+        from openpyxl.chartsheet import Chartsheet
         cs = Chartsheet.from_tree(node)
         cs._parent = self.wb
         cs.title = sheet.name
         self.wb._add_sheet(cs)
 
-        drawings = rels.find(SpreadsheetDrawing._rel_type)
-        for rel in drawings:
+        for rel in rels.find(DRAWING_REL_NS):
+            from .drawings import find_images # charts are only imported if needed
             charts, images = find_images(self.archive, rel.target)
             for c in charts:
                 cs.add_chart(c)
 
 
+    def _is_opaque(self, sheet, rels):
+        """
+        Worksheets which have not been asked for are not loaded unless they
+        contain pivot tables which are shared with the workbook
+        """
+        if self.sheets is None or self.read_only or sheet.name in self.sheets:
+            return False
+        return not any(rels.find(PIVOT_TABLE_REL_NS))
+
+
+    def _is_lazy(self, rels):
+        """
+        Worksheets with pivot tables are always read because the pivot caches
+        are shared with the workbook
+        """
+        return self.lazy and not any(rels.find(PIVOT_TABLE_REL_NS))
+
+
+    def read_opaque_worksheet(self, sheet, rel):
+        parts = PartSet.from_archive(self.archive, rel.target, self.package,
+                                     self._parts_cache)
+        ws = OpaqueWorksheet(self.wb, sheet.name, parts, self._shared_strings_src)
+        ws.sheet_state = sheet.state
+        self.wb._sheets.append(ws)
+
+
+    def read_lazy_worksheet(self, sheet, rel, rels):
+        loader = partial(self.load_worksheet, rel=rel, rels=rels)
+        ws = LazyWorksheet(self.wb, sheet.name, loader, self.archive, rel.target,
+                           self.package, self._shared_strings_src)
+        ws.sheet_state = sheet.state
+        self.wb._sheets.append(ws)
+
+
+    def load_worksheet(self, ws, rel, rels):
+        """
+        Read a worksheet which was loaded lazily
+        """
+        self.bind_worksheet(ws, rel, rels)
+
+
     def read_worksheets(self):
+        monitor = get_monitor()
+        sheets = list(self.parser.find_sheets())
+        for idx, (sheet, rel) in enumerate(sheets, 1):
+            self.read_sheet(sheet, rel)
+            if monitor is not None:
+                monitor.report("parts", idx, len(sheets), rel.target)
+
+
+    def read_sheet(self, sheet, rel):
+        if rel.target not in self.valid_files:
+            return
+
+        if "chartsheet" in rel.Type:
+            self.read_chartsheet(sheet, rel)
+            return
+
+        rels_path = get_rels_path(rel.target)
+        rels = RelationshipList()
+        if rels_path in self.valid_files:
+            rels = get_dependents(self.archive, rels_path)
+
+        if self._is_opaque(sheet, rels):
+            self.read_opaque_worksheet(sheet, rel)
+            return
+
+        if self.read_only:
+            ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings)
+            self.wb._sheets.append(ws)
+            return
+
+        if self._is_lazy(rels):
+            self.read_lazy_worksheet(sheet, rel, rels)
+            return
+
+        ws = self.wb.create_sheet(sheet.name)
+        self.bind_worksheet(ws, rel, rels)
+        ws.sheet_state = sheet.state
+
+
+    def bind_worksheet(self, ws, rel, rels):
+        """
+        Read a worksheet and everything it contains
+        """
+        with span("read_worksheet", sheet=ws.title, part=rel.target):
+            self._bind_worksheet(ws, rel, rels)
+
+
+    def _bind_worksheet(self, ws, rel, rels):
         comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
-        for sheet, rel in self.parser.find_sheets():
-            if rel.target not in self.valid_files:
-                continue
-
-            if "chartsheet" in rel.Type:
-                self.read_chartsheet(sheet, rel)
-                continue
-
-            rels_path = get_rels_path(rel.target)
-            rels = RelationshipList()
-            if rels_path in self.valid_files:
-                rels = get_dependents(self.archive, rels_path)
-
-            if self.read_only:
-                ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings)
-                self.wb._sheets.append(ws)
-                continue
-            else:
-                fh = self.archive.open(rel.target)
-                ws = self.wb.create_sheet(sheet.name)
-                ws._rels = rels
-                ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only)
-                ws_parser.bind_all()
-
-            # assign any comments to cells
-            for r in rels.find(COMMENTS_NS):
+        fh = self.archive.open(rel.target)
+        ws._rels = rels
+        ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only,
+                                    self.cached_values)
+        ws_parser.bind_all()
+
+        # assign any comments to cells
+        for r in rels.find(COMMENTS_NS):
+            with span("read_comments", sheet=ws.title, part=r.target):
                 src = self.archive.read(r.target)
                 comment_sheet = CommentSheet.from_tree(fromstring(src))
                 for ref, comment in comment_sheet.comments:
@@ -239,26 +348,29 @@ class ExcelReader:
                             warnings.warn(comment_warning.format(ws.title, c.coordinate))
                             continue
 
-            # preserve link to VML file if VBA
-            if self.wb.vba_archive and ws.legacy_drawing:
-                ws.legacy_drawing = rels[ws.legacy_drawing].target
+        # preserve link to VML file if VBA
+        if self.wb.vba_archive and ws.legacy_drawing:
+            ws.legacy_drawing = rels[ws.legacy_drawing].target
 
-            for t in ws_parser.tables:
+        for t in ws_parser.tables:
+            with span("read_table", sheet=ws.title, part=t):
                 src = self.archive.read(t)
                 xml = fromstring(src)
                 table = Table.from_tree(xml)
                 ws.add_table(table)
 
-            drawings = rels.find(SpreadsheetDrawing._rel_type)
-            for rel in drawings:
+        for rel in rels.find(DRAWING_REL_NS):
+            with span("read_drawing", sheet=ws.title, part=rel.target):
+                from .drawings import find_images # charts are only imported if needed
                 charts, images = find_images(self.archive, rel.target)
                 for c in charts:
                     ws.add_chart(c, c.anchor)
                 for im in images:
                     ws.add_image(im, im.anchor)
 
-            pivot_rel = rels.find(TableDefinition.rel_type)
-            for r in pivot_rel:
+        for r in rels.find(PIVOT_TABLE_REL_NS):
+            with span("read_pivot", sheet=ws.title, part=r.Target):
+                from openpyxl.pivot.table import TableDefinition
                 pivot_path = r.Target
                 src = self.archive.read(pivot_path)
                 tree = fromstring(src)
@@ -266,24 +378,46 @@ class ExcelReader:
                 pivot.cache = self.parser.pivot_caches[pivot.cacheId]
                 ws.add_pivot(pivot)
 
-            ws.sheet_state = sheet.state
-
 
     def read(self):
-        self.read_manifest()
-        self.read_strings()
-        self.read_workbook()
-        self.read_properties()
-        self.read_theme()
-        apply_stylesheet(self.archive, self.wb)
-        self.read_worksheets()
-        self.parser.assign_names()
-        if not self.read_only:
+        with span("load"):
+            try:
+                self._read()
+            except BaseException:
+                # includes cancellation
+                self.archive.close()
+                raise
+
+
+    def _read(self):
+        with span("read_manifest"):
+            self.read_manifest()
+        with span("read_strings"):
+            self.read_strings()
+        with span("read_workbook"):
+            self.read_workbook()
+        self.check_sheets()
+        with span("read_properties"):
+            self.read_properties()
+        with span("read_theme"):
+            self.read_theme()
+        with span("apply_stylesheet"):
+            apply_stylesheet(self.archive, self.wb)
+        counter("styles", len(self.wb._cell_styles))
+        with span("read_worksheets"):
+            self.read_worksheets()
+        with span("assign_names"):
+            self.parser.assign_names()
+        if self.lazy and any(isinstance(ws, LazyWorksheet) for ws in self.wb._sheets):
+            # worksheets are read from the archive when needed
+            self.wb._archive = self.archive
+        elif not self.read_only:
             self.archive.close()
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, sheets=None, lazy=False,
+                  cached_values=False, cache=None):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -301,15 +435,31 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param keep_links: whether links to external workbooks should be preserved. The default is True
     :type keep_links: bool
 
+    :param sheets: titles of the worksheets to load. Other worksheets are copied unchanged when the workbook is saved. The default is to load all of them
+    :type sheets: list of strings
+
+    :param lazy: read each worksheet the first time it is used. Worksheets which are not used are copied unchanged when the workbook is saved. The file is kept open until the workbook is closed
+    :type lazy: bool
+
+    :param cached_values: keep the values stored for formulae the last time Excel calculated the workbook as well as the formulae. They are available as `cell.cached_value`. Ignored if `data_only` is True
+    :type cached_values: bool
+
+    :param cache: keep a snapshot of the workbook and use it instead of parsing the file when the same file is loaded again. Ignored in read-only or lazy mode, when only some worksheets are loaded or when keeping VBA
+    :type cache: :class:`openpyxl.reader.cache.WorkbookCache`
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
 
-        When using lazy load, all worksheets will be :class:`openpyxl.worksheet.iter_worksheet.IterableWorksheet`
+        When using read-only mode, all worksheets will be :class:`openpyxl.worksheet._read_only.ReadOnlyWorksheet`
         and the returned workbook will be read-only.
 
     """
+    if (cache is not None and not (read_only or keep_vba or lazy)
+        and sheets is None):
+        return cache.load(filename, data_only, keep_links, cached_values)
+
     reader = ExcelReader(filename, read_only, keep_vba,
-                        data_only, keep_links)
+                        data_only, keep_links, sheets, lazy, cached_values)
     reader.read()
     return reader.wb
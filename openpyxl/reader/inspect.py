@@ -0,0 +1,220 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Describe a workbook without loading it. Only the package information, the
+workbook part and the beginning of the worksheets, the shared strings and
+the stylesheet are read so that even very large files can be inspected
+quickly.
+"""
+
+from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.workbook import WorkbookPackage
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._read_only import read_dimension
+from openpyxl.worksheet.table import Table
+from openpyxl.xml.constants import (
+    ARC_CONTENT_TYPES,
+    ARC_STYLE,
+    CHART_TYPE,
+    SHARED_STRINGS,
+    SHEET_MAIN_NS,
+    SPREADSHEET,
+    VBA,
+)
+from openpyxl.xml.functions import fromstring, iterparse
+
+from .excel import _validate_archive, _find_workbook_part
+from .workbook import WorkbookParser
+
+
+PIVOT_TABLE = SPREADSHEET % "pivotTable"
+
+# Rough costs of loading a workbook, measured with CPython on a desktop
+# computer. Worksheets without dimensions are assumed to use
+# XML_BYTES_PER_CELL bytes per cell.
+SECONDS_PER_CELL = 20e-6
+READ_ONLY_SECONDS_PER_CELL = 10e-6
+BYTES_PER_CELL = 400
+BYTES_PER_STRING = 80
+BYTES_PER_STYLE = 500
+READ_ONLY_BYTES = 2**20
+XML_BYTES_PER_CELL = 45
+
+
+class SheetSummary(object):
+
+    """
+    A worksheet or chartsheet in a workbook which has been inspected
+    """
+
+    def __init__(self, title, state, kind, path, size=0, compressed_size=0,
+                 boundaries=None):
+        self.title = title
+        self.state = state
+        self.kind = kind
+        self.path = path
+        self.size = size
+        self.compressed_size = compressed_size
+        self.boundaries = boundaries
+
+
+    @property
+    def dimensions(self):
+        """
+        The range of cells as stored in the worksheet or None if unknown
+        """
+        if self.boundaries is None:
+            return None
+        min_col, min_row, max_col, max_row = self.boundaries
+        if None in self.boundaries:
+            return None
+        return "{0}{1}:{2}{3}".format(get_column_letter(min_col), min_row,
+                                      get_column_letter(max_col), max_row)
+
+
+    @property
+    def cells(self):
+        """
+        Number of cells, estimated from the size of the worksheet if it
+        does not provide its dimensions
+        """
+        if self.kind != "worksheet":
+            return 0
+        if self.boundaries is not None and None not in self.boundaries:
+            min_col, min_row, max_col, max_row = self.boundaries
+            return (max_col - min_col + 1) * (max_row - min_row + 1)
+        return self.size // XML_BYTES_PER_CELL
+
+
+    def __repr__(self):
+        return "<{0} {1!r} {2}>".format(self.__class__.__name__, self.title,
+                                        self.dimensions or self.kind)
+
+
+class WorkbookSummary(object):
+
+    """
+    What a workbook contains and how much it is likely to cost to load it
+    """
+
+    def __init__(self):
+        self.sheets = []
+        self.parts = {}
+        self.shared_strings = None
+        self.styles = None
+        self.charts = 0
+        self.pivots = 0
+        self.tables = 0
+        self.comments = 0
+        self.external_links = 0
+        self.vba = False
+
+
+    @property
+    def size(self):
+        """
+        Size of all parts when uncompressed
+        """
+        return sum(size for size, compressed in self.parts.values())
+
+
+    @property
+    def compressed_size(self):
+        return sum(compressed for size, compressed in self.parts.values())
+
+
+    @property
+    def cells(self):
+        return sum(ws.cells for ws in self.sheets)
+
+
+    def estimate(self, read_only=False):
+        """
+        Approximate time in seconds and peak memory in bytes needed to load
+        the workbook, or in read-only mode to read all its cells once
+        """
+        cells = self.cells
+        strings = (self.shared_strings or 0) * BYTES_PER_STRING
+        styles = (self.styles or 0) * BYTES_PER_STYLE
+        if read_only:
+            return cells * READ_ONLY_SECONDS_PER_CELL, READ_ONLY_BYTES + strings + styles
+        return cells * SECONDS_PER_CELL, cells * BYTES_PER_CELL + strings + styles
+
+
+    def __repr__(self):
+        return "<{0} {1} sheets {2} cells>".format(self.__class__.__name__,
+                                                  len(self.sheets), self.cells)
+
+
+def _attributes(archive, name, tag):
+    """
+    Attributes of the first element called `tag`. Reading stops as soon as
+    it is found.
+    """
+    with archive.open(name) as src:
+        for _, element in iterparse(src, events=("start",)):
+            if element.tag == tag:
+                return dict(element.attrib)
+
+
+def _count(attrs, key):
+    if attrs and attrs.get(key) is not None:
+        return int(attrs[key])
+
+
+def inspect(filename):
+    """
+    Describe a workbook without loading it
+
+    :param filename: the path to open or a file-like object
+    :rtype: :class:`openpyxl.reader.inspect.WorkbookSummary`
+    """
+    archive = _validate_archive(filename)
+    try:
+        return _inspect(archive)
+    finally:
+        archive.close()
+
+
+def _inspect(archive):
+    summary = WorkbookSummary()
+    for info in archive.infolist():
+        summary.parts[info.filename] = (info.file_size, info.compress_size)
+
+    package = Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+    summary.charts = len(list(package.findall(CHART_TYPE)))
+    summary.pivots = len(list(package.findall(PIVOT_TABLE)))
+    summary.tables = len(list(package.findall(Table.mime_type)))
+    summary.comments = len(list(package.findall(CommentSheet.mime_type)))
+    summary.vba = any(package.findall(VBA)) or "xl/vbaProject.bin" in summary.parts
+
+    ct = package.find(SHARED_STRINGS)
+    if ct is not None:
+        attrs = _attributes(archive, ct.PartName[1:], "{%s}sst" % SHEET_MAIN_NS)
+        summary.shared_strings = _count(attrs, "uniqueCount")
+        if summary.shared_strings is None:
+            summary.shared_strings = _count(attrs, "count")
+
+    if ARC_STYLE in summary.parts:
+        attrs = _attributes(archive, ARC_STYLE, "{%s}cellXfs" % SHEET_MAIN_NS)
+        summary.styles = _count(attrs, "count")
+
+    wb_part = _find_workbook_part(package)
+    parser = WorkbookParser(archive, wb_part.PartName[1:])
+    # only what is needed to find the worksheets
+    wb = WorkbookPackage.from_tree(fromstring(archive.read(parser.workbook_part_name)))
+    parser.sheets = wb.sheets
+    summary.external_links = len(wb.externalReferences)
+
+    for sheet, rel in parser.find_sheets():
+        path = rel.target
+        kind = "chartsheet" if "chartsheet" in rel.Type else "worksheet"
+        size, compressed = summary.parts.get(path, (0, 0))
+        ws = SheetSummary(sheet.name, sheet.state, kind, path, size, compressed)
+        if kind == "worksheet" and path in summary.parts:
+            with archive.open(path) as src:
+                ws.boundaries = read_dimension(src)
+        summary.sheets.append(ws)
+
+    return summary
@@ -0,0 +1,181 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+import os
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+from openpyxl.reader.excel import load_workbook
+
+
+@pytest.fixture
+def WorkbookCache():
+    from ..cache import WorkbookCache
+    return WorkbookCache
+
+
+@pytest.fixture
+def sample():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Value"])
+    ws.append(["a", 1])
+    ws.append(["b", "=B2*2"])
+    ws["A1"].font = Font(b=True)
+    ws["A2"].comment = Comment("Note", "Author")
+    ws["A3"].hyperlink = "http://openpyxl.readthedocs.io"
+    ws.merge_cells("D1:E2")
+    wb.create_sheet("Empty")
+    out = BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def test_snapshot(sample):
+    from ..cache import snapshot, restore
+    wb = load_workbook(BytesIO(sample), keep_vba=False)
+    ws = wb["Data"]
+    data = snapshot(wb)
+
+    # snapshots don't change the workbook
+    assert ws["A2"].comment.parent is ws["A2"]
+
+    copy = restore(data)
+    ws2 = copy["Data"]
+    assert copy.sheetnames == ["Data", "Empty"]
+    assert list(ws2.values) == list(ws.values)
+    assert ws2["A1"].font.b is True
+    assert ws2["A1"].parent is ws2
+    assert ws2["A2"].comment.text == "Note"
+    assert ws2["A2"].comment.parent is ws2["A2"]
+    assert ws2["A3"].hyperlink.target == "http://openpyxl.readthedocs.io"
+    assert ws2["B3"].data_type == "f"
+    assert ws2.merged_cells.ranges == ws.merged_cells.ranges
+    assert ws2["E2"].__class__.__name__ == "MergedCell"
+    assert ws2._cells.row_indices == ws._cells.row_indices
+    ws2["A1"].font = Font(i=True)
+    assert ws["A1"].font.i is False
+
+
+def test_cached_values():
+    from ..cache import snapshot, restore
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "=1+1"
+    ws._formula_values[ws["A1"]] = 2
+    copy = restore(snapshot(wb))
+    assert copy.active["A1"].cached_value == 2
+
+
+def test_removed_cached_value():
+    from ..cache import snapshot, restore
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "=1+1"
+    ws._formula_values[ws["A1"]] = 2
+    ws._cells.pop((1, 1)) # removed without its cached value
+    ws["A1"] = "=2+2"
+    copy = restore(snapshot(wb))
+    assert copy.active["A1"].cached_value is None
+
+
+def test_vba(sample):
+    from ..cache import snapshot
+    wb = load_workbook(BytesIO(sample), keep_vba=True)
+    with pytest.raises(ValueError):
+        snapshot(wb)
+
+
+def test_dimensions():
+    from ..cache import snapshot, restore
+    wb = Workbook()
+    ws = wb.active
+    ws.column_dimensions["B"].width = 20
+    ws.row_dimensions[2].height = 30
+    copy = restore(snapshot(wb))
+    ws2 = copy.active
+    assert ws2.column_dimensions.worksheet is ws2
+    assert ws2.column_dimensions["B"].width == 20
+    assert ws2.row_dimensions[2].height == 30
+    assert ws2.column_dimensions["C"].index == "C"
+
+
+class TestWorkbookCache:
+
+
+    def test_load(self, WorkbookCache, sample, tmpdir):
+        cache = WorkbookCache(str(tmpdir))
+        wb1 = load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        assert len(tmpdir.listdir()) == 1
+
+        wb2 = load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        assert wb2 is not wb1
+        assert list(wb2["Data"].values) == list(wb1["Data"].values)
+        assert len(tmpdir.listdir()) == 1
+
+
+    def test_options(self, WorkbookCache, sample, tmpdir):
+        cache = WorkbookCache(str(tmpdir))
+        load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        wb = load_workbook(BytesIO(sample), cache=cache, data_only=True, keep_vba=False)
+        assert wb._data_only is True
+        assert len(tmpdir.listdir()) == 2
+
+
+    def test_not_cached(self, WorkbookCache, sample, tmpdir):
+        cache = WorkbookCache(str(tmpdir))
+        wb = load_workbook(BytesIO(sample), cache=cache, read_only=True, keep_vba=False)
+        wb.close()
+        load_workbook(BytesIO(sample), cache=cache, sheets=["Data"], keep_vba=False)
+        assert tmpdir.listdir() == []
+
+
+    def test_path(self, WorkbookCache, sample, tmpdir):
+        path = tmpdir.join("sample.xlsx")
+        path.write_binary(sample)
+        cache = WorkbookCache(str(tmpdir.join("cache")))
+        load_workbook(str(path), cache=cache, keep_vba=False)
+        wb = load_workbook(str(path), cache=cache, keep_vba=False)
+        assert wb["Data"]["A2"].value == "a"
+
+
+    def test_damaged(self, WorkbookCache, sample, tmpdir):
+        cache = WorkbookCache(str(tmpdir))
+        load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        snapshot, = tmpdir.listdir()
+        snapshot.write_binary(b"damaged")
+        wb = load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        assert wb["Data"]["A2"].value == "a"
+        assert snapshot.size() > len(b"damaged")
+
+
+    def test_damaged_removed(self, WorkbookCache, sample, tmpdir, monkeypatch):
+        from .. import cache as module
+        cache = WorkbookCache(str(tmpdir))
+        load_workbook(BytesIO(sample), cache=cache, keep_vba=False)
+        snapshot, = tmpdir.listdir()
+
+        def restore(data):
+            # another process got there first
+            snapshot.remove()
+            raise ValueError("damaged")
+
+        monkeypatch.setattr(module, "restore", restore)
+        assert cache.get(snapshot.purebasename) is None
+
+
+    def test_evict(self, WorkbookCache, sample, tmpdir):
+        cache = WorkbookCache(str(tmpdir))
+        wb = load_workbook(BytesIO(sample), keep_vba=False)
+        cache.put("old", wb)
+        os.utime(str(tmpdir.join("old.snapshot")), (0, 0))
+        cache.put("new", wb)
+        cache.max_size = tmpdir.join("new.snapshot").size()
+        cache.evict()
+        assert [p.basename for p in tmpdir.listdir()] == ["new.snapshot"]
+        cache.clear()
+        assert tmpdir.listdir() == []
@@ -45,3 +45,16 @@ def test_unsupported_image_format(datadir):
     from ..drawings import find_images
     images = find_images(archive, path)
     assert images == ([], [])
+
+
+def test_images_not_decoded(datadir):
+    datadir.chdir()
+
+    archive = ZipFile("sample_with_images.xlsx")
+    path = "xl/drawings/drawing1.xml"
+
+    from ..drawings import find_images
+    images = find_images(archive, path)[1]
+    for img in images:
+        assert img._ref is None
+        assert img._data() == archive.read(img._src.info.filename)
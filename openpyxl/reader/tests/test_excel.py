@@ -141,7 +141,19 @@ def test_load_workbook_with_vba(datadir, load_workbook):
     with open(test_file, 'rb') as f:
         wb2 = load_workbook(BytesIO(f.read()), keep_vba=True)
     assert wb1.vba_archive.namelist() == wb2.vba_archive.namelist()
-    assert wb1.vba_archive.namelist() == ZipFile(test_file, 'r').namelist()
+    assert wb1.vba_archive.namelist() == [
+        '[Content_Types].xml',
+        '_rels/.rels',
+        'xl/drawings/vmlDrawing2.vml',
+        'xl/drawings/vmlDrawing1.vml',
+        'xl/ctrlProps/',
+        'xl/ctrlProps/ctrlProp1.xml',
+    ]
+    src = ZipFile(test_file)
+    for name in wb1.vba_archive.namelist():
+        info = wb1.vba_archive.getinfo(name)
+        assert info.compress_size == src.getinfo(name).compress_size
+        assert wb1.vba_archive.read(name) == src.read(name)
 
 
 def test_no_external_links(datadir, load_workbook):
@@ -222,3 +234,273 @@ class TestExcelReader:
 
         reader.read_chartsheet(sheet, rel)
         assert reader.wb['chart'].title == "chart"
+
+
+class TestSelectedSheets:
+
+    def test_opaque(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import OpaqueWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", sheets=[])
+        ws = wb.active
+        assert isinstance(ws, OpaqueWorksheet)
+        assert ws.title == "OXM"
+        assert "xl/charts/chart1.xml" in ws._parts.data
+        assert ws._shared_strings is not None
+
+
+    def test_selected(self, datadir, load_workbook):
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", sheets=["OXM"])
+        assert wb.active["A1"].value == "Oxford Industries: Tommy Bahama (OXM)"
+
+
+    def test_unknown_sheet(self, datadir, load_workbook):
+        datadir.chdir()
+
+        with pytest.raises(KeyError):
+            load_workbook("sample.xlsx", sheets=["Nowhere"])
+
+
+    def test_pivot_always_loaded(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import OpaqueWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("pivot.xlsx", sheets=[])
+        assert not isinstance(wb["ptsheet"], OpaqueWorksheet)
+        assert isinstance(wb["raw"], OpaqueWorksheet)
+
+
+    def test_round_trip(self, datadir, load_workbook):
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", sheets=[])
+        out = BytesIO()
+        wb.save(out)
+
+        archive = ZipFile(out)
+        src = ZipFile("sample.xlsx")
+        assert archive.read("xl/worksheets/sheet1.xml") == src.read("xl/worksheets/sheet1.xml")
+        assert archive.read("xl/sharedStrings.xml") == src.read("xl/sharedStrings.xml")
+
+        wb = load_workbook(out)
+        ws = wb.active
+        assert ws["A1"].value == "Oxford Industries: Tommy Bahama (OXM)"
+        assert len(ws._charts) == 6
+
+
+    def test_unknown_extension(self, datadir, load_workbook):
+        datadir.chdir()
+
+        wb = load_workbook("sample_with_unsupported_image_format.xlsx", sheets=[])
+        out = BytesIO()
+        wb.save(out)
+
+        archive = ZipFile(out)
+        src = ZipFile("sample_with_unsupported_image_format.xlsx")
+        assert archive.read("xl/media/image1.wmf") == src.read("xl/media/image1.wmf")
+        manifest = archive.read("[Content_Types].xml")
+        assert b'PartName="/xl/media/image1.wmf"' in manifest
+
+
+    def test_vba_parts_copied_once(self, datadir, load_workbook):
+        datadir.chdir()
+
+        wb = load_workbook("legacy_drawing.xlsm", keep_vba=True, sheets=[])
+        out = BytesIO()
+        wb.save(out)
+
+        names = ZipFile(out).namelist()
+        assert "xl/drawings/vmlDrawing1.vml" in names
+        assert "xl/ctrlProps/ctrlProp1.xml" in names
+        assert [n for n in names if "_1." in n] == []
+
+
+class TestLazy:
+
+    def test_stubs(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", lazy=True)
+        ws = wb.active
+        assert isinstance(ws, LazyWorksheet)
+        assert ws.title == "OXM"
+        assert "_cells" not in ws.__dict__
+        wb.close()
+
+
+    def test_load_on_access(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", lazy=True)
+        ws = wb.active
+        assert ws["A1"].value == "Oxford Industries: Tommy Bahama (OXM)"
+        assert not isinstance(ws, LazyWorksheet)
+        assert len(ws._charts) == 6
+        wb.close()
+
+
+    def test_pivot_not_lazy(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("pivot.xlsx", lazy=True)
+        assert not isinstance(wb["ptsheet"], LazyWorksheet)
+        assert isinstance(wb["raw"], LazyWorksheet)
+        wb.close()
+
+
+    def test_read_only(self, datadir, load_workbook):
+        from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", lazy=True, read_only=True)
+        assert isinstance(wb.active, ReadOnlyWorksheet)
+        wb.close()
+
+
+    def test_clone(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", lazy=True)
+        cp = wb.clone()
+        assert not isinstance(wb.active, LazyWorksheet)
+        assert cp.active["A1"].value == "Oxford Industries: Tommy Bahama (OXM)"
+        wb.close()
+
+
+    def test_set_before_load(self, datadir, load_workbook):
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        datadir.chdir()
+
+        wb = load_workbook("sample.xlsx", lazy=True)
+        ws = wb.active
+        ws.title = "Report"
+        ws.print_title_rows = "1:2"
+        assert isinstance(ws, LazyWorksheet)
+        ws.freeze_panes = "B2"
+        assert not isinstance(ws, LazyWorksheet)
+        out = BytesIO()
+        wb.save(out)
+        wb.close()
+
+        wb = load_workbook(out)
+        assert wb["Report"].freeze_panes == "B2"
+        assert wb["Report"].print_title_rows == "1:2"
+
+
+    def test_load_cancelled(self, load_workbook):
+        from openpyxl import Workbook
+        from openpyxl.utils.exceptions import OperationCancelled
+        from openpyxl.utils.progress import CancelToken, monitoring
+        from openpyxl.worksheet._opaque import LazyWorksheet
+        wb = Workbook()
+        ws = wb.active
+        for row in range(5000):
+            ws.append([row])
+        out = BytesIO()
+        wb.save(out)
+
+        wb = load_workbook(out, lazy=True)
+        ws = wb.active
+        token = CancelToken()
+
+        def progress(unit, done, total, part):
+            if unit == "rows" and done >= 2000:
+                token.cancel()
+
+        with pytest.raises(OperationCancelled):
+            with monitoring(progress, token=token):
+                ws["A1"]
+        assert isinstance(ws, LazyWorksheet)
+        out = BytesIO()
+        wb.save(out)
+        wb.close()
+
+        wb = load_workbook(out)
+        assert wb.active.max_row == 5000
+
+
+    def test_unknown_extension(self, datadir, load_workbook):
+        datadir.chdir()
+
+        wb = load_workbook("sample_with_unsupported_image_format.xlsx", lazy=True)
+        out = BytesIO()
+        wb.save(out)
+        wb.close()
+
+        wb = load_workbook(out)
+        assert wb.sheetnames == ["Sheet1"]
+
+
+@pytest.mark.parametrize("options", [{"sheets": ["A"]}, {"lazy": True}])
+def test_print_titles_not_read(load_workbook, options):
+    from openpyxl import Workbook
+    wb = Workbook()
+    wb.active.title = "A"
+    wb.active.print_area = "A1:B2"
+    ws = wb.create_sheet("B")
+    ws.print_title_rows = "1:2"
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out, **options)
+    assert wb["B"].print_title_rows == "1:2"
+    wb.move_sheet("B", -1)
+    wb["B"].title = "C"
+    out = BytesIO()
+    wb.save(out)
+    wb.close()
+
+    wb = load_workbook(out)
+    assert wb.sheetnames == ["C", "A"]
+    assert wb["C"].print_title_rows == "1:2"
+    assert wb["C"].print_area is None
+    assert wb["A"].print_title_rows is None
+    assert wb["A"].print_area == ["$A$1:$B$2"]
+
+
+def test_clone_opaque(datadir, load_workbook):
+    datadir.chdir()
+
+    wb = load_workbook("sample.xlsx", sheets=[])
+    with pytest.raises(ValueError):
+        wb.clone()
+    wb.close()
+
+
+def test_clone_round_trip(datadir, load_workbook):
+    datadir.chdir()
+
+    wb = load_workbook("sample.xlsx")
+    cp = wb.clone()
+    assert cp.active._charts == wb.active._charts
+    out = BytesIO()
+    cp.save(out)
+    expected = BytesIO()
+    wb.save(expected)
+
+    archive = ZipFile(out)
+    src = ZipFile(expected)
+    assert archive.namelist() == src.namelist()
+    for name in src.namelist():
+        assert archive.read(name) == src.read(name)
+
+
+def test_tracing(datadir, load_workbook):
+    from openpyxl.utils.tracing import Recorder, tracing
+    datadir.chdir()
+
+    with tracing(Recorder()) as rec:
+        load_workbook("pivot.xlsx")
+
+    spans = {name:attrs for name, duration, attrs in rec.spans}
+    assert spans["read_pivot"] == {"sheet": "ptsheet",
+                                   "part": "xl/pivotTables/pivotTable1.xml"}
+    assert rec.counters["strings"] > 0
+    assert rec.counters["cells"] > 0
@@ -0,0 +1,79 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl import Workbook
+
+
+@pytest.fixture
+def inspect():
+    from ..inspect import inspect
+    return inspect
+
+
+def test_pivot(datadir, inspect):
+    datadir.chdir()
+    summary = inspect("pivot.xlsx")
+    assert [(ws.title, ws.dimensions) for ws in summary.sheets] == [
+        ("ptsheet", "A3:E14"),
+        ("raw", "A1:F18"),
+    ]
+    assert summary.pivots == 1
+    assert summary.charts == 0
+    assert summary.shared_strings == 16
+    assert summary.styles == 16
+    assert summary.vba is False
+    assert summary.parts["xl/worksheets/sheet1.xml"][0] == summary.sheets[0].size
+
+
+def test_chartsheets(datadir, inspect):
+    datadir.chdir()
+    summary = inspect("contains_chartsheets.xlsx")
+    assert [ws.kind for ws in summary.sheets] == ["worksheet", "chartsheet", "worksheet"]
+    assert summary.charts == 2
+    assert summary.cells == 40
+
+
+def test_fileobj(inspect):
+    wb = Workbook()
+    ws = wb.active
+    ws["C4"] = 1
+    wb.create_sheet("Hidden").sheet_state = "hidden"
+    out = BytesIO()
+    wb.save(out)
+    with ZipFile(out, "a") as archive:
+        archive.writestr("xl/vbaProject.bin", b"")
+
+    summary = inspect(out)
+    assert summary.vba is True
+    assert [(ws.title, ws.state) for ws in summary.sheets] == [
+        ("Sheet", "visible"),
+        ("Hidden", "hidden"),
+    ]
+    assert summary.sheets[0].dimensions == "C4:C4"
+    assert summary.size > summary.compressed_size
+
+
+def test_estimate(inspect):
+    from ..inspect import WorkbookSummary, SheetSummary
+    summary = WorkbookSummary()
+    summary.sheets.append(SheetSummary("Sheet", "visible", "worksheet",
+                                       "xl/worksheets/sheet1.xml",
+                                       boundaries=(1, 1, 10, 1000)))
+    summary.shared_strings = 100
+    seconds, memory = summary.estimate()
+    ro_seconds, ro_memory = summary.estimate(read_only=True)
+    assert summary.cells == 10000
+    assert ro_seconds < seconds
+    assert ro_memory < memory
+
+
+def test_no_dimensions():
+    from ..inspect import SheetSummary
+    ws = SheetSummary("Sheet", "visible", "worksheet", "xl/worksheets/sheet1.xml",
+                      size=4500)
+    assert ws.dimensions is None
+    assert ws.cells == 100
@@ -18,8 +18,7 @@ from openpyxl.workbook.defined_name import (
     _unpack_print_titles,
 )
 from openpyxl.workbook.external_link.external import read_external_link
-from openpyxl.pivot.cache import CacheDefinition
-from openpyxl.pivot.record import RecordList
+from openpyxl.packaging._parts import RawMember
 
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
 
@@ -27,6 +26,7 @@ from openpyxl.utils.datetime import CALENDAR_MAC_1904
 class WorkbookParser:
 
     _rels = None
+    _pivot_caches = None
 
     def __init__(self, archive, workbook_part_name, keep_links=True):
         self.archive = archive
@@ -92,7 +92,8 @@ class WorkbookParser:
 
     def assign_names(self):
         """
-        Bind reserved names to parsed worksheets
+        Bind reserved names to worksheets, including those which have not
+        been read
         """
         defns = []
 
@@ -114,13 +115,16 @@ class WorkbookParser:
     @property
     def pivot_caches(self):
         """
-        Get PivotCache objects
+        Get PivotCache objects. Records are read but not parsed.
         """
-        d = {}
-        for c in self.caches:
-            cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
-            if cache.deps:
-                records = get_rel(self.archive, cache.deps, cache.id, RecordList)
-                cache.records = records
-            d[c.cacheId]  = cache
-        return d
+        if self._pivot_caches is None:
+            from openpyxl.pivot.cache import CacheDefinition
+            d = {}
+            for c in self.caches:
+                cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
+                if cache.deps:
+                    path = cache.deps[cache.id].target
+                    cache._records_src = RawMember.from_archive(self.archive, path)
+                d[c.cacheId]  = cache
+            self._pivot_caches = d
+        return self._pivot_caches
@@ -12,6 +12,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.functions import localname
 
 
 from .alignment import Alignment
@@ -185,6 +186,28 @@ class CellStyleList(Serialisable):
         return self.xf[idx]
 
 
+    @classmethod
+    def from_tree(cls, node):
+        """
+        Stylesheets written by some programs repeat the same format many
+        times so identical formats without children are only parsed once.
+        """
+        xfs = []
+        seen = {}
+        for el in node:
+            if localname(el) != "xf":
+                continue
+            if len(el):
+                xf = CellStyle.from_tree(el)
+            else:
+                key = tuple(el.attrib.items())
+                xf = seen.get(key)
+                if xf is None:
+                    xf = seen[key] = CellStyle.from_tree(el)
+            xfs.append(xf)
+        return cls(xf=xfs)
+
+
     def _to_array(self):
         """
         Extract protection and alignments, convert to style array
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2019 openpyxl
 
 import re
+from functools import lru_cache
 
 from openpyxl.descriptors import (
     String,
@@ -100,6 +101,7 @@ STRIP_RE = re.compile("{0}|{1}|{2}".format(COLORS, LITERAL_GROUP, LOCALE_GROUP),
 # Spec 18.8.31 numFmts
 # +ve;-ve;zero;text
 
+@lru_cache(maxsize=1024)
 def is_date_format(fmt):
     if fmt is None:
         return False
@@ -11,7 +11,38 @@ from .numbers import (
 from .proxy import StyleProxy
 from .cell_style import StyleArray
 from .named_styles import NamedStyle
-from .builtins import styles
+
+
+def _number_format_id(wb, value):
+    """
+    Id of a number format, which is added to the workbook if necessary
+    """
+    if value in BUILTIN_FORMATS_REVERSE:
+        return BUILTIN_FORMATS_REVERSE[value]
+    return wb._number_formats.add(value) + BUILTIN_FORMATS_MAX_SIZE
+
+
+def _named_style(wb, value):
+    """
+    Look up a named style by name, adding builtin styles and new
+    `NamedStyle` objects to the workbook
+    """
+    coll = wb._named_styles
+    if isinstance(value, NamedStyle):
+        style = value
+        if style not in coll:
+            wb.add_named_style(style)
+    elif value not in coll.names:
+        from .builtins import styles # parsed on first use
+        if value in styles: # is it builtin?
+            style = styles[value]
+            if style not in coll:
+                wb.add_named_style(style)
+        else:
+            raise ValueError("{0} is not a known style".format(value))
+    else:
+        style = coll[value]
+    return style
 
 
 class StyleDescriptor(object):
@@ -41,12 +72,7 @@ class NumberFormatDescriptor(object):
     collection = '_number_formats'
 
     def __set__(self, instance, value):
-        coll = getattr(instance.parent.parent, self.collection)
-        if value in BUILTIN_FORMATS_REVERSE:
-            idx = BUILTIN_FORMATS_REVERSE[value]
-        else:
-            idx = coll.add(value) + BUILTIN_FORMATS_MAX_SIZE
-
+        idx = _number_format_id(instance.parent.parent, value)
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
         setattr(instance._style, self.key, idx)
@@ -69,22 +95,7 @@ class NamedStyleDescriptor(object):
 
 
     def __set__(self, instance, value):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        coll = getattr(instance.parent.parent, self.collection)
-        if isinstance(value, NamedStyle):
-            style = value
-            if style not in coll:
-                instance.parent.parent.add_named_style(style)
-        elif value not in coll.names:
-            if value in styles: # is it builtin?
-                style = styles[value]
-                if style not in coll:
-                    instance.parent.parent.add_named_style(style)
-            else:
-                raise ValueError("{0} is not a known style".format(value))
-        else:
-            style = coll[value]
+        style = _named_style(instance.parent.parent, value)
         instance._style = copy(style.as_tuple())
 
 
@@ -150,3 +161,57 @@ class StyleableObject(object):
             return False
         return any(self._style)
 
+
+
+class StyleChange(object):
+
+    """
+    A change to the style of many objects. Each part of the style is added
+    to the workbook once and the result computed once for each distinct
+    style being changed.
+
+    If a named style is given it replaces the existing style before the
+    other parts are applied, as when setting `cell.style`.
+    """
+
+    def __init__(self, wb, font=None, fill=None, border=None,
+                 number_format=None, alignment=None, protection=None,
+                 named_style=None):
+        self.base = None
+        if named_style is not None:
+            self.base = _named_style(wb, named_style).as_tuple()
+
+        changes = []
+        for key, coll, value in (
+            ("fontId", wb._fonts, font),
+            ("fillId", wb._fills, fill),
+            ("borderId", wb._borders, border),
+            ("alignmentId", wb._alignments, alignment),
+            ("protectionId", wb._protections, protection),
+        ):
+            if value is not None:
+                changes.append((key, coll.add(value)))
+        if number_format is not None:
+            changes.append(("numFmtId", _number_format_id(wb, number_format)))
+        self.changes = changes
+        self._results = {}
+
+
+    def __call__(self, style=None):
+        """
+        The style resulting from the change. A new array is returned each
+        time as objects must not share their styles.
+        """
+        key = style and tuple(style)
+        result = self._results.get(key)
+        if result is None:
+            if self.base is not None:
+                result = StyleArray(self.base)
+            elif style is not None:
+                result = StyleArray(style)
+            else:
+                result = StyleArray()
+            for attr, value in self.changes:
+                setattr(result, attr, value)
+            self._results[key] = result
+        return StyleArray(result)
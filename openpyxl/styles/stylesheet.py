@@ -12,7 +12,6 @@ from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.xml.constants import ARC_STYLE, SHEET_MAIN_NS
 from openpyxl.xml.functions import fromstring
 
-from .builtins import styles
 from .colors import ColorList, COLOR_INDEX
 from .differential import DifferentialStyle
 from .table import TableStyleList
@@ -30,7 +29,7 @@ from .numbers import (
 from .named_styles import (
     _NamedCellStyleList
 )
-from .cell_style import CellStyle, CellStyleList
+from .cell_style import CellStyle, CellStyleList, StyleArray
 
 
 class Stylesheet(Serialisable):
@@ -52,6 +51,8 @@ class Stylesheet(Serialisable):
     __elements__ = ('numFmts', 'fonts', 'fills', 'borders', 'cellStyleXfs',
                     'cellXfs', 'cellStyles', 'dxfs', 'tableStyles', 'colors')
 
+    _custom_formats = None
+
     def __init__(self,
                  numFmts=None,
                  fonts=(),
@@ -147,30 +148,47 @@ class Stylesheet(Serialisable):
 
     @property
     def custom_formats(self):
-        return dict([(n.numFmtId, n.formatCode) for n in self.numFmts.numFmt])
+        """
+        Custom number formats keyed by their id. Built once, when the
+        stylesheet is read.
+        """
+        if self._custom_formats is None:
+            self._custom_formats = {n.numFmtId:n.formatCode for n in self.numFmts.numFmt}
+        return self._custom_formats
 
 
     def _normalise_numbers(self):
         """
         Rebase custom numFmtIds with a floor of 164 when reading stylesheet
         And index datetime formats
+
+        Each format is only resolved once however many styles use it.
         """
         date_formats = set()
         custom = self.custom_formats
         formats = self.number_formats
+        resolved = {} # numFmtId in the file: (numFmtId, is date)
         for idx, style in enumerate(self.cell_styles):
-            if style.numFmtId in custom:
-                fmt = custom[style.numFmtId]
-                if fmt in BUILTIN_FORMATS_REVERSE: # remove builtins
-                    style.numFmtId = BUILTIN_FORMATS_REVERSE[fmt]
+            fmt_id = style.numFmtId
+            if fmt_id not in resolved:
+                if fmt_id in custom:
+                    fmt = custom[fmt_id]
+                    if fmt in BUILTIN_FORMATS_REVERSE: # remove builtins
+                        new_id = BUILTIN_FORMATS_REVERSE[fmt]
+                    else:
+                        new_id = formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
                 else:
-                    style.numFmtId = formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
-            else:
-                fmt = builtin_format_code(style.numFmtId)
-            if is_date_format(fmt):
+                    fmt = builtin_format_code(fmt_id)
+                    new_id = fmt_id
+                resolved[fmt_id] = new_id, is_date_format(fmt)
+
+            style.numFmtId, is_date = resolved[fmt_id]
+            if is_date:
                 # Create an index of which styles refer to datetimes
                 date_formats.add(idx)
         self.date_formats = date_formats
+        # styles have changed so they must be indexed again
+        self.cell_styles = IndexedList(self.cell_styles)
 
 
     def to_tree(self, tagname=None, idx=None, namespace=None):
@@ -209,6 +227,7 @@ def apply_stylesheet(archive, wb):
         ns.bind(wb)
 
     if not wb._named_styles:
+        from .builtins import styles
         normal = styles['Normal']
         wb.add_named_style(normal)
         warn("Workbook contains no default style, apply openpyxl's default")
@@ -248,3 +267,84 @@ def write_stylesheet(wb):
     stylesheet.tableStyles = wb._table_styles
 
     return stylesheet.to_tree()
+
+
+def compact_styles(wb):
+    """
+    Remove styles which are not used by any cell, row or column and merge
+    those which are the same. Named styles are always kept.
+    """
+    from openpyxl.worksheet._opaque import OpaqueWorksheet, load_lazy_worksheets
+
+    if wb.read_only or wb.write_only:
+        raise TypeError("Styles cannot be compacted in read-only or write-only mode")
+    if any(isinstance(ws, OpaqueWorksheet) for ws in wb._sheets):
+        warn("Styles cannot be compacted because some worksheets have not been loaded")
+        return
+    load_lazy_worksheets(wb)
+
+    fonts = IndexedList([wb._fonts[0]])
+    fills = IndexedList(wb._fills[:2]) # Excel needs the first two
+    borders = IndexedList([wb._borders[0]])
+    alignments = IndexedList([wb._alignments[0]])
+    protections = IndexedList([wb._protections[0]])
+    number_formats = IndexedList()
+    cell_styles = IndexedList()
+    converted = {}
+
+    def convert(style):
+        key = tuple(style)
+        new = converted.get(key)
+        if new is None:
+            new = StyleArray(style)
+            new.fontId = fonts.add(wb._fonts[style.fontId])
+            new.fillId = fills.add(wb._fills[style.fillId])
+            new.borderId = borders.add(wb._borders[style.borderId])
+            new.alignmentId = alignments.add(wb._alignments[style.alignmentId])
+            new.protectionId = protections.add(wb._protections[style.protectionId])
+            if style.numFmtId >= BUILTIN_FORMATS_MAX_SIZE:
+                fmt = wb._number_formats[style.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+                if fmt in BUILTIN_FORMATS_REVERSE:
+                    new.numFmtId = BUILTIN_FORMATS_REVERSE[fmt]
+                else:
+                    new.numFmtId = number_formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
+            cell_styles.add(new)
+            converted[key] = new
+        return new
+
+    def update(obj):
+        style = obj._style
+        if style:
+            new = convert(style)
+            if new != style:
+                obj._style = StyleArray(new)
+
+    convert(wb._cell_styles[0]) # the default style must stay first
+    for ws in wb.worksheets:
+        for cell in ws._cells.values():
+            update(cell)
+        for dim in dict.values(ws.row_dimensions):
+            update(dim)
+        for first, last, attrs in ws.row_dimensions._runs:
+            if 's' in attrs:
+                attrs['s'] = StyleArray(convert(attrs['s']))
+        for dim in ws.column_dimensions.values():
+            update(dim)
+
+    wb._fonts = fonts
+    wb._fills = fills
+    wb._borders = borders
+    wb._alignments = alignments
+    wb._protections = protections
+    wb._number_formats = number_formats
+    wb._cell_styles = cell_styles
+    wb._date_formats = set()
+    for idx, style in enumerate(cell_styles):
+        if style.numFmtId < BUILTIN_FORMATS_MAX_SIZE:
+            fmt = builtin_format_code(style.numFmtId)
+        else:
+            fmt = number_formats[style.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+        if is_date_format(fmt):
+            wb._date_formats.add(idx)
+    for style in wb._named_styles:
+        style.bind(wb)
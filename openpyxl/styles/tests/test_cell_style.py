@@ -129,6 +129,27 @@ class TestCellStyleList:
         assert cell_style == CellStyleList()
 
 
+    def test_from_xml_duplicates(self, CellStyleList):
+        src = """
+        <cellXfs count="4">
+            <xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0"/>
+            <xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0"/>
+            <xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyAlignment="1">
+              <alignment horizontal="center"/>
+            </xf>
+            <xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyAlignment="1">
+              <alignment horizontal="center"/>
+            </xf>
+        </cellXfs>
+        """
+        node = fromstring(src)
+        xfs = CellStyleList.from_tree(node)
+        assert xfs.count == 4
+        assert xfs[0] is xfs[1]
+        assert xfs[2] == xfs[3]
+        assert xfs[2].alignment.horizontal == "center"
+
+
     def test_to_array(self, CellStyleList):
         src = """
         <cellXfs count="29">
@@ -142,3 +142,60 @@ class TestNamedStyle:
         assert s1.pivotButton is False
         s1.pivotButton = True
         assert s1.pivotButton is True
+
+
+class TestStyleChange:
+
+    def test_parts(self, Workbook):
+        from ..styleable import StyleChange
+        from ..cell_style import StyleArray
+        from ..fonts import Font
+
+        wb = Workbook
+        change = StyleChange(wb, font=Font(b=True), number_format="0.000")
+        style = change(StyleArray([0, 1, 2, 0, 0, 0, 0, 0, 0]))
+        assert style.fontId == wb._fonts.index(Font(b=True))
+        assert style.fillId == 1
+        assert style.borderId == 2
+        assert style.numFmtId == 164 + wb._number_formats.index("0.000")
+
+
+    def test_builtin_format(self, Workbook):
+        from ..styleable import StyleChange
+
+        change = StyleChange(Workbook, number_format="0.00")
+        assert change().numFmtId == 2
+        assert len(Workbook._number_formats) == 0
+
+
+    def test_not_shared(self, Workbook):
+        from ..styleable import StyleChange
+        from ..cell_style import StyleArray
+
+        change = StyleChange(Workbook, number_format="0.00")
+        s1 = change(StyleArray())
+        s2 = change(StyleArray())
+        assert s1 == s2
+        assert s1 is not s2
+        assert len(change._results) == 1
+
+
+    def test_named_style(self, Workbook):
+        from ..styleable import StyleChange
+        from ..cell_style import StyleArray
+        from ..fonts import Font
+
+        wb = Workbook
+        change = StyleChange(wb, named_style="Hyperlink", font=Font(i=True))
+        style = change(StyleArray([5, 5, 5, 5, 0, 0, 0, 0, 0]))
+        hyperlink = wb._named_styles["Hyperlink"]
+        assert style.xfId == hyperlink.as_tuple().xfId
+        assert style.fillId == hyperlink.as_tuple().fillId
+        assert style.fontId == wb._fonts.index(Font(i=True))
+
+
+    def test_unknown_style(self, Workbook):
+        from ..styleable import StyleChange
+
+        with pytest.raises(ValueError):
+            StyleChange(Workbook, named_style="Financial")
@@ -8,6 +8,8 @@ from openpyxl.xml.functions import fromstring, tostring
 from openpyxl.tests.helper import compare_xml
 from openpyxl import Workbook
 
+from openpyxl.utils.indexed_list import IndexedList
+
 from ..cell_style import StyleArray
 
 
@@ -348,3 +350,85 @@ def test_no_default_style(datadir):
     apply_stylesheet(archive, wb)
 
     assert wb._named_styles != []
+
+
+class TestCompactStyles:
+
+
+    def test_unused(self):
+        from ..stylesheet import compact_styles
+        from ..fonts import Font
+        wb = Workbook()
+        ws = wb.active
+        for size in range(20, 30):
+            wb._cell_styles.add(StyleArray([wb._fonts.add(Font(sz=size)), 0, 0, 0, 0, 0, 0, 0, 0]))
+        ws["A1"].font = Font(sz=25)
+        ws["A2"].number_format = "0.000"
+        wb._number_formats.add("0.0000")
+
+        compact_styles(wb)
+
+        assert len(wb._fonts) == 2
+        assert list(wb._cell_styles) == [
+            StyleArray(),
+            StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0]),
+            StyleArray([0, 0, 0, 164, 0, 0, 0, 0, 0]),
+        ]
+        assert wb._number_formats == ["0.000"]
+        assert ws["A1"].font.sz == 25
+        assert ws["A2"].number_format == "0.000"
+
+
+    def test_duplicates(self):
+        from ..stylesheet import compact_styles
+        from ..fonts import Font
+        wb = Workbook()
+        ws = wb.active
+        # the same font can be added more than once when reading files
+        wb._fonts = IndexedList(list(wb._fonts) + [Font(b=True), Font(b=True)])
+        ws["A1"]._style = StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0])
+        ws["A2"]._style = StyleArray([2, 0, 0, 0, 0, 0, 0, 0, 0])
+        wb._number_formats.add("0.00")
+        ws["A3"]._style = StyleArray([0, 0, 0, 164, 0, 0, 0, 0, 0])
+
+        compact_styles(wb)
+
+        assert ws["A1"]._style == ws["A2"]._style
+        assert ws["A1"]._style is not ws["A2"]._style
+        assert len(wb._fonts) == 2
+        assert ws["A3"].number_format == "0.00"
+        assert ws["A3"]._style.numFmtId == 2 # builtin
+
+
+    def test_dimensions(self):
+        from ..stylesheet import compact_styles
+        from ..fonts import Font
+        wb = Workbook()
+        ws = wb.active
+        wb._fonts.add(Font(sz=8))
+        ws.row_dimensions[2].font = Font(i=True)
+        ws.row_dimensions.add_run(5, 6, {'s': StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0])})
+        ws.column_dimensions["B"].font = Font(b=True)
+
+        compact_styles(wb)
+
+        assert ws.row_dimensions[2].font.i
+        assert ws.row_dimensions[6].font.sz == 8
+        assert ws.column_dimensions["B"].font.b
+        assert len(wb._fonts) == 4
+
+
+    def test_on_save(self):
+        from ..fonts import Font
+        wb = Workbook()
+        wb._fonts.add(Font(sz=8))
+        wb.compact_styles_on_save = True
+        wb.save(BytesIO())
+        assert len(wb._fonts) == 1
+
+
+    def test_write_only(self):
+        from ..stylesheet import compact_styles
+        wb = Workbook(write_only=True)
+        with pytest.raises(TypeError):
+            compact_styles(wb)
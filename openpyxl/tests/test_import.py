@@ -0,0 +1,48 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""Make sure that optional parts of the library are not imported up front"""
+
+import os
+import subprocess
+import sys
+
+import openpyxl
+
+# the directory openpyxl is imported from
+ROOT = os.path.dirname(os.path.dirname(openpyxl.__file__))
+
+
+LAZY = [
+    "openpyxl.chart",
+    "openpyxl.chartsheet",
+    "openpyxl.drawing.spreadsheet_drawing",
+    "openpyxl.pivot.table",
+    "openpyxl.pivot.cache",
+    "openpyxl.styles.builtins",
+    "numpy",
+    "pandas",
+    "PIL",
+]
+
+
+def imported_after(code):
+    check = "import sys; {0}; print(' '.join(m for m in {1!r} if m in sys.modules))"
+    out = subprocess.check_output([sys.executable, "-c", check.format(code, LAZY)],
+                                  cwd=ROOT)
+    return out.decode().split()
+
+
+def test_import():
+    assert imported_after("import openpyxl") == []
+
+
+def test_new_workbook():
+    code = "from openpyxl import Workbook; wb = Workbook(); wb.active['A1'] = 1"
+    assert imported_after(code) == []
+
+
+def test_flags():
+    from importlib.util import find_spec
+    assert openpyxl.NUMPY is (find_spec("numpy") is not None)
+    assert openpyxl.PANDAS is (find_spec("pandas") is not None)
+    assert imported_after("from openpyxl import NUMPY, PANDAS") == []
@@ -20,6 +20,7 @@ def DummyWorkbook():
         epoch = None
         _cell_styles = [StyleArray([0, 0, 0, 0, 0, 0, 0, 0, 0])]
         data_only = False
+        cached_values = False
 
         def __init__(self):
             self.sheetnames = []
@@ -272,6 +273,17 @@ def test_read_single_cell_formula(datadir, data_only, expected):
     assert cell.value == expected
 
 
+@pytest.mark.parametrize("read_only", [True, False])
+def test_read_cached_values(datadir, read_only):
+    datadir.join("genuine").chdir()
+    wb = load_workbook("sample.xlsx", read_only=read_only, cached_values=True)
+    ws = wb["Sheet3 - Formulas"]
+    cell = ws["D2"]
+    assert cell.value == "='Sheet2 - Numbers'!D5"
+    assert cell.cached_value == 5
+    assert ws["A1"].cached_value is None
+
+
 def test_read_style_iter(tmpdir):
     '''
     Test if cell styles are read properly in iter mode.
@@ -3,7 +3,9 @@
 """
 Collection of utilities used within the package and also available for client code
 """
+from itertools import product
 import re
+from string import ascii_uppercase
 
 from .exceptions import CellCoordinatesException
 
@@ -94,12 +96,12 @@ def _get_column_letter(col_idx):
     return ''.join(reversed(letters))
 
 
-_COL_STRING_CACHE = {}
-_STRING_COL_CACHE = {}
-for i in range(1, 18279):
-    col = _get_column_letter(i)
-    _STRING_COL_CACHE[i] = col
-    _COL_STRING_CACHE[col] = i
+# all the letters from A to ZZZ, in order
+_COLUMN_LETTERS = ["".join(letters) for size in (1, 2, 3)
+                   for letters in product(ascii_uppercase, repeat=size)]
+_STRING_COL_CACHE = dict(enumerate(_COLUMN_LETTERS, 1))
+_COL_STRING_CACHE = {col:idx for idx, col in _STRING_COL_CACHE.items()}
+del _COLUMN_LETTERS
 
 
 def get_column_letter(idx,):
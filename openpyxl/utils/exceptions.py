@@ -32,3 +32,12 @@ class ReadOnlyWorkbookException(Exception):
 class WorkbookAlreadySaved(Exception):
     """Error when attempting to perform operations on a dump workbook
     while it has already been dumped once"""
+
+
+class OperationCancelled(Exception):
+    """Error when loading or saving a workbook has been cancelled"""
+
+
+class DeadlineExceeded(OperationCancelled):
+    """Error when loading or saving a workbook has taken longer than
+    allowed"""
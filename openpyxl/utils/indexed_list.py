@@ -47,3 +47,11 @@ class IndexedList(list):
     def add(self, value):
         self.append(value)
         return self._dict[value]
+
+    def __copy__(self):
+        # the values are not hashed again
+        cp = self.__class__()
+        list.extend(cp, self)
+        cp._dict = dict(self._dict)
+        cp.clean = self.clean
+        return cp
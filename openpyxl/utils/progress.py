@@ -0,0 +1,106 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Follow the progress of loading and saving workbooks and stop them if they
+take too long or are no longer needed.
+
+While a monitor is installed with :func:`monitoring` the rows of each
+worksheet and the parts of the package are reported as they are read or
+written, and so are the bytes written to the archive. Each report is also a
+chance to stop: :class:`~openpyxl.utils.exceptions.OperationCancelled` is
+raised if the token has been cancelled and
+:class:`~openpyxl.utils.exceptions.DeadlineExceeded` if the deadline has
+passed::
+
+    from openpyxl.utils.progress import CancelToken, monitoring
+
+    with monitoring(callback=print, timeout=30):
+        wb = load_workbook("big.xlsx")
+
+Worksheets in read-only mode are monitored while they are iterated over.
+"""
+
+from contextlib import contextmanager
+from time import monotonic
+
+from .exceptions import OperationCancelled, DeadlineExceeded
+from .tracing import ContextVar
+
+
+_monitor = ContextVar("openpyxl_monitor", default=None)
+
+
+class CancelToken(object):
+
+    """
+    Can be cancelled from another thread to stop a load or save at the next
+    opportunity
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Monitor(object):
+
+    """
+    Passes progress to `callback` and checks whether to stop.
+
+    `callback` is called with the unit ("rows", "parts" or "bytes"), the
+    number done, the total if known or None, and the path of the part
+    concerned if any. Rows are reported every `interval` rows and when a
+    worksheet is finished. `deadline` is compared with `time.monotonic()`.
+    """
+
+    def __init__(self, callback=None, token=None, deadline=None, interval=1000):
+        self.callback = callback
+        self.token = token
+        self.deadline = deadline
+        self.interval = interval
+
+
+    def check(self):
+        """
+        Raise an exception if work should stop
+        """
+        if self.token is not None and self.token.cancelled:
+            raise OperationCancelled("Cancelled")
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise DeadlineExceeded("Deadline exceeded")
+
+
+    def report(self, unit, done, total=None, part=None):
+        self.check()
+        if self.callback is not None:
+            self.callback(unit, done, total, part)
+
+
+@contextmanager
+def monitoring(callback=None, token=None, timeout=None, deadline=None,
+               interval=1000):
+    """
+    Monitor loading and saving workbooks while the block is executed.
+    `timeout` is in seconds from now, `deadline` in `time.monotonic()`
+    seconds. The earlier of the two is used.
+    """
+    if timeout is not None:
+        end = monotonic() + timeout
+        if deadline is None or end < deadline:
+            deadline = end
+    monitor = Monitor(callback, token, deadline, interval)
+    reset = _monitor.set(monitor)
+    try:
+        yield monitor
+    finally:
+        _monitor.reset(reset)
+
+
+def get_monitor():
+    """
+    The monitor in use or None
+    """
+    return _monitor.get()
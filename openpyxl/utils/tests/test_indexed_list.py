@@ -52,3 +52,14 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_copy(list):
+    from copy import copy
+    l = list(['a', 'b'])
+    cp = copy(l)
+    assert isinstance(cp, list)
+    assert cp == l
+    cp.append('c')
+    assert cp.index('c') == 2
+    assert 'c' not in l
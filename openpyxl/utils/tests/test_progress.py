@@ -0,0 +1,128 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from time import monotonic
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils.exceptions import OperationCancelled, DeadlineExceeded
+
+
+@pytest.fixture
+def monitoring():
+    from ..progress import monitoring
+    return monitoring
+
+
+@pytest.fixture
+def CancelToken():
+    from ..progress import CancelToken
+    return CancelToken
+
+
+@pytest.fixture
+def Workbook_10():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(10):
+        ws.append([row, row * 2])
+    wb.create_sheet()
+    return wb
+
+
+class TestMonitor:
+
+
+    def test_ctor(self, monitoring):
+        from ..progress import get_monitor
+        with monitoring(interval=5) as monitor:
+            assert get_monitor() is monitor
+            assert monitor.interval == 5
+            assert monitor.deadline is None
+        assert get_monitor() is None
+
+
+    def test_report(self, monitoring):
+        events = []
+        with monitoring(lambda *args: events.append(args)) as monitor:
+            monitor.report("parts", 1, 2, "xl/worksheets/sheet1.xml")
+        assert events == [("parts", 1, 2, "xl/worksheets/sheet1.xml")]
+
+
+    def test_cancel(self, monitoring, CancelToken):
+        token = CancelToken()
+        with monitoring(token=token) as monitor:
+            monitor.check()
+            token.cancel()
+            with pytest.raises(OperationCancelled):
+                monitor.check()
+
+
+    def test_timeout(self, monitoring):
+        with monitoring(timeout=-1) as monitor:
+            with pytest.raises(DeadlineExceeded):
+                monitor.check()
+
+
+    def test_earliest_deadline(self, monitoring):
+        deadline = monotonic() + 1
+        with monitoring(timeout=60, deadline=deadline) as monitor:
+            assert monitor.deadline == deadline
+
+
+def test_save_and_load(monitoring, Workbook_10, tmpdir):
+    path = str(tmpdir.join("progress.xlsx"))
+    events = []
+    with monitoring(lambda *args: events.append(args), interval=4):
+        Workbook_10.save(path)
+    assert events[:4] == [
+        ("rows", 4, None, "xl/worksheets/sheet1.xml"),
+        ("rows", 8, None, "xl/worksheets/sheet1.xml"),
+        ("rows", 10, 10, "xl/worksheets/sheet1.xml"),
+        ("parts", 1, 2, "xl/worksheets/sheet1.xml"),
+    ]
+    assert events[4][0] == "bytes"
+
+    events = []
+    with monitoring(lambda *args: events.append(args), interval=4):
+        load_workbook(path)
+    assert [e for e in events if e[0] == "parts"] == [
+        ("parts", 1, 2, "xl/worksheets/sheet1.xml"),
+        ("parts", 2, 2, "xl/worksheets/sheet2.xml"),
+    ]
+
+
+def test_cancel_save(monitoring, CancelToken, Workbook_10, tmpdir):
+    path = tmpdir.join("cancelled.xlsx")
+    token = CancelToken()
+
+    def cancel(unit, done, total, part):
+        token.cancel()
+
+    with monitoring(cancel, token=token, interval=4):
+        with pytest.raises(OperationCancelled):
+            Workbook_10.save(str(path))
+    assert not path.exists()
+
+
+def test_deadline_load(monitoring, Workbook_10, tmpdir):
+    path = str(tmpdir.join("deadline.xlsx"))
+    Workbook_10.save(path)
+    with monitoring(timeout=-1):
+        with pytest.raises(DeadlineExceeded):
+            load_workbook(path)
+
+
+def test_cancel_read_only(monitoring, CancelToken, Workbook_10, tmpdir):
+    path = str(tmpdir.join("read_only.xlsx"))
+    Workbook_10.save(path)
+    wb = load_workbook(path, read_only=True)
+    token = CancelToken()
+    token.cancel()
+    with monitoring(token=token, interval=4):
+        rows = wb.active.values
+        for idx in range(3):
+            next(rows)
+        with pytest.raises(OperationCancelled):
+            next(rows)
+    wb.close()
@@ -0,0 +1,78 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+
+
+@pytest.fixture
+def Recorder():
+    from ..tracing import Recorder
+    return Recorder
+
+
+@pytest.fixture
+def tracing():
+    from ..tracing import tracing
+    return tracing
+
+
+def test_disabled():
+    from ..tracing import span, counter, get_tracer
+    assert get_tracer() is None
+    with span("nothing", sheet="Sheet"):
+        pass
+    counter("nothing", 1)
+
+
+def test_span(Recorder, tracing):
+    from ..tracing import span
+    with tracing(Recorder()) as rec:
+        with span("outer"):
+            with span("inner", part="xl/workbook.xml"):
+                pass
+    assert [(name, attrs) for name, duration, attrs in rec.spans] == [
+        ("inner", {"part": "xl/workbook.xml"}),
+        ("outer", {}),
+    ]
+    assert set(rec.totals()) == {"inner", "outer"}
+
+
+def test_counter(Recorder, tracing):
+    from ..tracing import counter
+    with tracing(Recorder()) as rec:
+        counter("cells", 5, sheet="Sheet1")
+        counter("cells", 3, sheet="Sheet2")
+    assert rec.counters == {"cells": 8}
+
+
+def test_nested(Recorder, tracing):
+    from ..tracing import get_tracer
+    with tracing(Recorder()) as outer:
+        with tracing(Recorder()) as inner:
+            assert get_tracer() is inner
+        assert get_tracer() is outer
+    assert get_tracer() is None
+
+
+def test_save_and_load(Recorder, tracing):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(10):
+        ws.append([row, "text {0}".format(row)])
+    out = BytesIO()
+
+    with tracing(Recorder()) as rec:
+        wb.save(out)
+        load_workbook(out)
+
+    spans = {name:attrs for name, duration, attrs in rec.spans}
+    for name in ("save", "write_worksheets", "write_stylesheet", "load",
+                 "read_strings", "apply_stylesheet", "bind_cells"):
+        assert name in spans
+    assert spans["read_worksheet"] == {"sheet": "Data", "part": "xl/worksheets/sheet1.xml"}
+    assert rec.counters["cells"] == 40 # written and read
+    assert rec.counters["bytes_compressed"] > 0
@@ -0,0 +1,182 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""
+Report how long the phases of reading and writing a workbook take.
+
+Nothing is measured unless a tracer has been installed with :func:`tracing`.
+The tracer is told about each phase, such as reading the shared strings or
+writing a worksheet, when it ends and about counters such as the number of
+cells read::
+
+    from openpyxl.utils.tracing import Recorder, tracing
+
+    with tracing(Recorder()) as rec:
+        wb = load_workbook("big.xlsx")
+    print(rec.totals())
+
+Tracers are kept in a context variable so that different threads, or asyncio
+tasks, can use different tracers.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from timeit import default_timer
+
+try:
+    from contextvars import ContextVar
+except ImportError: # Python 3.6
+    ContextVar = None
+
+
+if ContextVar is None:
+    import threading
+
+    class ContextVar(threading.local):
+        """
+        Per-thread replacement for contextvars.ContextVar
+        """
+
+        def __init__(self, name, default=None):
+            self.value = default
+
+
+        def get(self):
+            return self.value
+
+
+        def set(self, value):
+            token = self.value
+            self.value = value
+            return token
+
+
+        def reset(self, token):
+            self.value = token
+
+
+_tracer = ContextVar("openpyxl_tracer", default=None)
+
+
+class Tracer(object):
+
+    """
+    Base class for tracers. Subclasses override one or both methods, for
+    example to pass the measurements on to a metrics system.
+    """
+
+    def span(self, name, duration, attrs):
+        """
+        A phase called `name` has ended after `duration` seconds. `attrs`
+        is a dictionary describing it, e.g. the title of the worksheet and
+        the path of the part being read. Phases within phases end, and are
+        reported, first.
+        """
+
+
+    def count(self, name, value, attrs):
+        """
+        Something has been counted, e.g. the number of cells read from a
+        worksheet
+        """
+
+
+class Recorder(Tracer):
+
+    """
+    Keep everything that is reported
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.counters = defaultdict(int)
+
+
+    def span(self, name, duration, attrs):
+        self.spans.append((name, duration, attrs))
+
+
+    def count(self, name, value, attrs):
+        self.counters[name] += value
+
+
+    def totals(self):
+        """
+        Total time spent in each phase
+        """
+        totals = defaultdict(float)
+        for name, duration, attrs in self.spans:
+            totals[name] += duration
+        return dict(totals)
+
+
+class _Span(object):
+
+    __slots__ = ("tracer", "name", "attrs", "start")
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+
+    def __enter__(self):
+        self.start = default_timer()
+        return self
+
+
+    def __exit__(self, *exc):
+        self.tracer.span(self.name, default_timer() - self.start, self.attrs)
+
+
+class _NoSpan(object):
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+@contextmanager
+def tracing(tracer):
+    """
+    Report to `tracer` while the block is executed
+    """
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+
+
+def get_tracer():
+    """
+    The tracer in use or None
+    """
+    return _tracer.get()
+
+
+def span(name, **attrs):
+    """
+    Context manager which measures the phase `name`. Does nothing if there
+    is no tracer.
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        return _NO_SPAN
+    return _Span(tracer, name, attrs)
+
+
+def counter(name, value, **attrs):
+    """
+    Report a counter. Does nothing if there is no tracer.
+    """
+    tracer = _tracer.get()
+    if tracer is not None:
+        tracer.count(name, value, attrs)
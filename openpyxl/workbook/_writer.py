@@ -20,6 +20,7 @@ from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.workbook.external_reference import ExternalReference
 from openpyxl.packaging.workbook import ChildSheet, WorkbookPackage, PivotCache
 from openpyxl.workbook.properties import WorkbookProperties
+from openpyxl.worksheet._opaque import is_opaque, opaque_shared_strings
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
 
 
@@ -91,8 +92,12 @@ class WorkbookWriter:
         defined_names = copy(self.wb.defined_names)
 
         # Defined names -> autoFilter
-        for idx, sheet in enumerate(self.wb.worksheets):
-            auto_filter = sheet.auto_filter.ref
+        for sheet in self.wb.worksheets:
+            # position among all sheets, including chartsheets
+            idx = self.wb._sheets.index(sheet)
+
+            # worksheets which have not been read only have print settings
+            auto_filter = not is_opaque(sheet) and sheet.auto_filter.ref
 
             if auto_filter:
                 name = DefinedName(name='_FilterDatabase', localSheetId=idx, hidden=True)
@@ -160,6 +165,10 @@ class WorkbookWriter:
         theme =  Relationship(type='theme', Target='theme/theme1.xml')
         self.rels.append(theme)
 
+        if opaque_shared_strings(self.wb) is not None:
+            strings = Relationship(type='sharedStrings', Target='sharedStrings.xml')
+            self.rels.append(strings)
+
         if self.wb.vba_archive:
             vba =  Relationship(type='', Target='vbaProject.bin')
             vba.Type ='http://schemas.microsoft.com/office/2006/relationships/vbaProject'
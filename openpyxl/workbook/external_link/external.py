@@ -19,6 +19,7 @@ from openpyxl.packaging.relationship import (
     get_rels_path,
     get_dependents
     )
+from openpyxl.packaging._parts import RawMember
 from openpyxl.xml.constants import SHEET_MAIN_NS
 from openpyxl.xml.functions import fromstring
 
@@ -178,13 +179,46 @@ class ExternalLink(Serialisable):
         return self._path.format(self._id)
 
 
+class StoredExternalLink:
+
+    """
+    An external link which has been read but not parsed. It becomes an
+    ExternalLink the first time it is used and is copied unchanged
+    otherwise.
+    """
+
+    _id = None
+    _path = ExternalLink._path
+    _rel_type = ExternalLink._rel_type
+    mime_type = ExternalLink.mime_type
+    path = ExternalLink.path
+
+
+    def __init__(self, src, file_link):
+        self._src = src
+        self.file_link = file_link
+
+
+    def __getattr__(self, name):
+        # only called for attributes which have not been set yet
+        if name.startswith("__") or "_src" not in self.__dict__:
+            raise AttributeError(name)
+        src = self.__dict__.pop("_src")
+        link = ExternalLink.from_tree(fromstring(src.read()))
+        self.__dict__.update(link.__dict__)
+        self.__class__ = ExternalLink
+        return getattr(self, name)
+
+
+    def _write(self, archive):
+        self._src.write(archive, self.path[1:])
+
+
 def read_external_link(archive, book_path):
-    src = archive.read(book_path)
-    node = fromstring(src)
-    book = ExternalLink.from_tree(node)
+    src = RawMember.from_archive(archive, book_path)
 
     link_path = get_rels_path(book_path)
     deps = get_dependents(archive, link_path)
-    book.file_link = deps.Relationship[0]
+    book = StoredExternalLink(src, deps.Relationship[0])
 
     return book
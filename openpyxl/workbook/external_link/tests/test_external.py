@@ -143,6 +143,20 @@ def test_read_external_link(datadir):
     assert book.file_link.Target == "book2.xlsx"
 
 
+def test_parse_stored_link(datadir, ExternalLink):
+    from openpyxl.packaging.relationship import get_dependents
+    from .. external import read_external_link, StoredExternalLink
+    datadir.chdir()
+    archive = ZipFile("book1.xlsx")
+    rels = get_dependents(archive, ARC_WORKBOOK_RELS)
+    book = read_external_link(archive, rels["rId4"].Target)
+    assert isinstance(book, StoredExternalLink)
+
+    assert book.externalBook.sheetNames.sheetName == ['Sheet1', 'Sheet2', 'Sheet3']
+    assert isinstance(book, ExternalLink)
+    assert book.file_link.Target == "book2.xlsx"
+
+
 def test_write_workbook(datadir, tmpdir):
     datadir.chdir()
     src = ZipFile("book1.xlsx")
@@ -162,3 +176,18 @@ def test_write_workbook(datadir, tmpdir):
     orig_files.discard("xl/calcChain.xml")
 
     assert orig_files == out_files
+
+
+def test_write_stored_link(datadir, tmpdir):
+    datadir.chdir()
+    src = ZipFile("book1.xlsx")
+    link = "xl/externalLinks/externalLink1.xml"
+    expected = src.getinfo(link).compress_size, src.read(link)
+
+    from openpyxl import load_workbook
+    wb = load_workbook("book1.xlsx")
+    tmpdir.chdir()
+    wb.save("book1.xlsx")
+
+    archive = ZipFile("book1.xlsx")
+    assert (archive.getinfo(link).compress_size, archive.read(link)) == expected
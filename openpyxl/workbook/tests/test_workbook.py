@@ -324,3 +324,49 @@ class TestCopy:
         ws = wb.create_sheet()
         with pytest.raises(ValueError):
             wb.copy_worksheet(ws)
+
+
+    def test_clone(self, Workbook):
+        from openpyxl.styles import Font
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "Template"
+        ws["A1"].font = Font(b=True)
+        wb.create_sheet("Hidden").sheet_state = "hidden"
+        wb.loaded_theme = b"theme"
+
+        cp = wb.clone()
+        assert cp.sheetnames == ["Sheet", "Hidden"]
+        assert cp["Hidden"].sheet_state == "hidden"
+        assert cp.loaded_theme is wb.loaded_theme
+        assert cp._fonts == wb._fonts
+        assert cp._fonts is not wb._fonts
+        assert cp._named_styles[0]._wb is cp
+
+        cp.active["A1"].font = Font(i=True)
+        assert len(cp._fonts) == len(wb._fonts) + 1
+        assert ws["A1"].font.b is True
+        assert ws["A1"].font.i is False
+
+
+    def test_clone_not_used(self, Workbook):
+        from openpyxl.worksheet._clone import ClonedWorksheet
+        wb = Workbook()
+        cp = wb.clone()
+        cp.active.title = "Report"
+        cp.create_sheet("New")
+        assert isinstance(cp["Report"], ClonedWorksheet)
+        assert wb.sheetnames == ["Sheet"]
+
+
+    def test_cannot_clone_readonly(self, Workbook):
+        wb = Workbook()
+        wb._read_only = True
+        with pytest.raises(ValueError):
+            wb.clone()
+
+
+    def test_cannot_clone_writeonly(self, Workbook):
+        wb = Workbook(write_only=True)
+        with pytest.raises(ValueError):
+            wb.clone()
@@ -1,12 +1,14 @@
 # Copyright (c) 2010-2019 openpyxl
 
 """Workbook is the top-level container for all document information."""
-from copy import copy
+from copy import copy, deepcopy
 
 from openpyxl.compat import deprecated
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet._opaque import OpaqueWorksheet, load_lazy_worksheets
+from openpyxl.worksheet._clone import ClonedWorksheet
 from openpyxl.worksheet.copier import WorksheetCopy
 
 from openpyxl.utils import quote_sheetname
@@ -14,8 +16,6 @@ from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900
 from openpyxl.utils.exceptions import ReadOnlyWorkbookException
 
-from openpyxl.writer.excel import save_workbook
-
 from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles.named_styles import NamedStyle
 from openpyxl.styles.differential import DifferentialStyleList
@@ -27,8 +27,8 @@ from openpyxl.styles.protection import Protection
 from openpyxl.styles.colors import COLOR_INDEX
 from openpyxl.styles.named_styles import NamedStyleList
 from openpyxl.styles.table import TableStyleList
+from openpyxl.styles.stylesheet import compact_styles
 
-from openpyxl.chartsheet import Chartsheet
 from .defined_name import DefinedName, DefinedNameList
 from openpyxl.packaging.core import DocumentProperties
 from openpyxl.packaging.relationship import RelationshipList
@@ -52,6 +52,8 @@ class Workbook(object):
 
     _read_only = False
     _data_only = False
+    _cached_values = False
+    compact_styles_on_save = False
     template = False
     path = "/xl/workbook.xml"
 
@@ -123,6 +125,11 @@ class Workbook(object):
     def data_only(self):
         return self._data_only
 
+
+    @property
+    def cached_values(self):
+        return self._cached_values
+
     @property
     def write_only(self):
         return self.__write_only
@@ -187,6 +194,7 @@ class Workbook(object):
 
     def _add_sheet(self, sheet, index=None):
         """Add an worksheet (at an optional index)."""
+        from openpyxl.chartsheet import Chartsheet
 
         if not isinstance(sheet, (Worksheet, WriteOnlyWorksheet, Chartsheet)):
             raise TypeError("Cannot be added to a workbook")
@@ -204,7 +212,7 @@ class Workbook(object):
         """
         Move a sheet or sheetname
         """
-        if not isinstance(sheet, Worksheet):
+        if not isinstance(sheet, (Worksheet, OpaqueWorksheet)):
             sheet = self[sheet]
         idx = self._sheets.index(sheet)
         del self._sheets[idx]
@@ -230,6 +238,7 @@ class Workbook(object):
     def create_chartsheet(self, title=None, index=None):
         if self.read_only:
             raise ReadOnlyWorkbookException("Cannot create new sheet in a read-only workbook")
+        from openpyxl.chartsheet import Chartsheet
         cs = Chartsheet(parent=self, title=title)
 
         self._add_sheet(cs, index)
@@ -290,7 +299,7 @@ class Workbook(object):
 
         :type: list of :class:`openpyxl.worksheet.worksheet.Worksheet`
         """
-        return [s for s in self._sheets if isinstance(s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet))]
+        return [s for s in self._sheets if isinstance(s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet, OpaqueWorksheet))]
 
     @property
     def chartsheets(self):
@@ -298,6 +307,7 @@ class Workbook(object):
 
         :type: list of :class:`openpyxl.chartsheet.chartsheet.Chartsheet`
         """
+        from openpyxl.chartsheet import Chartsheet
         return [s for s in self._sheets if isinstance(s, Chartsheet)]
 
     @property
@@ -389,9 +399,21 @@ class Workbook(object):
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
+        from openpyxl.writer.excel import save_workbook
         save_workbook(self, filename)
 
 
+    def compact_styles(self):
+        """
+        Remove styles which are not used by any cell, row or column and
+        merge those which are the same. Named styles are always kept.
+
+        This is done when the workbook is saved if `compact_styles_on_save`
+        is set.
+        """
+        compact_styles(self)
+
+
     @property
     def style_names(self):
         """
@@ -420,9 +442,54 @@ class Workbook(object):
         return to_worksheet
 
 
+    def clone(self):
+        """Copy the workbook cheaply
+
+        The styles, the theme, charts, images and pivot tables are shared
+        with the copy, so it is not entirely independent of the original.
+        Worksheets are not copied straight away. Each one is copied in full
+        the first time it is used, even if only to read a cell. Worksheets
+        which are never used are never copied and keep referring to the
+        original.
+
+        .. warning::
+            Do not change the original while any clones have worksheets
+            which have not been used yet, they will see the changes.
+
+        :return: the copy
+        """
+        if self.__write_only or self._read_only:
+            raise ValueError("Cannot clone workbooks in read-only or write-only mode")
+        if any(isinstance(ws, OpaqueWorksheet) for ws in self._sheets):
+            raise ValueError("Cannot clone workbooks with worksheets which have not been loaded")
+        load_lazy_worksheets(self)
+
+        wb = self.__class__.__new__(self.__class__)
+        memo = {id(self): wb}
+        for key, value in self.__dict__.items():
+            if key in ("_sheets", "_archive"):
+                continue
+            if isinstance(value, IndexedList):
+                value = copy(value)
+            elif key == "_pivots":
+                value = list(value)
+            elif key not in ("loaded_theme", "vba_archive", "_colors"):
+                value = deepcopy(value, memo)
+            wb.__dict__[key] = value
+
+        wb._sheets = []
+        for ws in self._sheets:
+            if isinstance(ws, Worksheet):
+                ws = ClonedWorksheet(wb, ws)
+            else:
+                ws = deepcopy(ws, memo)
+            wb._sheets.append(ws)
+        return wb
+
+
     def close(self):
         """
-        Close workbook file if open. Only affects read-only and write-only modes.
+        Close workbook file if open. Only affects read-only, write-only and lazy modes.
         """
         if hasattr(self, '_archive'):
             self._archive.close()
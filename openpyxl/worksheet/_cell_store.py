@@ -0,0 +1,299 @@
+# Copyright (c) 2010-2019 openpyxl
+
+"""Storage of the cells of a worksheet"""
+
+from bisect import bisect_left, bisect_right
+
+
+class CellStore(dict):
+    """
+    Dictionary of cells keyed by (row, column) which keeps an index of the
+    columns in each row. This allows existing cells to be visited in order
+    without having to sort all of them.
+
+    Rows and columns are usually added in order. If not, they are sorted
+    the next time the index is used.
+    """
+
+
+    def __init__(self, *args, **kw):
+        super(CellStore, self).__init__()
+        self._rows = {}
+        self._new = [] # keys added since the index was last used
+        self._dirty = set() # rows from which cells have been removed since
+        self._unsorted = set()
+        self._rows_sorted = True
+        self._row_list = None
+        self._last_row = 0
+        self.update(*args, **kw)
+
+
+    def __setitem__(self, key, cell):
+        if key not in self:
+            self._new.append(key)
+        dict.__setitem__(self, key, cell)
+
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._dirty.add(key[0])
+
+
+    def pop(self, key, *default):
+        if key in self:
+            self._dirty.add(key[0])
+        return dict.pop(self, key, *default)
+
+
+    def popitem(self):
+        key, cell = dict.popitem(self)
+        self._dirty.add(key[0])
+        return key, cell
+
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+    def update(self, *args, **kw):
+        cells = dict(*args, **kw)
+        if self.keys().isdisjoint(cells):
+            self._new.extend(cells)
+        else:
+            self._new.extend(key for key in cells if key not in self)
+        dict.update(self, cells)
+
+
+    def clear(self):
+        dict.clear(self)
+        self._rows = {}
+        self._new = []
+        self._dirty = set()
+        self._unsorted = set()
+        self._rows_sorted = True
+        self._row_list = None
+        self._last_row = 0
+
+
+    def bulk_update(self, cells):
+        """
+        Add many cells at once. Quicker than adding them one at a time
+        because the index is rebuilt afterwards.
+        """
+        dict.update(self, cells)
+        rows = {}
+        for row, col in self:
+            cols = rows.get(row)
+            if cols is None:
+                rows[row] = [col]
+            else:
+                cols.append(col)
+        self._rows = rows
+        self._new = []
+        self._dirty = set()
+        self._unsorted = set(rows)
+        self._rows_sorted = False
+        self._row_list = None
+        self._last_row = 0
+
+
+    def move_rows(self, min_row, offset):
+        """
+        Move the rows from `min_row` onwards by `offset` and update the
+        coordinates of their cells. Cells which are in the way are
+        overwritten and returned. The columns of each row move with it so
+        the index need not be rebuilt.
+        """
+        rows = self.row_indices
+        start = bisect_left(rows, min_row)
+        moved = rows[start:]
+        if offset > 0: # start at the end if inserting
+            moved.reverse()
+
+        # the methods of dict are used directly, bypassing the index
+        pop = dict.pop.__get__(self)
+        get = dict.get.__get__(self)
+        setitem = dict.__setitem__.__get__(self)
+        index = self._rows
+        overwritten = []
+        for row in moved:
+            cols = index.pop(row)
+            dest = row + offset
+            for col in cols:
+                cell = pop((row, col))
+                old = get((dest, col))
+                if old is not None:
+                    overwritten.append(old)
+                setitem((dest, col), cell)
+                cell.row = dest
+            existing = index.get(dest)
+            if existing:
+                cols = sorted(set(existing).union(cols))
+            index[dest] = cols
+        self._rows_sorted = False
+        self._row_list = None
+        return overwritten
+
+
+    def move_cols(self, min_col, offset):
+        """
+        Move the columns from `min_col` onwards by `offset` and update the
+        coordinates of their cells. Cells which are in the way are
+        overwritten and returned.
+        """
+        self._sort()
+
+        # the methods of dict are used directly, bypassing the index
+        pop = dict.pop.__get__(self)
+        get = dict.get.__get__(self)
+        setitem = dict.__setitem__.__get__(self)
+        index = self._rows
+        overwritten = []
+        for row, cols in index.items():
+            first = bisect_left(cols, min_col)
+            moved = cols[first:]
+            if not moved:
+                continue
+            if offset > 0: # start at the end if inserting
+                moved.reverse()
+            for col in moved:
+                cell = pop((row, col))
+                dest = col + offset
+                old = get((row, dest))
+                if old is not None:
+                    overwritten.append(old)
+                setitem((row, dest), cell)
+                cell.column = dest
+            kept = cols[:first]
+            shifted = [col + offset for col in cols[first:]]
+            if kept and kept[-1] >= shifted[0]:
+                cols[:] = sorted(set(kept).union(shifted))
+            else:
+                cols[first:] = shifted
+        return overwritten
+
+
+    def __reduce__(self):
+        return self.__class__, (), None, None, iter(self.items())
+
+
+    def _update_index(self):
+        """
+        Add the cells which have been added and remove those which have been
+        removed from the index. Rows from which cells have been removed are
+        rebuilt once, however many cells have been removed or moved.
+        """
+        rows = self._rows
+        for row, col in self._new:
+            cols = rows.get(row)
+            if cols is None:
+                if row < self._last_row:
+                    self._rows_sorted = False
+                self._last_row = row
+                rows[row] = [col]
+                self._row_list = None
+            else:
+                if col < cols[-1]:
+                    self._unsorted.add(row)
+                cols.append(col)
+        self._new = []
+
+        for row in self._dirty:
+            cols = rows.get(row)
+            if cols is None:
+                continue
+            # cells removed and added again are in the index twice
+            cols = [col for col in dict.fromkeys(cols) if (row, col) in self]
+            if cols:
+                rows[row] = cols
+            else:
+                del rows[row]
+                self._unsorted.discard(row)
+                self._row_list = None
+        self._dirty.clear()
+
+
+    def _sort(self):
+        self._update_index()
+        if not self._rows_sorted:
+            rows = sorted(self._rows)
+            self._rows = {row:self._rows[row] for row in rows}
+            self._rows_sorted = True
+            self._row_list = rows
+            self._last_row = rows and rows[-1] or 0
+        for row in self._unsorted:
+            self._rows[row].sort()
+        self._unsorted.clear()
+
+
+    @property
+    def row_indices(self):
+        """
+        Sorted list of the rows containing cells
+        """
+        self._sort()
+        if self._row_list is None:
+            self._row_list = list(self._rows)
+        return self._row_list
+
+
+    def columns(self, row):
+        """
+        Sorted list of the columns with cells in a row
+        """
+        self._sort()
+        return self._rows.get(row, [])
+
+
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None):
+        """
+        Produce the rows containing cells within the bounds given and the
+        cells in them, in order. Unbounded if no limits are given.
+        """
+        rows = self.row_indices
+        start = 0
+        stop = len(rows)
+        if min_row is not None:
+            start = bisect_left(rows, min_row)
+        if max_row is not None:
+            stop = bisect_right(rows, max_row)
+
+        for idx in range(start, stop):
+            row = rows[idx]
+            cols = self._rows[row]
+            first = 0
+            last = len(cols)
+            if min_col is not None:
+                first = bisect_left(cols, min_col)
+            if max_col is not None:
+                last = bisect_right(cols, max_col)
+            if first < last:
+                yield row, [self[row, col] for col in cols[first:last]]
+
+
+    @property
+    def min_row(self):
+        rows = self.row_indices
+        if rows:
+            return rows[0]
+
+
+    @property
+    def max_row(self):
+        rows = self.row_indices
+        if rows:
+            return rows[-1]
+
+
+    @property
+    def min_col(self):
+        self._sort()
+        return min((cols[0] for cols in self._rows.values()), default=None)
+
+
+    @property
+    def max_col(self):
+        self._sort()
+        return max((cols[-1] for cols in self._rows.values()), default=None)
@@ -0,0 +1,133 @@
+# Copyright (c) 2010-2019 openpyxl
+
+""" Worksheets of cloned workbooks which share the contents of the original
+"""
+
+from array import array
+from copy import copy, deepcopy
+
+from openpyxl.cell import Cell, MergedCell
+from openpyxl.styles.cell_style import StyleArray
+
+from .worksheet import Worksheet
+
+
+# drawings and pivot tables are shared, only the lists holding them are copied
+SHARED = ("_charts", "_images", "_pivots", "_drawing")
+# set when the worksheet is created or copied separately, or only used when
+# it is saved
+SKIPPED = ("_parent", "_WorkbookChild__title", "sheet_state", "_id", "_source",
+           "_cells", "_formula_values", "_hyperlinks", "_comments")
+# can be set without copying the worksheet
+STUB = ("title", "_WorkbookChild__title", "sheet_state", "_id")
+
+
+class ClonedWorksheet(Worksheet):
+
+    """
+    A worksheet of a cloned workbook. Until it is used it only refers to the
+    worksheet it was cloned from. The first use of any kind, even reading a
+    single cell, copies the whole worksheet, which then becomes a normal
+    worksheet. Renaming or hiding it does not copy it.
+
+    Do not create these yourself, use
+    :meth:`openpyxl.workbook.workbook.Workbook.clone`
+    """
+
+    def __init__(self, parent, source):
+        # the original of a worksheet which has not been copied yet
+        source = source.__dict__.get("_source", source)
+        self._parent = parent
+        self.title = source.title
+        self.sheet_state = source.sheet_state
+        self._source = source
+
+
+    def __getattr__(self, name):
+        # only called for attributes which have not been set yet
+        if name.startswith("__") or "_source" not in self.__dict__:
+            raise AttributeError(name)
+        self._load()
+        return getattr(self, name)
+
+
+    def __setattr__(self, name, value):
+        # anything else would be lost when the worksheet is copied
+        if name not in STUB and "_source" in self.__dict__:
+            self._load()
+        Worksheet.__setattr__(self, name, value)
+
+
+    def _load(self):
+        stub = dict(self.__dict__)
+        source = self.__dict__.pop("_source")
+        sheet_state = self.sheet_state
+        self.__class__ = Worksheet
+        self._setup()
+        self.sheet_state = sheet_state
+        try:
+            copy_worksheet(source, self)
+        except BaseException:
+            # a partly copied worksheet must not lose the rest of the original
+            self.__dict__.clear()
+            self.__dict__.update(stub)
+            self.__class__ = ClonedWorksheet
+            raise
+
+
+def copy_worksheet(source, target):
+    """
+    Copy the contents of a worksheet to one in another workbook with the
+    same styles
+    """
+    memo = {id(source): target, id(source.parent): target.parent}
+    for key, value in source.__dict__.items():
+        if key in SKIPPED:
+            continue
+        if key in SHARED:
+            if isinstance(value, list):
+                value = list(value)
+        else:
+            value = deepcopy(value, memo)
+        target.__dict__[key] = value
+    copy_cells(source, target)
+
+
+def copy_cells(source, target):
+    new_cell = Cell.__new__
+    new_style = array.__new__
+    cells = {}
+    extras = []
+    for key, cell in source._cells.items():
+        style = cell._style
+        if style is not None:
+            style = new_style(StyleArray, "i", style)
+        if isinstance(cell, MergedCell):
+            c = MergedCell(target, *key)
+            c._style = style
+        else:
+            # the values have already been checked so Cell.__init__ is bypassed
+            c = new_cell(Cell)
+            c.parent = target
+            c._style = style
+            c.row, c.column = key
+            c._value = cell._value
+            c.data_type = cell.data_type
+            c._hyperlink = None
+            c._comment = None
+            if cell._hyperlink is not None or cell._comment is not None:
+                extras.append((c, cell))
+        cells[key] = c
+    target._cells.bulk_update(cells)
+
+    for c, cell in extras:
+        if cell._hyperlink is not None:
+            c._hyperlink = copy(cell._hyperlink)
+        c.comment = cell._comment # copied because it belongs to the original
+
+    formula_values = {}
+    for cell, value in source._formula_values.items():
+        key = cell.row, cell.column
+        if source._cells.get(key) is cell: # not removed
+            formula_values[cells[key]] = value
+    target._formula_values = formula_values
@@ -0,0 +1,157 @@
+# Copyright (c) 2010-2019 openpyxl
+
+""" Worksheets which are kept as they were read
+"""
+
+import os
+
+from openpyxl.packaging._parts import PartSet
+from openpyxl.workbook.child import _WorkbookChild
+
+from .worksheet import Worksheet
+
+
+# print titles and areas are defined names of the workbook so they are kept
+# when the worksheet is read
+PRINT = ("_print_rows", "_print_cols", "_print_area")
+# can be set without reading the worksheet
+STUB = ("title", "_WorkbookChild__title", "sheet_state", "_id", "_source",
+        "_shared_strings", "print_title_rows", "print_title_cols",
+        "print_area") + PRINT
+
+
+class OpaqueWorksheet(_WorkbookChild):
+
+    """
+    A worksheet which has not been loaded. It can be renamed, hidden, moved
+    or removed and its print titles and print area can be changed, but its
+    contents cannot be accessed. When the workbook is saved the worksheet
+    and everything it refers to are copied unchanged from the source.
+
+    Do not create these yourself, use the `sheets` argument of
+    :func:`openpyxl.reader.excel.load_workbook`
+    """
+
+    _rel_type = Worksheet._rel_type
+    _path = Worksheet._path
+    mime_type = Worksheet.mime_type
+
+    print_title_rows = Worksheet.print_title_rows
+    print_title_cols = Worksheet.print_title_cols
+    print_titles = Worksheet.print_titles
+    print_area = Worksheet.print_area
+
+
+    def __init__(self, parent, title, parts, shared_strings=None):
+        _WorkbookChild.__init__(self, parent, title)
+        self._parts = parts
+        self._shared_strings = shared_strings
+        self.sheet_state = "visible"
+        self._print_rows = None
+        self._print_cols = None
+        self._print_area = None
+
+
+class LazyWorksheet(Worksheet):
+
+    """
+    A worksheet which is read from the source the first time any of its
+    contents are used. It then becomes a normal worksheet. If this never
+    happens the worksheet is copied unchanged when the workbook is saved.
+
+    Do not create these yourself, use the `lazy` argument of
+    :func:`openpyxl.reader.excel.load_workbook`
+    """
+
+    def __init__(self, parent, title, loader, archive, path, manifest,
+                 shared_strings=None):
+        _WorkbookChild.__init__(self, parent, title)
+        self.sheet_state = "visible"
+        self._print_rows = None
+        self._print_cols = None
+        self._print_area = None
+        self._loader = loader
+        self._source = archive, path, manifest
+        self._shared_strings = shared_strings
+
+
+    def __getattr__(self, name):
+        # only called for attributes which have not been set yet
+        if name.startswith("__") or "_loader" not in self.__dict__:
+            raise AttributeError(name)
+        self._load()
+        return getattr(self, name)
+
+
+    def __setattr__(self, name, value):
+        # anything else would be lost when the worksheet is read
+        if name not in STUB and "_loader" in self.__dict__:
+            self._load()
+        Worksheet.__setattr__(self, name, value)
+
+
+    def _load(self):
+        stub = dict(self.__dict__)
+        loader = self.__dict__.pop("_loader")
+        del self._source
+        del self._shared_strings
+
+        kept = dict((key, getattr(self, key)) for key in ("sheet_state",) + PRINT)
+        self.__class__ = Worksheet
+        self._setup()
+        self.__dict__.update(kept)
+        try:
+            loader(self)
+        except BaseException:
+            # a partly read worksheet must not replace the source when saved
+            self.__dict__.clear()
+            self.__dict__.update(stub)
+            self.__class__ = LazyWorksheet
+            raise
+
+
+    @property
+    def _parts(self):
+        archive, path, manifest = self._source
+        return PartSet.from_archive(archive, path, manifest, lazy=True)
+
+
+def is_opaque(ws):
+    """
+    Check whether a worksheet will be copied from the source when saved
+    """
+    return isinstance(ws, (OpaqueWorksheet, LazyWorksheet))
+
+
+def opaque_shared_strings(wb):
+    """
+    The shared strings table that opaque worksheets in the workbook refer to
+    """
+    for ws in wb._sheets:
+        if is_opaque(ws) and ws._shared_strings is not None:
+            return ws._shared_strings
+
+
+def load_lazy_worksheets(wb):
+    """
+    Read all worksheets which have not been read yet
+    """
+    for ws in wb._sheets:
+        if isinstance(ws, LazyWorksheet):
+            ws._load()
+
+
+def release_source(wb, filename):
+    """
+    Read all worksheets before the file they are read from is overwritten
+    """
+    archive = getattr(wb, "_archive", None)
+    if archive is None or archive.fp is None:
+        return
+
+    same = filename is archive.fp
+    if not same and isinstance(filename, (str, os.PathLike)) and archive.filename:
+        same = os.path.abspath(filename) == os.path.abspath(archive.filename)
+    if same:
+        load_lazy_worksheets(wb)
+        archive.close()
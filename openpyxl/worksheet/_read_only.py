@@ -5,9 +5,12 @@
 
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
 from openpyxl.utils import get_column_letter
+from openpyxl.xml.functions import fromstring
 
 from ._reader import WorkSheetParser
+from .table import Table
 
 
 def read_dimension(source):
@@ -20,6 +23,7 @@ class ReadOnlyWorksheet(object):
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _tables = None
 
     # from Standard Worksheet
     # Methods from Worksheet
@@ -74,27 +78,29 @@ class ReadOnlyWorksheet(object):
         src = self._get_source()
         parser = WorkSheetParser(src, self._shared_strings,
                                  data_only=self.parent.data_only, epoch=self.parent.epoch,
-                                 date_formats=self.parent._date_formats)
-        for idx, row in parser.parse():
-            if max_row is not None and idx > max_row:
-                break
-
-            # some rows are missing
-            for _ in range(counter, idx):
-                counter += 1
-                yield empty_row
-
-            # return cells from a row
-            if counter <= idx:
-                row = self._get_row(row, min_col, max_col, values_only)
-                counter += 1
-                yield row
-
-        if max_row is not None and max_row < idx:
-            for _ in range(counter, max_row+1):
-                yield empty_row
-
-        src.close()
+                                 date_formats=self.parent._date_formats,
+                                 cached_values=self.parent.cached_values)
+        try:
+            for idx, row in parser.parse():
+                if max_row is not None and idx > max_row:
+                    break
+
+                # some rows are missing
+                for _ in range(counter, idx):
+                    counter += 1
+                    yield empty_row
+
+                # return cells from a row
+                if counter <= idx:
+                    row = self._get_row(row, min_col, max_col, values_only)
+                    counter += 1
+                    yield row
+
+            if max_row is not None and max_row < idx:
+                for _ in range(counter, max_row+1):
+                    yield empty_row
+        finally:
+            src.close()
 
 
     def _get_row(self, row, min_col=1, max_col=None, values_only=False):
@@ -130,6 +136,25 @@ class ReadOnlyWorksheet(object):
         return EMPTY_CELL
 
 
+    @property
+    def tables(self):
+        """
+        Tables in the worksheet by name. Their data is read from the source
+        when it is used.
+        """
+        if self._tables is None:
+            self._tables = {}
+            archive = self.parent._archive
+            rels_path = get_rels_path(self._worksheet_path)
+            if rels_path in archive.namelist():
+                rels = get_dependents(archive, rels_path)
+                for rel in rels.find(Table._rel_type):
+                    table = Table.from_tree(fromstring(archive.read(rel.target)))
+                    table._worksheet = self
+                    self._tables[table.displayName] = table
+        return self._tables
+
+
     def calculate_dimension(self, force=False):
         if not all([self.max_column, self.max_row]):
             if force:
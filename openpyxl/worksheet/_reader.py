@@ -12,7 +12,6 @@ from openpyxl.cell import Cell, MergedCell
 from openpyxl.cell.text import Text
 from openpyxl.worksheet.dimensions import (
     ColumnDimension,
-    RowDimension,
     SheetFormatProperties,
 )
 
@@ -27,6 +26,8 @@ from openpyxl.utils import (
     coordinate_to_tuple,
     )
 from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
+from openpyxl.utils.progress import get_monitor
+from openpyxl.utils.tracing import span, counter
 from openpyxl.descriptors.excel import ExtensionList
 
 from .filters import AutoFilter
@@ -85,18 +86,19 @@ def _cast_number(value):
 class WorkSheetParser(object):
 
     def __init__(self, src, shared_strings, data_only=False,
-                 epoch=WINDOWS_EPOCH, date_formats=set()):
+                 epoch=WINDOWS_EPOCH, date_formats=set(), cached_values=False):
         self.min_row = self.min_col = None
         self.epoch = epoch
         self.source = src
         self.shared_strings = shared_strings
         self.data_only = data_only
+        self.cached_values = cached_values and not data_only
         self.shared_formulae = {}
         self.array_formulae = {}
         self.row_counter = self.col_counter = 0
         self.tables = TablePartList()
         self.date_formats = date_formats
-        self.row_dimensions = {}
+        self.row_dimensions = []
         self.column_dimensions = {}
         self.number_formats = []
         self.keep_vba = False
@@ -137,6 +139,12 @@ class WorkSheetParser(object):
 
         }
 
+        monitor = get_monitor()
+        if monitor is not None:
+            interval = monitor.interval
+            part = getattr(self.source, "name", None)
+            rows = 0
+
         it = iterparse(self.source)
 
         for _, element in it:
@@ -152,14 +160,22 @@ class WorkSheetParser(object):
             elif tag_name == ROW_TAG:
                 row = self.parse_row(element)
                 element.clear()
+                if monitor is not None:
+                    rows += 1
+                    if not rows % interval:
+                        monitor.report("rows", rows, part=part)
                 yield row
 
+        if monitor is not None:
+            monitor.report("rows", rows, rows, part)
+
 
     def parse_dimensions(self):
         """
         Get worksheet dimensions if they are provided.
+        Only the part of the worksheet before the cells is read.
         """
-        it = iterparse(self.source)
+        it = iterparse(self.source, events=("start",))
 
         for _event, element in it:
             if element.tag == DIMENSION_TAG:
@@ -169,7 +185,6 @@ class WorkSheetParser(object):
             elif element.tag == DATA_TAG:
                 # Dimensions missing
                 break
-            element.clear()
 
 
     def parse_cell(self, element):
@@ -190,30 +205,15 @@ class WorkSheetParser(object):
         else:
             row, column = self.row_counter, self.col_counter
 
+        cached = None
         if not self.data_only and element.find(FORMULA_TAG) is not None:
+            if self.cached_values and value is not None:
+                cached = self.cast_value(value, data_type, style_id, coordinate)[0]
             data_type = 'f'
             value = self.parse_formula(element)
 
         elif value is not None:
-            if data_type == 'n':
-                value = _cast_number(value)
-                if style_id in self.date_formats:
-                    data_type = 'd'
-                    try:
-                        value = from_excel(value, self.epoch)
-                    except ValueError:
-                        msg = """Cell {0} is marked as a date but the serial value {1} is outside the limits for dates. The cell will be treated as an error.""".format(coordinate, value)
-                        warn(msg)
-                        data_type = "e"
-                        value = "#VALUE!"
-            elif data_type == 's':
-                value = self.shared_strings[int(value)]
-            elif data_type == 'b':
-                value = bool(int(value))
-            elif data_type == "str":
-                data_type = "s"
-            elif data_type == 'd':
-                value = from_ISO8601(value)
+            value, data_type = self.cast_value(value, data_type, style_id, coordinate)
 
         elif data_type == 'inlineStr':
                 child = element.find(INLINE_STRING)
@@ -222,7 +222,37 @@ class WorkSheetParser(object):
                     richtext = Text.from_tree(child)
                     value = richtext.content
 
-        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        cell = {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        if cached is not None:
+            cell['cached_value'] = cached
+        return cell
+
+
+    def cast_value(self, value, data_type, style_id, coordinate):
+        """
+        Convert the value of a cell to the Python type for its data type.
+        Returns the value and data type.
+        """
+        if data_type == 'n':
+            value = _cast_number(value)
+            if style_id in self.date_formats:
+                data_type = 'd'
+                try:
+                    value = from_excel(value, self.epoch)
+                except ValueError:
+                    msg = """Cell {0} is marked as a date but the serial value {1} is outside the limits for dates. The cell will be treated as an error.""".format(coordinate, value)
+                    warn(msg)
+                    data_type = "e"
+                    value = "#VALUE!"
+        elif data_type == 's':
+            value = self.shared_strings[int(value)]
+        elif data_type == 'b':
+            value = bool(int(value))
+        elif data_type == "str":
+            data_type = "s"
+        elif data_type == 'd':
+            value = from_ISO8601(value)
+        return value, data_type
 
 
     def parse_formula(self, element):
@@ -266,15 +296,26 @@ class WorkSheetParser(object):
             self.row_counter += 1
         self.col_counter = 0
 
-        keys = {k for k in attrs if not k.startswith('{')}
-        if keys - {'r', 'spans'}:
+        keys = {k for k in attrs if not k.startswith('{')} - {'r', 'spans'}
+        if keys:
             # don't create dimension objects unless they have relevant information
-            self.row_dimensions[str(self.row_counter)] = attrs
+            self.add_row_dimension(self.row_counter, {k:attrs[k] for k in keys})
 
         cells = [self.parse_cell(el) for el in row]
         return self.row_counter, cells
 
 
+    def add_row_dimension(self, row, attrs):
+        """
+        Consecutive rows with the same attributes are stored as a run
+        """
+        runs = self.row_dimensions
+        if runs and runs[-1][1] == row - 1 and runs[-1][2] == attrs:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row, attrs])
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -327,9 +368,10 @@ class WorksheetReader(object):
     Create a parser and apply it to a workbook
     """
 
-    def __init__(self, ws, xml_source, shared_strings, data_only):
+    def __init__(self, ws, xml_source, shared_strings, data_only, cached_values=False):
         self.ws = ws
-        self.parser = WorkSheetParser(xml_source, shared_strings, data_only, ws.parent.epoch, ws.parent._date_formats)
+        self.parser = WorkSheetParser(xml_source, shared_strings, data_only, ws.parent.epoch,
+                                      ws.parent._date_formats, cached_values)
         self.tables = []
 
 
@@ -341,6 +383,8 @@ class WorksheetReader(object):
                 c._value = cell['value']
                 c.data_type = cell['data_type']
                 self.ws._cells[(cell['row'], cell['column'])] = c
+                if 'cached_value' in cell:
+                    self.ws._formula_values[c] = cell['cached_value']
         self.ws.formula_attributes = self.parser.array_formulae
         if self.ws._cells:
             self.ws._current_row = self.ws.max_row # use cells not row dimensions
@@ -392,9 +436,9 @@ class WorksheetReader(object):
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        rng = self.ws.merged_cells.find(coord)
+        if rng is not None:
+            return self.ws.cell(*rng.top[0])
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
@@ -405,11 +449,11 @@ class WorksheetReader(object):
 
 
     def bind_row_dimensions(self):
-        for row, rd in self.parser.row_dimensions.items():
+        for first, last, rd in self.parser.row_dimensions:
             if 's' in rd:
                 key = int(rd['s'])
                 rd['s'] = self.ws.parent._cell_styles[key]
-            self.ws.row_dimensions[int(row)] = RowDimension(self.ws, **rd)
+            self.ws.row_dimensions.add_run(first, last, rd)
 
 
     def bind_properties(self):
@@ -423,11 +467,19 @@ class WorksheetReader(object):
 
 
     def bind_all(self):
-        self.bind_cells()
-        self.bind_merged_cells()
-        self.bind_hyperlinks()
-        self.bind_formatting()
-        self.bind_col_dimensions()
-        self.bind_row_dimensions()
+        title = self.ws.title
+        with span("bind_cells", sheet=title):
+            self.bind_cells()
+        counter("cells", len(self.ws._cells), sheet=title)
+        with span("bind_merged_cells", sheet=title):
+            self.bind_merged_cells()
+        with span("bind_hyperlinks", sheet=title):
+            self.bind_hyperlinks()
+        with span("bind_formatting", sheet=title):
+            self.bind_formatting()
+        with span("bind_col_dimensions", sheet=title):
+            self.bind_col_dimensions()
+        with span("bind_row_dimensions", sheet=title):
+            self.bind_row_dimensions()
         self.bind_tables()
         self.bind_properties()
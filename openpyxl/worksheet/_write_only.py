@@ -6,6 +6,10 @@
 from inspect import isgenerator
 
 from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.styles.styleable import StyleChange
+from openpyxl.utils import column_index_from_string
 from openpyxl.workbook.child import _WorkbookChild
 from .worksheet import Worksheet
 from openpyxl.utils.exceptions import WorkbookAlreadySaved
@@ -46,6 +50,8 @@ class WriteOnlyWorksheet(_WorkbookChild):
         super(WriteOnlyWorksheet, self).__init__(parent, title)
         self._max_col = 0
         self._max_row = 0
+        self._column_styles = {}
+        self._column_xfs = {}
         self._setup()
 
     @property
@@ -68,7 +74,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
                 while True:
                     row = (yield)
                     row = self._values_to_row(row, row_idx)
-                    self._writer.write_row(xf, row, row_idx)
+                    self._writer.write_row(xf, row, row_idx, self._column_xfs)
                     row_idx += 1
             except GeneratorExit:
                 pass
@@ -119,11 +125,40 @@ class WriteOnlyWorksheet(_WorkbookChild):
         self._rows.send(row)
 
 
+    def set_column_style(self, column, font=None, fill=None, border=None,
+                         number_format=None, alignment=None, protection=None,
+                         named_style=None):
+        """
+        Set the style of values appended to a column, which do not need to
+        be wrapped in cells. The style is only added to the workbook once.
+        Cells which have been styled themselves keep their own style.
+
+        This does not style the column itself, use `column_dimensions` for
+        this.
+
+        :param column: letter or index of the column
+        :type column: string or int
+        """
+        if isinstance(column, str):
+            column = column_index_from_string(column)
+
+        change = StyleChange(self.parent, font=font, fill=fill, border=border,
+                             number_format=number_format, alignment=alignment,
+                             protection=protection, named_style=named_style)
+        probe = WriteOnlyCell(self)
+        probe._style = change()
+        is_date = is_date_format(probe.number_format)
+
+        self._column_styles[column] = probe._style, is_date
+        self._column_xfs[column] = f"{probe.style_id}"
+
+
     def _values_to_row(self, values, row_idx):
         """
         Convert whatever has been appended into a form suitable for work_rows
         """
         cell = WriteOnlyCell(self)
+        defaults = self._column_styles
 
         for col_idx, value in enumerate(values, 1):
             if value is None:
@@ -135,6 +170,16 @@ class WriteOnlyWorksheet(_WorkbookChild):
                     cell = value
                 else:
                     raise ValueError
+            else:
+                if cell._style is not None and col_idx in defaults:
+                    # dates are given a format unless the column has one
+                    style, is_date = defaults[col_idx]
+                    if is_date:
+                        cell._style = None
+                    else:
+                        fmt = cell._style.numFmtId
+                        cell._style = StyleArray(style)
+                        cell._style.numFmtId = fmt
 
             cell.column = col_idx
             cell.row = row_idx
@@ -1,8 +1,9 @@
 # Copyright (c) 2010-2019 openpyxl
 
 import atexit
-from collections import defaultdict
+from heapq import merge
 from io import BytesIO
+from operator import itemgetter
 import os
 from tempfile import NamedTemporaryFile
 from warnings import warn
@@ -10,9 +11,11 @@ from warnings import warn
 from openpyxl.xml.functions import xmlfile
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
-from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.comments._writer import CommentWriter
 from openpyxl.packaging.relationship import Relationship, RelationshipList
 from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.utils import range_boundaries
+from openpyxl.utils.progress import get_monitor
 
 from .dimensions import SheetDimension
 from .hyperlink import HyperlinkList
@@ -46,11 +49,12 @@ class WorksheetWriter:
 
     def __init__(self, ws, out=None):
         self.ws = ws
-        self.ws._comments = []
+        self.ws._comments = CommentWriter()
         if out is None:
             out = create_temporary_file()
         self.out = out
         self._rels = RelationshipList()
+        self._row_attrs = {} # attributes of runs of row dimensions
         self.xf = self.get_stream()
         next(self.xf) # start generator
 
@@ -103,47 +107,68 @@ class WorksheetWriter:
 
 
     def rows(self):
-        """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        """
+        Produce all rows, and any cells that they contain, in order.
+        Cells are kept in order by the worksheet so only rows which have
+        dimensions but no cells need sorting.
+        """
+        cells = self.ws._cells
 
         # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
+        empty = sorted(row for row in self.ws.row_dimensions if not cells.columns(row))
 
-        return sorted(rows.items())
+        return merge(cells.iter_rows(), ((row, []) for row in empty), key=itemgetter(0))
 
 
     def write_rows(self):
         xf = self.xf.send(True)
 
+        monitor = get_monitor()
         with xf.element("sheetData"):
-            for row_idx, row in self.rows():
-                self.write_row(xf, row, row_idx)
+            if monitor is None:
+                for row_idx, row in self.rows():
+                    self.write_row(xf, row, row_idx)
+            else:
+                self._write_monitored_rows(xf, monitor)
 
         self.xf.send(None) # return control to generator
 
 
-    def write_row(self, xf, row, row_idx):
+    def _write_monitored_rows(self, xf, monitor):
+        interval = monitor.interval
+        part = self.ws.path[1:]
+        count = 0
+        for count, (row_idx, row) in enumerate(self.rows(), 1):
+            self.write_row(xf, row, row_idx)
+            if not count % interval:
+                monitor.report("rows", count, part=part)
+        monitor.report("rows", count, count, part)
+
+
+    def write_row(self, xf, row, row_idx, styles=None):
+        """
+        `styles` can map column indices to the ids of the styles used for
+        cells which are not styled themselves
+        """
         attrs = {'r': f"{row_idx}"}
         dims = self.ws.row_dimensions
-        attrs.update(dims.get(row_idx, {}))
+        attrs.update(dims.attributes(row_idx, self._row_attrs))
 
         with xf.element("row", attrs):
 
             for cell in row:
                 if cell._comment is not None:
-                    comment = CommentRecord.from_cell(cell)
-                    self.ws._comments.append(comment)
+                    self.ws._comments.add(cell)
                 if (
                     cell._value is None
                     and not cell.has_style
                     and not cell._comment
                     ):
                     continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+                styled = cell.has_style
+                if not styled and styles:
+                    styled = styles.get(cell.column)
+                write_cell(xf, self.ws, cell, styled)
 
 
     def write_protection(self):
@@ -266,11 +291,17 @@ class WorksheetWriter:
             if not table.tableColumns:
                 table._initialise_columns()
                 if table.headerRowCount:
-                    row = self.ws[table.ref][0]
-                    for cell, col in zip(row, table.tableColumns):
-                        if cell.data_type != "s":
+                    # only the header cells are needed
+                    min_col, min_row = range_boundaries(table.ref)[:2]
+                    cells = self.ws._cells
+                    for idx, col in enumerate(table.tableColumns, min_col):
+                        cell = cells.get((min_row, idx))
+                        value = None
+                        if cell is not None:
+                            value = cell.value
+                        if cell is None or cell.data_type != "s":
                             warn("File may not be readable: column headings must be strings.")
-                        col.name = str(cell.value)
+                        col.name = str(value)
             rel = Relationship(Type=table._rel_type, Target="")
             self._rels.append(rel)
             table._rel_id = rel.Id
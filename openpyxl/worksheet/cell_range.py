@@ -1,6 +1,9 @@
 # Copyright (c) 2010-2019 openpyxl
 
+from collections import defaultdict
 from copy import copy
+from itertools import chain
+import weakref
 
 from openpyxl.descriptors import Strict
 from openpyxl.descriptors import MinMax, Sequence
@@ -14,6 +17,40 @@ from openpyxl.utils import (
 )
 
 
+def _watch(obj, index):
+    """
+    Register an index to be told when an object changes
+    """
+    obj.__dict__.setdefault("_watchers", {})[id(index)] = weakref.ref(index)
+
+
+def _notify(obj):
+    """
+    Tell the indexes watching an object that it has changed
+    """
+    watchers = obj.__dict__.get("_watchers")
+    if not watchers:
+        return
+    for key, ref in list(watchers.items()):
+        index = ref()
+        if index is None:
+            del watchers[key]
+        else:
+            index.changed(obj)
+
+
+class _Bound(MinMax):
+    """
+    Row or column bound of a range. Indexes containing the range are told
+    when it is changed.
+    """
+
+    def __set__(self, instance, value):
+        super(_Bound, self).__set__(instance, value)
+        if "_watchers" in instance.__dict__:
+            _notify(instance)
+
+
 class CellRange(Serialisable):
     """
     Represents a range in a sheet: title and coordinates.
@@ -38,10 +75,10 @@ class CellRange(Serialisable):
 
     """
 
-    min_col = MinMax(min=1, max=18278, expected_type=int)
-    min_row = MinMax(min=1, max=1048576, expected_type=int)
-    max_col = MinMax(min=1, max=18278, expected_type=int)
-    max_row = MinMax(min=1, max=1048576, expected_type=int)
+    min_col = _Bound(min=1, max=18278, expected_type=int)
+    min_row = _Bound(min=1, max=1048576, expected_type=int)
+    max_col = _Bound(min=1, max=18278, expected_type=int)
+    max_row = _Bound(min=1, max=1048576, expected_type=int)
 
 
     def __init__(self, range_string=None, min_col=None, min_row=None,
@@ -144,6 +181,13 @@ class CellRange(Serialisable):
                               title=self.title)
 
 
+    def __getstate__(self):
+        # indexes containing the range are not copied with it
+        state = self.__dict__.copy()
+        state.pop("_watchers", None)
+        return state
+
+
     def shift(self, col_shift=0, row_shift=0):
         """
         Shift the focus of the range according to the shift values (*col_shift*, *row_shift*).
@@ -413,6 +457,203 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+class _RangeIndex(object):
+    """
+    Spatial index of cell ranges.
+
+    Ranges are registered in buckets covering blocks of rows and columns so
+    that lookups only have to check ranges close to the coordinates
+    requested. Ranges covering too many buckets, such as whole columns, are
+    kept in a separate list which is always checked.
+
+    Ranges which are changed in place are moved to their new buckets before
+    the next lookup.
+    """
+
+    ROW_BLOCK = 64
+    COL_BLOCK = 16
+    MAX_BUCKETS = 64
+
+
+    def __init__(self, ranges=()):
+        self.buckets = defaultdict(list)
+        self.large = []
+        self.keys = {}
+        self.moved = {}
+        self.extent = None # largest row and column, computed when needed
+        for cr in ranges:
+            self.add(cr)
+
+
+    def __len__(self):
+        return len(self.keys)
+
+
+    def _keys(self, min_col, min_row, max_col, max_row):
+        rows = range((min_row - 1) // self.ROW_BLOCK, (max_row - 1) // self.ROW_BLOCK + 1)
+        cols = range((min_col - 1) // self.COL_BLOCK, (max_col - 1) // self.COL_BLOCK + 1)
+        if len(rows) * len(cols) > self.MAX_BUCKETS:
+            return None
+        return [(r, c) for r in rows for c in cols]
+
+
+    def add(self, cr):
+        _watch(cr, self)
+        if self.extent is not None:
+            self.extent = (max(self.extent[0], cr.max_row),
+                           max(self.extent[1], cr.max_col))
+        keys = self._keys(*cr.bounds)
+        self.keys[id(cr)] = keys
+        if keys is None:
+            self.large.append(cr)
+            return
+        for key in keys:
+            self.buckets[key].append(cr)
+
+
+    def changed(self, cr):
+        """
+        Note that a range has been changed in place
+        """
+        self.moved[id(cr)] = cr
+        self.extent = None
+
+
+    def _update(self):
+        moved = self.moved
+        self.moved = {}
+        for key, cr in moved.items():
+            if key in self.keys:
+                self.remove(cr)
+                self.add(cr)
+
+
+    def remove(self, cr):
+        self.moved.pop(id(cr), None)
+        self.extent = None
+        keys = self.keys.pop(id(cr))
+        if keys is None:
+            _remove_identical(self.large, cr)
+            return
+        for key in keys:
+            bucket = self.buckets[key]
+            _remove_identical(bucket, cr)
+            if not bucket:
+                del self.buckets[key]
+
+
+    def overlapping(self, min_col, min_row, max_col, max_row):
+        """
+        Ranges with at least one cell within the bounds provided
+        """
+        if self.moved:
+            self._update()
+        keys = self._keys(min_col, min_row, max_col, max_row)
+        if keys is None:
+            # query too large for the buckets, check everything
+            candidates = chain(*self.buckets.values())
+        else:
+            candidates = chain.from_iterable(self.buckets.get(key, ()) for key in keys)
+
+        seen = set()
+        for cr in chain(candidates, self.large):
+            if id(cr) in seen:
+                continue
+            seen.add(id(cr))
+            if (cr.min_row <= max_row and min_row <= cr.max_row
+                and cr.min_col <= max_col and min_col <= cr.max_col):
+                yield cr
+
+
+    def find(self, row, column):
+        """
+        Ranges containing a particular cell
+        """
+        return self.overlapping(column, row, column, row)
+
+
+class _SqrefIndex(object):
+    """
+    Index of objects with a ``sqref``, such as conditional formats or data
+    validations, by the cells they apply to.
+
+    The index is rebuilt if its container says that objects have been added
+    or removed, or if ranges are added to or removed from their sqrefs.
+    Replacing the sqref of an object which has already been indexed is not
+    noticed.
+    """
+
+
+    def __init__(self):
+        self.version = 0
+        self.state = None
+        self.objs = None
+        self.owners = {}
+        self.index = _RangeIndex()
+
+
+    def __reduce__(self):
+        # the index refers to ranges by identity so cannot be copied
+        return self.__class__, ()
+
+
+    def changed(self, obj=None):
+        """
+        Note that objects have been added, removed or changed
+        """
+        self.version += 1
+
+
+    def _refresh(self, objs):
+        state = (self.version, len(objs))
+        if objs is self.objs and state == self.state:
+            return
+
+        self.objs = objs
+        self.state = state
+        self.index = _RangeIndex()
+        self.owners = defaultdict(list)
+        for pos, obj in enumerate(objs):
+            _watch(obj.sqref, self)
+            for cr in obj.sqref.ranges:
+                if id(cr) not in self.owners:
+                    self.index.add(cr)
+                self.owners[id(cr)].append((pos, obj))
+
+
+    def overlapping(self, objs, min_col, min_row, max_col, max_row):
+        """
+        Objects with ranges overlapping the bounds in their original order
+        """
+        self._refresh(objs)
+        found = {}
+        for cr in self.index.overlapping(min_col, min_row, max_col, max_row):
+            for pos, obj in self.owners[id(cr)]:
+                found[pos] = obj
+        return [found[pos] for pos in sorted(found)]
+
+
+    def find(self, objs, coord):
+        """
+        Objects applying to a cell or overlapping a range
+        """
+        if hasattr(coord, "coordinate"):
+            coord = coord.coordinate
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        return self.overlapping(objs, *coord.bounds)
+
+
+def _remove_identical(seq, obj):
+    """
+    Remove an object from a list by identity rather than equality
+    """
+    for idx, item in enumerate(seq):
+        if item is obj:
+            del seq[idx]
+            return
+
+
 class MultiCellRange(Strict):
 
 
@@ -423,13 +664,66 @@ class MultiCellRange(Strict):
         if isinstance(ranges, str):
             ranges = [CellRange(r) for r in ranges.split()]
         self.ranges = ranges
+        self._index = None
+
+
+    @property
+    def index(self):
+        """
+        Spatial index of the ranges. This is rebuilt if the list of ranges
+        has been replaced or changed in size directly.
+        """
+        ranges = self.ranges
+        idx = getattr(self, "_index", None)
+        if (idx is None
+            or idx.ranges is not ranges
+            or len(idx) != len(ranges)):
+            idx = _RangeIndex(ranges)
+            idx.ranges = ranges
+            self._index = idx
+        return idx
+
+
+    @property
+    def extent(self):
+        """
+        Largest row and column covered by the ranges as a tuple, or ``None``
+        if there are none. This is kept with the index.
+        """
+        if not self.ranges:
+            return None
+        idx = self.index
+        if idx.extent is None:
+            idx.extent = (max(cr.max_row for cr in self.ranges),
+                          max(cr.max_col for cr in self.ranges))
+        return idx.extent
 
 
     def __contains__(self, coord):
-        for r in self.ranges:
-            if coord in r:
-                return True
-        return False
+        return self.find(coord) is not None
+
+
+    def find(self, coord):
+        """
+        Return the first range containing the cell coordinate or ``None``.
+        Only coordinates are compared, the titles of ranges are ignored.
+        """
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        min_col, min_row, max_col, max_row = coord.bounds
+        for r in self.index.find(min_row, min_col):
+            if (r.min_col <= min_col and r.min_row <= min_row
+                and max_col <= r.max_col and max_row <= r.max_row):
+                return r
+
+
+    def overlapping(self, coord):
+        """
+        Return all ranges with cells in common with the coordinate or range
+        """
+        if not isinstance(coord, CellRange):
+            coord = CellRange(coord)
+        return list(self.index.overlapping(*coord.bounds))
 
 
     def __repr__(self):
@@ -448,16 +742,14 @@ class MultiCellRange(Strict):
         """
         Add a cell coordinate or CellRange
         """
-        cr = None
-        if isinstance(coord, CellRange):
-            cr = coord
-            coord = cr.coord
-        if coord not in self:
-            if cr is None:
-                cr = CellRange(coord)
-            ranges = self.ranges
-            ranges.append(cr)
-            self.ranges = ranges
+        cr = coord
+        if not isinstance(coord, CellRange):
+            cr = CellRange(coord)
+        if cr not in self:
+            idx = self.index
+            self.ranges.append(cr)
+            idx.add(cr)
+            _notify(self)
 
 
     def __iadd__(self, coord):
@@ -484,7 +776,14 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
-        self.ranges.remove(coord)
+        idx = self.index
+        for cr in idx.find(coord.min_row, coord.min_col):
+            if cr == coord:
+                _remove_identical(self.ranges, cr)
+                idx.remove(cr)
+                _notify(self)
+                return
+        raise ValueError("{0} is not in the list of ranges".format(coord))
 
 
     def __iter__(self):
@@ -498,3 +797,11 @@ class MultiCellRange(Strict):
         for r in self.ranges:
             n.ranges.append(copy(r))
         return n
+
+
+    def __getstate__(self):
+        # the index refers to ranges by identity so cannot be copied
+        state = self.__dict__.copy()
+        state['_index'] = None
+        state.pop('_watchers', None)
+        return state
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2019 openpyxl
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from copy import copy
 from itertools import chain
 from operator import itemgetter
 
@@ -68,7 +69,7 @@ def expand_cell_ranges(range_string):
     return set(chain(*cells))
 
 
-from .cell_range import MultiCellRange
+from .cell_range import MultiCellRange, _SqrefIndex
 
 
 class DataValidation(Serialisable):
@@ -177,6 +178,7 @@ class DataValidationList(Serialisable):
         self.xWindow = xWindow
         self.yWindow = yWindow
         self.dataValidation = dataValidation
+        self._index = _SqrefIndex()
 
 
     @property
@@ -190,14 +192,51 @@ class DataValidationList(Serialisable):
 
     def append(self, dv):
         self.dataValidation.append(dv)
+        self._index.changed()
+
+
+    def rules_for(self, cell):
+        """
+        Return the validations which apply to a cell
+        """
+        return self._index.find(self.dataValidation, cell)
+
+
+    def rules_in(self, cell_range):
+        """
+        Return the validations which apply to any cell in a range
+        """
+        return self._index.find(self.dataValidation, cell_range)
+
+
+    def _merged(self):
+        """
+        Combine the ranges of validations which are otherwise identical
+        """
+        groups = OrderedDict()
+        for dv in self.dataValidation:
+            if not dv.sqref:
+                continue
+            key = (tuple(kv for kv in dv if kv[0] != "sqref"), dv.formula1, dv.formula2)
+            groups.setdefault(key, []).append(dv)
+
+        merged = []
+        for group in groups.values():
+            dv = group[0]
+            if len(group) > 1:
+                dv = copy(dv)
+                dv.sqref = MultiCellRange(list(chain.from_iterable(v.sqref.ranges for v in group)))
+            merged.append(dv)
+        return merged
 
 
     def to_tree(self, tagname=None):
         """
-        Need to skip validations that have no cell ranges
+        Need to skip validations that have no cell ranges and combine
+        identical ones.
         """
         ranges = self.dataValidation # copy
-        self.dataValidation = [r for r in self.dataValidation if bool(r.sqref)]
+        self.dataValidation = self._merged()
         xml = super(DataValidationList, self).to_tree(tagname)
         self.dataValidation = ranges
         return xml
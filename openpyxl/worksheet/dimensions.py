@@ -1,5 +1,6 @@
 # Copyright (c) 2010-2019 openpyxl
 
+from bisect import bisect_right
 from copy import copy
 
 from openpyxl.compat import safe_string
@@ -194,6 +195,13 @@ class DimensionHolder(BoundDictionary):
         super(DimensionHolder, self).__init__(reference, default_factory)
 
 
+    def __reduce__(self):
+        # defaultdict only keeps the factory when pickled or copied
+        # rows in runs are kept as runs
+        return (self.__class__, (self.worksheet, self.reference, self.default_factory),
+                self.__dict__, None, iter(dict.items(self)))
+
+
     def group(self, start, end=None, outline_level=1, hidden=False):
         """allow grouping a range of consecutive rows or columns together
 
@@ -243,6 +251,158 @@ class DimensionHolder(BoundDictionary):
             return el # must have at least one child
 
 
+class RowDimensionHolder(DimensionHolder):
+    """
+    Row dimensions can also be kept as runs of consecutive rows with the
+    same attributes. RowDimension objects for the rows in a run are only
+    created when they are used.
+    """
+
+    def __init__(self, worksheet, reference="index", default_factory=None):
+        super(RowDimensionHolder, self).__init__(worksheet, reference, default_factory)
+        self._runs = []
+        self._starts = []
+        self._detached = set()
+
+
+    def add_run(self, first, last, attrs):
+        """
+        Set the attributes of rows `first` to `last` inclusive.
+        Runs must be added in order and must not overlap.
+        """
+        self._runs.append((first, last, attrs))
+        self._starts.append(first)
+
+
+    def _find_run(self, row):
+        if not self._runs or row in self._detached or not isinstance(row, int):
+            return
+        idx = bisect_right(self._starts, row) - 1
+        if idx >= 0:
+            run = self._runs[idx]
+            if row <= run[1]:
+                return run
+
+
+    def _iter_runs(self):
+        for first, last, attrs in self._runs:
+            for row in range(first, last + 1):
+                if row not in self._detached:
+                    yield row
+
+
+    def _detach(self, row):
+        """
+        Remove a row from its run
+        """
+        if self._find_run(row) is not None:
+            self._detached.add(row)
+
+
+    def materialise(self):
+        """
+        Create the objects for all rows in runs
+        """
+        for row in list(self._iter_runs()):
+            self[row]
+        self._runs = []
+        self._starts = []
+        self._detached = set()
+
+
+    def attributes(self, row, cache=None):
+        """
+        The attributes of a row as they are written.
+        Rows in runs are not materialised. `cache` can be shared between
+        calls to convert the attributes of each run only once.
+        """
+        if dict.__contains__(self, row):
+            return dict(dict.__getitem__(self, row))
+        run = self._find_run(row)
+        if run is None:
+            return {}
+        key = id(run)
+        if cache is None or key not in cache:
+            attrs = dict(RowDimension(self.worksheet, **run[2]))
+            if cache is None:
+                return attrs
+            cache[key] = attrs
+        return cache[key]
+
+
+    def __missing__(self, key):
+        run = self._find_run(key)
+        if run is None:
+            return super(RowDimensionHolder, self).__missing__(key)
+        value = RowDimension(self.worksheet, index=key, **run[2])
+        self[key] = value
+        return value
+
+
+    def __setitem__(self, key, value):
+        self._detach(key)
+        super(RowDimensionHolder, self).__setitem__(key, value)
+
+
+    def __delitem__(self, key):
+        if dict.__contains__(self, key):
+            super(RowDimensionHolder, self).__delitem__(key)
+        elif self._find_run(key) is not None:
+            self._detach(key)
+        else:
+            raise KeyError(key)
+
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self._find_run(key) is not None
+
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        yield from self._iter_runs()
+
+
+    def __len__(self):
+        size = sum(last - first + 1 for first, last, attrs in self._runs)
+        return dict.__len__(self) + size - len(self._detached)
+
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super(RowDimensionHolder, self).pop(key, *default)
+
+
+    def keys(self):
+        self.materialise()
+        return super(RowDimensionHolder, self).keys()
+
+
+    def values(self):
+        self.materialise()
+        return super(RowDimensionHolder, self).values()
+
+
+    def items(self):
+        self.materialise()
+        return super(RowDimensionHolder, self).items()
+
+
+    def clear(self):
+        super(RowDimensionHolder, self).clear()
+        self._runs = []
+        self._starts = []
+        self._detached = set()
+
+
 class SheetFormatProperties(Serialisable):
 
     tagname = "sheetFormatPr"
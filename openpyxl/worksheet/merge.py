@@ -8,6 +8,7 @@ from openpyxl.descriptors import (
 
 from openpyxl.cell.cell import MergedCell
 from openpyxl.styles.borders import Border
+from openpyxl.styles.cell_style import StyleArray
 
 from .cell_range import CellRange
 
@@ -57,8 +58,10 @@ class MergedCellRange(CellRange):
     """
     MergedCellRange stores the border information of a merged cell in the top
     left cell of the merged cell.
-    The remaining cells in the merged cell are stored as MergedCell objects and
-    get their border information from the upper left cell.
+    The remaining cells in the merged cell are not stored but created as
+    MergedCell objects when they are accessed. Only the cells at the edges of
+    the merged cell are stored if they need the border information of the
+    upper left cell.
     """
 
     def __init__(self, worksheet, coord):
@@ -90,8 +93,9 @@ class MergedCellRange(CellRange):
 
     def format(self):
         """
-        Each cell of the merged cell is created as MergedCell if it does not
-        already exist.
+        Each cell at the edge of the merged cell is created as MergedCell if
+        it does not already exist and the top left cell has a border for
+        that edge.
 
         The MergedCells at the edge of the merged cell gets its borders from
         the upper left cell.
@@ -103,14 +107,23 @@ class MergedCellRange(CellRange):
         """
 
         names = ['top', 'left', 'right', 'bottom']
+        borders = self.ws.parent._borders
 
         for name in names:
             side = getattr(self.start_cell.border, name)
+            if side is None or not (side.style or side.color):
+                continue
             border = Border(**{name:side})
+            combined = {} # lookup of existing border to the combined border
             for coord in getattr(self, name):
                 cell = self.ws._cells.get(coord)
                 if cell is None:
                     row, col = coord
                     cell = MergedCell(self.ws, row=row, column=col)
                     self.ws._cells[(cell.row, cell.column)] = cell
-                cell.border += border
+                if cell._style is None:
+                    cell._style = StyleArray()
+                current = cell._style.borderId
+                if current not in combined:
+                    combined[current] = borders.add(borders[current] + border)
+                cell._style.borderId = combined[current]
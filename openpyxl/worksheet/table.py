@@ -199,6 +199,7 @@ class Table(Serialisable):
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.table+xml"
     _rel_type = REL_NS + "/table"
     _rel_id = None
+    _worksheet = None
 
     tagname = "table"
 
@@ -329,6 +330,123 @@ class Table(Serialisable):
             self.autoFilter = AutoFilter(ref=self.ref)
 
 
+    def _get_worksheet(self):
+        if self._worksheet is None:
+            raise ValueError("Table {0} has not been added to a worksheet".format(self.displayName))
+        return self._worksheet
+
+
+    def _data_boundaries(self):
+        """
+        Boundaries of the data, without the header and totals rows
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(self.ref)
+        min_row += self.headerRowCount or 0
+        max_row -= self.totalsRowCount or 0
+        return min_col, min_row, max_col, max_row
+
+
+    @property
+    def column_names(self):
+        """
+        Names of the columns. If these have not been set yet they are read
+        from the header row of the worksheet.
+        """
+        if self.tableColumns:
+            return [col.name for col in self.tableColumns]
+
+        min_col, min_row, max_col, max_row = range_boundaries(self.ref)
+        if not self.headerRowCount:
+            return ["Column{0}".format(idx) for idx in range(min_col, max_col+1)]
+        ws = self._get_worksheet()
+        for row in _iter_values(ws, min_col, min_row, max_col, min_row):
+            return [str(value) for value in row]
+
+
+    def iter_rows(self, values_only=False):
+        """
+        Produce the rows of data in the table from its worksheet, without
+        the header and totals rows.
+
+        Values are read without creating any cells. In read-only mode the
+        rows are read from the source as they are needed.
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :rtype: generator
+        """
+        ws = self._get_worksheet()
+        min_col, min_row, max_col, max_row = self._data_boundaries()
+        if values_only:
+            return _iter_values(ws, min_col, min_row, max_col, max_row)
+        return ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                            max_col=max_col)
+
+
+    def iter_column(self, name, values_only=False):
+        """
+        Produce the data in a column of the table
+
+        :param name: name of the column
+        :type name: string
+
+        :rtype: generator
+        """
+        names = self.column_names
+        if name not in names:
+            raise KeyError("Table {0} has no column {1}".format(self.displayName, name))
+
+        ws = self._get_worksheet()
+        min_col, min_row, max_col, max_row = self._data_boundaries()
+        col = min_col + names.index(name)
+        if values_only:
+            rows = _iter_values(ws, col, min_row, col, max_row)
+        else:
+            rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=col,
+                                max_col=col)
+        for row in rows:
+            yield row[0]
+
+
+    def to_arrays(self):
+        """
+        Read the data in the table into a list of values for each column,
+        keyed by the name of the column
+        """
+        names = self.column_names
+        columns = [[] for name in names]
+        for row in self.iter_rows(values_only=True):
+            for column, value in zip(columns, row):
+                column.append(value)
+        return dict(zip(names, columns))
+
+
+def _iter_values(ws, min_col, min_row, max_col, max_row):
+    """
+    Values of the cells in a range without creating missing cells.
+    Read-only worksheets read them from the source.
+    """
+    cells = getattr(ws, "_cells", None)
+    if cells is None:
+        yield from ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                                max_col=max_col, values_only=True)
+        return
+
+    empty = (None,) * (max_col + 1 - min_col)
+    expected = min_row
+    for row, found in cells.iter_rows(min_row, max_row, min_col, max_col):
+        for _ in range(expected, row):
+            yield empty
+        values = list(empty)
+        for cell in found:
+            values[cell.column - min_col] = cell.value
+        yield tuple(values)
+        expected = row + 1
+    for _ in range(expected, max_row + 1):
+        yield empty
+
+
 class TablePartList(Serialisable):
 
     tagname = "tableParts"
@@ -1,7 +1,7 @@
 # Copyright (c) 2010-2019 openpyxl
 import pytest
 
-from copy import copy
+from copy import copy, deepcopy
 
 @pytest.fixture
 def CellRange():
@@ -305,6 +305,14 @@ class TestMultiCellRange:
         assert cells.ranges == [cr1, cr2]
 
 
+    def test_add_titled_range(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2")
+        cells.add(CellRange("Sheet1!A1"))
+        cells.add(CellRange("Sheet1!C3"))
+        assert [cr.coord for cr in cells] == ["A1:B2", "C3"]
+        assert CellRange("Sheet2!B2") in cells
+
+
     def test_iadd(self, MultiCellRange):
         cells = MultiCellRange()
         cells.add('A1')
@@ -376,3 +384,101 @@ class TestMultiCellRange:
         from copy import copy
         r2 = copy(r1)
         assert list(r1)[0] is not list(r2)[0]
+
+
+    def test_find(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2 D4:F10")
+        assert cells.find("E5") == CellRange("D4:F10")
+        assert cells.find("C3") is None
+
+
+    def test_overlapping(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2 D4:F10 A100:XFD100")
+        assert cells.overlapping("B2:E4") == [CellRange("A1:B2"), CellRange("D4:F10")]
+        assert cells.overlapping("C100") == [CellRange("A100:XFD100")]
+        assert cells.overlapping("G1:G99") == []
+
+
+    def test_remove_keeps_index(self, MultiCellRange):
+        cells = MultiCellRange("A1:D4 F6")
+        cells.remove("A1:D4")
+        assert "B2" not in cells
+        assert "F6" in cells
+        assert str(cells) == "F6"
+
+
+    def test_large_range(self, MultiCellRange):
+        cells = MultiCellRange("A1:A1048576")
+        assert "A500000" in cells
+        assert "B500000" not in cells
+
+
+    def test_replace_ranges(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1")
+        assert "A1" in cells
+        cells.ranges = [CellRange("B2")]
+        assert "A1" not in cells
+        assert "B2" in cells
+
+
+    def test_many_ranges(self, MultiCellRange):
+        cells = MultiCellRange()
+        for row in range(1, 2001):
+            cells.add("A{0}:C{0}".format(row))
+        assert len(cells.ranges) == 2000
+        assert cells.find("B1500").coord == "A1500:C1500"
+        assert str(cells).startswith("A1:C1 A2:C2")
+
+
+    @pytest.mark.parametrize("change, inside, outside",
+                             [
+                                 (lambda cr: cr.shift(col_shift=10, row_shift=100), "L102", "B2"),
+                                 (lambda cr: cr.expand(right=20, down=200), "V202", "X2"),
+                                 (lambda cr: cr.shrink(right=1, bottom=1), "B2", "C3"),
+                             ]
+                             )
+    def test_range_changed(self, MultiCellRange, change, inside, outside):
+        cells = MultiCellRange("B2:C3")
+        assert cells.find("B2") is not None
+        change(cells.ranges[0])
+        assert inside in cells
+        assert outside not in cells
+
+
+    def test_bound_assigned(self, MultiCellRange):
+        cells = MultiCellRange("B2:C3")
+        assert "D4" not in cells
+        cells.ranges[0].max_row = 4
+        cells.ranges[0].max_col = 4
+        assert "D4" in cells
+
+
+    def test_other_index_kept(self, MultiCellRange):
+        cells = MultiCellRange("A1")
+        other = MultiCellRange("B2")
+        index = cells.index
+        other.ranges[0].shift(row_shift=1)
+        assert cells.index is index
+        assert "B3" in other
+
+
+    def test_deepcopy_indexed(self, MultiCellRange):
+        cells = MultiCellRange("A1:B2")
+        assert "B2" in cells
+        cells = deepcopy(cells)
+        cells.ranges[0].shift(row_shift=2)
+        assert "B4" in cells
+        assert "B2" not in cells
+
+
+    def test_extent(self, MultiCellRange):
+        cells = MultiCellRange()
+        assert cells.extent is None
+        cells.add("B2:C5")
+        assert cells.extent == (5, 3)
+        cells.add("E1")
+        assert cells.extent == (5, 5)
+        cells.remove("B2:C5")
+        assert cells.extent == (1, 5)
+        cells.ranges[0].expand(down=9)
+        assert cells.extent == (10, 5)
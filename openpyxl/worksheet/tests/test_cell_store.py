@@ -0,0 +1,199 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from copy import copy, deepcopy
+import pickle
+
+import pytest
+
+
+@pytest.fixture
+def CellStore():
+    from .._cell_store import CellStore
+    return CellStore
+
+
+class TestCellStore:
+
+
+    def test_ctor(self, CellStore):
+        store = CellStore({(2, 1):"B", (1, 1):"A"})
+        assert store == {(1, 1):"A", (2, 1):"B"}
+        assert store.row_indices == [1, 2]
+
+
+    def test_rows_in_order(self, CellStore):
+        store = CellStore()
+        store[5, 3] = "C5"
+        store[1, 2] = "B1"
+        store[5, 1] = "A5"
+        store[1, 1] = "A1"
+        assert store.row_indices == [1, 5]
+        assert store.columns(5) == [1, 3]
+        assert list(store.iter_rows()) == [(1, ["A1", "B1"]), (5, ["A5", "C5"])]
+
+
+    def test_replace(self, CellStore):
+        store = CellStore()
+        store[1, 1] = "A1"
+        store[1, 1] = "a1"
+        assert store.columns(1) == [1]
+        assert store[1, 1] == "a1"
+
+
+    def test_delete(self, CellStore):
+        store = CellStore()
+        store[1, 1] = "A1"
+        store[2, 1] = "A2"
+        store[2, 2] = "B2"
+        del store[2, 1]
+        assert store.columns(2) == [2]
+        del store[2, 2]
+        assert store.row_indices == [1]
+        assert store.pop((1, 1)) == "A1"
+        assert store.pop((1, 1), None) is None
+        assert store.row_indices == []
+
+
+    def test_readd_cell(self, CellStore):
+        store = CellStore()
+        store[1, 1] = "A1"
+        store[1, 2] = "B1"
+        assert store.columns(1) == [1, 2]
+        del store[1, 1]
+        store[1, 1] = "a1"
+        assert store.columns(1) == [1, 2]
+
+
+    def test_update(self, CellStore):
+        store = CellStore({(1, 1):"A1"})
+        store.update({(1, 1):"a1", (1, 2):"B1"})
+        store.update({(2, 1):"A2"})
+        assert store.columns(1) == [1, 2]
+        assert store.row_indices == [1, 2]
+
+
+    def test_readd_row(self, CellStore):
+        store = CellStore()
+        store[1, 1] = "A1"
+        store[3, 1] = "A3"
+        del store[3, 1]
+        store[2, 1] = "A2"
+        assert store.row_indices == [1, 2]
+        store[5, 1] = "A5"
+        store[4, 1] = "A4"
+        assert store.row_indices == [1, 2, 4, 5]
+
+
+    @pytest.mark.parametrize("bounds, expected",
+                             [
+                                 ({}, ["A1", "C1", "B2", "C3"]),
+                                 ({'min_row':2}, ["B2", "C3"]),
+                                 ({'max_row':2, 'min_col':2}, ["C1", "B2"]),
+                                 ({'min_col':3, 'max_col':3}, ["C1", "C3"]),
+                                 ({'min_row':4}, []),
+                             ]
+                             )
+    def test_iter_rows_bounds(self, CellStore, bounds, expected):
+        store = CellStore()
+        for key, value in [((3, 3), "C3"), ((1, 3), "C1"), ((2, 2), "B2"), ((1, 1), "A1")]:
+            store[key] = value
+        cells = [c for row, cells in store.iter_rows(**bounds) for c in cells]
+        assert cells == expected
+
+
+    def test_min_max(self, CellStore):
+        store = CellStore()
+        assert store.min_row is None
+        store[7, 1] = "A7"
+        store[3, 1] = "A3"
+        assert store.min_row == 3
+        assert store.max_row == 7
+        store[5, 4] = "D5"
+        store[5, 2] = "B5"
+        assert store.min_col == 1
+        assert store.max_col == 4
+
+
+    def test_clear(self, CellStore):
+        store = CellStore({(1, 1):"A1"})
+        store.clear()
+        assert store.row_indices == []
+
+
+    def test_setdefault(self, CellStore):
+        store = CellStore()
+        assert store.setdefault((1, 1), "A1") == "A1"
+        assert store.columns(1) == [1]
+
+
+    def test_popitem(self, CellStore):
+        store = CellStore({(1, 1):"A1"})
+        assert store.popitem() == ((1, 1), "A1")
+        assert store.row_indices == []
+
+
+    def test_bulk_update(self, CellStore):
+        store = CellStore({(3, 1):"A3"})
+        store.bulk_update({(1, 2):"B1", (1, 1):"A1", (5, 1):"A5"})
+        assert store.row_indices == [1, 3, 5]
+        assert store.columns(1) == [1, 2]
+        store[2, 1] = "A2"
+        assert store.row_indices == [1, 2, 3, 5]
+
+
+    @pytest.fixture
+    def store(self, CellStore):
+
+        class Cell:
+
+            def __init__(self, row, column):
+                self.row = row
+                self.column = column
+
+        store = CellStore()
+        for row in range(1, 4):
+            for col in range(1, 4):
+                store[row, col] = Cell(row, col)
+        return store
+
+
+    def test_move_rows(self, store):
+        store.move_rows(2, 2)
+        assert store.row_indices == [1, 4, 5]
+        assert store.columns(5) == [1, 2, 3]
+        assert all((c.row, c.column) == key for key, c in store.items())
+
+
+    def test_move_rows_over(self, store):
+        del store[1, 1]
+        in_the_way = [store[1, 2], store[1, 3]]
+        assert store.move_rows(2, -1) == in_the_way
+        assert store.row_indices == [1, 2]
+        assert store.columns(1) == [1, 2, 3]
+        assert all((c.row, c.column) == key for key, c in store.items())
+
+
+    def test_move_cols(self, store):
+        store.move_cols(2, 2)
+        assert store.columns(1) == [1, 4, 5]
+        assert store.row_indices == [1, 2, 3]
+        assert all((c.row, c.column) == key for key, c in store.items())
+
+
+    def test_move_cols_over(self, store):
+        del store[2, 1]
+        in_the_way = [store[1, 1], store[3, 1]]
+        assert store.move_cols(2, -1) == in_the_way
+        assert store.columns(1) == [1, 2]
+        assert store.columns(2) == [1, 2]
+        assert all((c.row, c.column) == key for key, c in store.items())
+
+
+    @pytest.mark.parametrize("func", [copy, deepcopy, lambda s: pickle.loads(pickle.dumps(s))])
+    def test_copy(self, CellStore, func):
+        store = CellStore({(2, 2):"B2", (1, 1):"A1"})
+        cp = func(store)
+        assert cp == store
+        assert cp.row_indices == [1, 2]
+        cp[3, 3] = "C3"
+        assert store.row_indices == [1, 2]
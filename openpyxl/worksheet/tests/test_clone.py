@@ -0,0 +1,163 @@
+# Copyright (c) 2010-2019 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+from openpyxl.worksheet.worksheet import Worksheet
+
+
+@pytest.fixture
+def ClonedWorksheet():
+    from .._clone import ClonedWorksheet
+    return ClonedWorksheet
+
+
+@pytest.fixture
+def template():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Report"
+    ws["A1"] = "Title"
+    ws["A1"].font = Font(bold=True)
+    ws["A2"] = "=1+1"
+    ws["B1"].hyperlink = "http://openpyxl.readthedocs.io"
+    ws["C1"].comment = Comment("Note", "Author")
+    ws.merge_cells("D1:E2")
+    ws.column_dimensions["A"].width = 30
+    ws.freeze_panes = "A2"
+    ws._formula_values[ws["A2"]] = 2
+    return wb
+
+
+class TestClonedWorksheet:
+
+    def test_ctor(self, ClonedWorksheet, template):
+        source = template.active
+        wb = Workbook()
+        ws = ClonedWorksheet(wb, source)
+        assert ws.title == "Report"
+        assert ws._source is source
+        assert "_cells" not in ws.__dict__
+
+
+    def test_rename(self, ClonedWorksheet, template):
+        wb = Workbook()
+        ws = ClonedWorksheet(wb, template.active)
+        ws.title = "Copy"
+        ws.sheet_state = "hidden"
+        assert isinstance(ws, ClonedWorksheet)
+        assert template.active.title == "Report"
+
+
+    def test_load(self, ClonedWorksheet, template):
+        source = template.active
+        ws = template.clone().active
+        assert isinstance(ws, ClonedWorksheet)
+        ws.sheet_state = "hidden"
+        cell = ws["A1"]
+        assert ws.__class__ is Worksheet
+        assert ws.sheet_state == "hidden"
+        assert cell.value == "Title"
+        assert cell.font.b is True
+        assert cell.parent is ws
+        assert cell is not source["A1"]
+        assert cell._style is not source["A1"]._style
+
+
+    def test_extras(self, ClonedWorksheet, template):
+        source = template.active
+        ws = template.clone().active
+        assert ws["B1"].hyperlink.target == "http://openpyxl.readthedocs.io"
+        assert ws["B1"].hyperlink is not source["B1"].hyperlink
+        assert ws["C1"].comment.text == "Note"
+        assert ws["C1"].comment.parent is ws["C1"]
+        assert ws._formula_values == {ws["A2"]: 2}
+        assert ws.merged_cells.ranges == source.merged_cells.ranges
+        assert ws["E2"].__class__.__name__ == "MergedCell"
+        assert ws.column_dimensions["A"].width == 30
+        assert ws.freeze_panes == "A2"
+
+
+    def test_independent(self, ClonedWorksheet, template):
+        source = template.active
+        ws = template.clone().active
+        ws["A1"] = "Changed"
+        ws.column_dimensions["A"].width = 10
+        ws.page_setup.orientation = "landscape"
+        ws.merge_cells("F1:G1")
+        assert source["A1"].value == "Title"
+        assert source.column_dimensions["A"].width == 30
+        assert source.page_setup.orientation is None
+        assert len(source.merged_cells.ranges) == 1
+        assert ws.page_setup._parent is ws
+        assert ws.column_dimensions.worksheet is ws
+        assert ws.column_dimensions["B"].parent is ws
+
+
+    def test_charts_shared(self, ClonedWorksheet, template):
+        from openpyxl.chart import BarChart
+        source = template.active
+        chart = BarChart()
+        source.add_chart(chart)
+        ws = template.clone().active
+        assert ws._charts == [chart]
+        ws._charts.clear()
+        assert source._charts == [chart]
+
+
+    def test_clone_of_clone(self, ClonedWorksheet, template):
+        source = template.active
+        first = ClonedWorksheet(Workbook(), source)
+        second = ClonedWorksheet(Workbook(), first)
+        assert second._source is source
+        assert "_source" in first.__dict__
+
+
+    def test_set_before_load(self, ClonedWorksheet, template):
+        source = template.active
+        wb = template.clone()
+        ws = wb.active
+        ws.title = "Copy"
+        assert isinstance(ws, ClonedWorksheet)
+        ws.print_title_rows = "1:2"
+        ws.print_area = "A1:E2"
+        assert ws.__class__ is Worksheet
+        assert source.print_title_rows is None
+        out = BytesIO()
+        wb.save(out)
+
+        wb = load_workbook(out)
+        ws = wb["Copy"]
+        assert ws.print_title_rows == "1:2"
+        assert ws.print_area == ["$A$1:$E$2"]
+        assert ws["A1"].value == "Title"
+
+
+    def test_removed_cached_value(self, ClonedWorksheet, template):
+        source = template.active
+        cell = source["A2"]
+        source.delete_rows(2)
+        source._formula_values[cell] = 2 # kept by earlier versions
+        ws = template.clone().active
+        assert ws["A1"].value == "Title"
+        assert ws._formula_values == {}
+
+
+    def test_load_failed(self, ClonedWorksheet, template, monkeypatch):
+        from .. import _clone
+
+        def fail(source, target):
+            raise MemoryError
+
+        monkeypatch.setattr(_clone, "copy_cells", fail)
+        source = template.active
+        ws = template.clone().active
+        with pytest.raises(MemoryError):
+            ws["A1"]
+        assert isinstance(ws, ClonedWorksheet)
+        assert ws.__dict__["_source"] is source
+        assert "_cells" not in ws.__dict__
@@ -1,5 +1,7 @@
 # Copyright (c) 2010-2019 openpyxl
 
+from copy import deepcopy
+
 import pytest
 
 from openpyxl.xml.functions import fromstring, tostring
@@ -158,6 +160,80 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_rules_for(self, DataValidationList, DataValidation):
+        dv1 = DataValidation(type="list", sqref="A1:A10")
+        dv2 = DataValidation(type="whole", sqref="A5 C1:C3")
+        dvs = DataValidationList(dataValidation=[dv1, dv2])
+        assert dvs.rules_for("A5") == [dv1, dv2]
+        assert dvs.rules_for("B1") == []
+        assert dvs.rules_in("B1:C1") == [dv2]
+
+
+    def test_rules_after_shift(self, DataValidationList, DataValidation):
+        dv = DataValidation(type="list", sqref="A1:A10")
+        dvs = DataValidationList(dataValidation=[dv])
+        assert dvs.rules_for("A5") == [dv]
+        dv.sqref.ranges[0].shift(col_shift=1)
+        assert dvs.rules_for("A5") == []
+        assert dvs.rules_for("B5") == [dv]
+
+
+    def test_rules_after_add(self, DataValidationList, DataValidation):
+        dv = DataValidation(type="list", sqref="A1")
+        dvs = DataValidationList()
+        dvs.append(dv)
+        assert dvs.rules_for("Z100") == []
+        dv.add("Z100")
+        assert dvs.rules_for("Z100") == [dv]
+
+
+    def test_rules_after_remove(self, DataValidationList, DataValidation):
+        dv = DataValidation(type="list", sqref="A1 B2")
+        dvs = DataValidationList(dataValidation=[dv])
+        assert dvs.rules_for("B2") == [dv]
+        dv.sqref.remove("B2")
+        assert dvs.rules_for("B2") == []
+
+
+    def test_index_kept(self, DataValidationList, DataValidation):
+        dvs = DataValidationList()
+        dvs.append(DataValidation(type="list", sqref="A1"))
+        dvs.rules_for("A1")
+        index = dvs._index.index
+        dvs.rules_in("A1:B2")
+        assert dvs._index.index is index
+        dvs.append(DataValidation(type="list", sqref="B2"))
+        assert len(dvs.rules_in("A1:B2")) == 2
+        assert dvs._index.index is not index
+
+
+    def test_copy(self, DataValidationList, DataValidation):
+        dv = DataValidation(type="list", sqref="A1")
+        dvs = DataValidationList(dataValidation=[dv])
+        assert dvs.rules_for("A1") == [dv]
+        dvs = deepcopy(dvs)
+        assert dvs.rules_for("A1") == dvs.dataValidation
+
+
+    def test_merge_identical(self, DataValidationList, DataValidation):
+        dv1 = DataValidation(type="list", formula1='"a,b"', sqref="A1")
+        dv2 = DataValidation(type="list", formula1='"a,b"', sqref="B1:B5")
+        dv3 = DataValidation(type="whole", sqref="C1")
+        dvs = DataValidationList(dataValidation=[dv1, dv2, dv3])
+        xml = tostring(dvs.to_tree())
+        expected = """
+        <dataValidations count="2">
+          <dataValidation allowBlank="0" showErrorMessage="1" showInputMessage="1" sqref="A1 B1:B5" type="list">
+            <formula1>"a,b"</formula1>
+          </dataValidation>
+          <dataValidation allowBlank="0" showErrorMessage="1" showInputMessage="1" sqref="C1" type="whole" />
+        </dataValidations>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert str(dv1.sqref) == "A1"
+
+
 COLLAPSE_TEST_DATA = [
     (
         ["A1"], "A1"
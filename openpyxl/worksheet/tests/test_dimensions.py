@@ -167,6 +167,86 @@ class TestColDimension:
         assert cd.to_tree() is None
 
 
+@pytest.fixture
+def dims():
+    from ..worksheet import Worksheet
+    ws = Worksheet(DummyWorkbook())
+    dims = ws.row_dimensions
+    dims.add_run(2, 4, {'ht': '15', 'customHeight': '1'})
+    dims.add_run(6, 6, {'hidden': '1', 's': StyleArray([10,0,0,0,0,0,0,0,0,0])})
+    return dims
+
+
+class TestRowDimensionHolder:
+
+
+    def test_runs(self, dims):
+        assert len(dims) == 4
+        assert list(dims) == [2, 3, 4, 6]
+        assert 3 in dims
+        assert 5 not in dims
+        assert dict.__len__(dims) == 0
+
+
+    def test_access(self, dims, RowDimension):
+        rd = dims[3]
+        assert isinstance(rd, RowDimension)
+        assert rd.index == 3
+        assert rd.height == 15
+        assert dict.__len__(dims) == 1
+        assert list(dims) == [3, 2, 4, 6]
+        assert dims[3] is rd
+
+
+    def test_missing(self, dims):
+        rd = dims[5]
+        assert rd.height is None
+        assert len(dims) == 5
+
+
+    def test_delete(self, dims):
+        del dims[3]
+        dims[4]
+        del dims[4]
+        assert list(dims) == [2, 6]
+        with pytest.raises(KeyError):
+            del dims[4]
+
+
+    def test_replace(self, dims, RowDimension):
+        dims[2] = RowDimension(dims.worksheet, height=30)
+        assert len(dims) == 4
+        assert dims[2].height == 30
+
+
+    def test_attributes(self, dims):
+        cache = {}
+        assert dims.attributes(3, cache) == {'ht': '15', 'customHeight': '1'}
+        assert dims.attributes(4, cache) is dims.attributes(2, cache)
+        assert dims.attributes(6) == {'hidden': '1', 's': '1', 'customFormat': '1'}
+        assert dims.attributes(5) == {}
+        assert dict.__len__(dims) == 0
+
+
+    def test_materialise(self, dims):
+        assert [rd.index for rd in dims.values()] == [2, 3, 4, 6]
+        assert dims._runs == []
+        assert dims[6].hidden
+
+
+    def test_deepcopy(self, dims):
+        from copy import deepcopy
+        dims[3].height = 30
+        ws = deepcopy(dims.worksheet)
+        cp = ws.row_dimensions
+        assert cp.worksheet is ws
+        assert cp[3].parent is ws
+        assert list(cp) == [3, 2, 4, 6]
+        assert cp[3].height == 30
+        assert cp._runs == dims._runs
+        assert cp[8].index == 8
+
+
 class TestGrouping:
 
     def test_group_columns_simple(self):
@@ -165,3 +165,23 @@ class TestMergedCellRange:
                 right=default_border(),
                 bottom=default_border())
         assert ws['B2'].border == b2_border
+
+
+    def test_format_no_border(self, MergedCellRange):
+        ws = Workbook().active
+        mcr = MergedCellRange(ws, 'A1:C3')
+
+        mcr.format()
+
+        assert list(ws._cells) == [(1, 1)]
+
+
+    def test_format_top_only(self, MergedCellRange):
+        ws = Workbook().active
+        mcr = MergedCellRange(ws, 'A1:C3')
+        mcr.start_cell.border = Border(top=thick_border())
+
+        mcr.format()
+
+        assert sorted(ws._cells) == [(1, 1), (1, 2), (1, 3)]
+        assert ws._cells[(1, 3)].border.top == thick_border()
@@ -15,6 +15,7 @@ def DummyWorkbook():
         epoch = None
         _cell_styles = [StyleArray([0, 0, 0, 0, 0, 0, 0, 0, 0])]
         data_only = False
+        cached_values = False
 
         def __init__(self):
             self.sheetnames = []
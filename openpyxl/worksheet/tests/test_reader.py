@@ -159,7 +159,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         parser.parse_row(element)
-        assert parser.row_dimensions['2'] == {'r': '2', 'spans': '1:4', 'hidden':'1'}
+        assert parser.row_dimensions == [[2, 2, {'hidden':'1'}]]
 
 
     def test_styled_row(self, datadir, WorkSheetParser):
@@ -168,8 +168,26 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         parser.parse_row(element)
-        rd = parser.row_dimensions['23']
-        assert rd == {'r': '23', 's': '28', 'spans': '1:8'}
+        assert parser.row_dimensions == [[23, 23, {'s': '28'}]]
+
+
+    def test_row_runs(self, WorkSheetParser):
+        parser = WorkSheetParser
+        src = [
+            '<row r="1" ht="15" customHeight="1" spans="1:8" />',
+            '<row r="2" ht="15" customHeight="1" spans="1:6" />',
+            '<row r="3" ht="15" customHeight="1" />',
+            '<row r="5" ht="15" customHeight="1" />',
+            '<row r="6" ht="20" customHeight="1" />',
+        ]
+        for row in src:
+            parser.parse_row(fromstring(row))
+
+        assert parser.row_dimensions == [
+            [1, 3, {'ht': '15', 'customHeight': '1'}],
+            [5, 5, {'ht': '15', 'customHeight': '1'}],
+            [6, 6, {'ht': '20', 'customHeight': '1'}],
+        ]
 
 
     def test_sheet_protection(self, datadir, WorkSheetParser):
@@ -207,6 +225,35 @@ class TestWorksheetParser:
                         'style_id':0, 'value': '=IF(TRUE, "y", "n")'}
 
 
+    @pytest.mark.parametrize("src, cached",
+                             [
+                                 ('<c r="A1" t="str"><f>IF(TRUE, "y", "n")</f><v>y</v></c>', "y"),
+                                 ('<c r="A1"><f>1+2</f><v>3</v></c>', 3),
+                                 ('<c r="A1" t="b"><f>TRUE()</f><v>1</v></c>', True),
+                                 ('<c r="A1" t="e"><f>1/0</f><v>#DIV/0!</v></c>', "#DIV/0!"),
+                                 ('<c r="A1" s="1"><f>TODAY()</f><v>43831</v></c>', datetime.datetime(2020, 1, 1)),
+                             ]
+                             )
+    def test_formula_cached_value(self, WorkSheetParser, src, cached):
+        parser = WorkSheetParser
+        parser.cached_values = True
+        parser.epoch = CALENDAR_WINDOWS_1900
+        element = fromstring(src.replace("<c ", '<c xmlns="{0}" '.format(SHEET_MAIN_NS)))
+
+        cell = parser.parse_cell(element)
+        assert cell['data_type'] == 'f'
+        assert cell['cached_value'] == cached
+
+
+    def test_formula_no_cached_value(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.cached_values = True
+        element = fromstring('<c xmlns="{0}" r="A1"><f>1+2</f></c>'.format(SHEET_MAIN_NS))
+
+        cell = parser.parse_cell(element)
+        assert 'cached_value' not in cell
+
+
     def test_formula_data_only(self, WorkSheetParser):
         parser = WorkSheetParser
         parser.data_only = True
@@ -100,6 +100,97 @@ class TestTable:
         assert "xl/tables/table1.xml" in archive.namelist()
 
 
+@pytest.fixture
+def sales():
+    from openpyxl import Workbook
+    from ..table import Table
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Title"])
+    ws.append(["Region", "Units", "Price"])
+    ws.append(["North", 10, 2.5])
+    ws.append(["South", 20, 1.5])
+    ws["B6"] = 15
+    ws.append(["Total", 45, None])
+    ws["E4"] = "outside"
+    table = Table(displayName="Sales", ref="A2:C7", totalsRowCount=1)
+    ws.add_table(table)
+    return ws, table
+
+
+class TestTableData:
+
+    def test_tables(self, sales):
+        ws, table = sales
+        assert ws.tables == {"Sales": table}
+
+
+    def test_column_names(self, sales):
+        ws, table = sales
+        assert table.column_names == ["Region", "Units", "Price"]
+
+
+    def test_iter_values(self, sales):
+        ws, table = sales
+        cells = len(ws._cells)
+        assert list(table.iter_rows(values_only=True)) == [
+            ("North", 10, 2.5),
+            ("South", 20, 1.5),
+            (None, None, None),
+            (None, 15, None),
+        ]
+        assert len(ws._cells) == cells
+
+
+    def test_iter_rows(self, sales):
+        ws, table = sales
+        rows = list(table.iter_rows())
+        assert rows[0][0].coordinate == "A3"
+        assert rows[-1][-1].coordinate == "C6"
+
+
+    def test_iter_column(self, sales):
+        ws, table = sales
+        assert list(table.iter_column("Units", values_only=True)) == [10, 20, None, 15]
+        assert [c.coordinate for c in table.iter_column("Price")] == ["C3", "C4", "C5", "C6"]
+
+
+    def test_unknown_column(self, sales):
+        ws, table = sales
+        with pytest.raises(KeyError):
+            list(table.iter_column("Cost"))
+
+
+    def test_to_arrays(self, sales):
+        ws, table = sales
+        assert table.to_arrays() == {
+            "Region": ["North", "South", None, None],
+            "Units": [10, 20, None, 15],
+            "Price": [2.5, 1.5, None, None],
+        }
+
+
+    def test_no_worksheet(self):
+        from ..table import Table
+        table = Table(displayName="Sales", ref="A2:C7")
+        with pytest.raises(ValueError):
+            table.to_arrays()
+
+
+    def test_read_only(self, sales):
+        from openpyxl import load_workbook
+        ws, table = sales
+        out = BytesIO()
+        ws.parent.save(out)
+
+        wb = load_workbook(out, read_only=True)
+        table = wb.active.tables["Sales"]
+        assert table.column_names == ["Region", "Units", "Price"]
+        assert list(table.iter_column("Units", values_only=True)) == [10, 20, None, 15]
+        assert table.to_arrays()["Region"] == ["North", "South", None, None]
+        wb.close()
+
+
 @pytest.fixture
 def TableFormula():
     from ..table import TableFormula
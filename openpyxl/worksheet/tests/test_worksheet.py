@@ -87,6 +87,39 @@ class TestWorksheet:
             assert tuple(c.coordinate for c in row) == coord
 
 
+    def test_iter_rows_sparse(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['E1'] = 1
+        ws['B1'] = 2
+        ws['C100'] = 3
+        rows = ws.iter_rows(sparse=True)
+        assert [tuple(c.coordinate for c in row) for row in rows] == [
+            ('B1', 'E1'),
+            ('C100',),
+        ]
+        assert len(ws._cells) == 3
+
+
+    def test_iter_rows_sparse_bounds(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws['B2'] = 2
+        ws['C3'] = 3
+        ws['D4'] = 4
+        rows = ws.iter_rows(min_row=2, max_row=4, max_col=3, sparse=True, values_only=True)
+        assert list(rows) == [(2,), (3,)]
+
+
+    def test_iter_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['C3'] = 3
+        ws['A1'] = 1
+        ws['B3'] = 2
+        cells = ws.iter_cells(min_col=2)
+        assert [c.coordinate for c in cells] == ['B3', 'C3']
+        assert len(ws._cells) == 3
+
+
     def test_cell_alternate_coordinates(self, Worksheet):
         ws = Worksheet(Workbook())
         cell = ws.cell(row=8, column=4)
@@ -400,6 +433,54 @@ class TestWorksheet:
         assert (4, 4) not in ws._cells
 
 
+    def test_merge_large_range(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:Z50000")
+        assert list(ws._cells) == [(1, 1)]
+        assert ws.max_row == 50000
+        assert ws.max_column == 26
+        assert ws.calculate_dimension() == "A1:Z50000"
+
+
+    def test_merged_extent_changed(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:B2")
+        ws.merge_cells("C3:Z100")
+        assert ws.calculate_dimension() == "A1:Z100"
+        ws.unmerge_cells("C3:Z100")
+        assert ws.calculate_dimension() == "A1:C3"
+        ws.merged_cells.ranges[0].shift(row_shift=5)
+        assert ws.max_row == 7
+        assert ws.max_column == 3
+
+
+    def test_merged_cell_on_demand(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B2:D4")
+        assert ws.cell(2, 2).__class__.__name__ == "Cell"
+        assert ws.cell(3, 3).__class__.__name__ == "MergedCell"
+        assert ws.cell(5, 5).__class__.__name__ == "Cell"
+
+
+    def test_merge_removes_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws['B2'] = 2
+        ws['E5'] = 5
+        ws.merge_cells("A1:C3")
+        assert set(ws._cells) == {(1, 1), (5, 5)}
+        assert ws['B2'].value is None
+
+
+    def test_unmerge_accessed_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:D4")
+        ws['C3']
+        ws.unmerge_cells("A1:D4")
+        assert list(ws._cells) == [(1, 1)]
+        assert ws['C3'].__class__.__name__ == "Cell"
+
+
     @pytest.mark.parametrize("rows, cols, titles",
                              [
                                 ("1:4", None, "1:4"),
@@ -524,6 +605,73 @@ def test_add_image(Worksheet):
     ws.add_image(im, "D5")
 
 
+class TestApplyStyle:
+
+
+    def test_range(self, Worksheet):
+        from openpyxl.styles import Font
+        wb = Workbook()
+        ws = Worksheet(wb)
+        ws["A1"] = 1
+        ws["B2"] = 2
+        ws["B2"].number_format = "0.00"
+        ws["D4"] = 4
+
+        ws.apply_style("A1:C3", font=Font(b=True))
+        assert ws["A1"].font.b
+        assert ws["B2"].font.b
+        assert ws["B2"].number_format == "0.00"
+        assert not ws["D4"].font.b
+        assert (3, 3) not in ws._cells
+        assert ws["A1"]._style is not ws["B2"]._style
+
+
+    def test_create(self, Worksheet):
+        wb = Workbook()
+        ws = Worksheet(wb)
+        ws.merge_cells("B2:C2")
+
+        ws.apply_style("A1:C2", number_format="0.000", create=True)
+        assert len(ws._cells) == 6
+        assert ws["A1"].number_format == "0.000"
+        assert ws["C2"].number_format == "0.000"
+        assert ws["C2"].__class__.__name__ == "MergedCell"
+
+
+    def test_columns(self, Worksheet):
+        from openpyxl.styles import PatternFill
+        fill = PatternFill(patternType="solid", fgColor="FF0000")
+        wb = Workbook()
+        ws = Worksheet(wb)
+        ws["B5"] = 1
+        ws["D5"] = 1
+
+        ws.apply_style("A:B", fill=fill)
+        assert ws.column_dimensions["A"].fill == fill
+        assert ws.column_dimensions["B"].fill == fill
+        assert ws["B5"].fill == fill
+        assert ws["D5"].fill != fill
+        assert len(ws._cells) == 2
+
+
+    def test_rows(self, Worksheet):
+        wb = Workbook()
+        ws = Worksheet(wb)
+        ws["A2"] = 1
+        ws["A5"] = 1
+
+        ws.apply_style(2, named_style="Good")
+        assert ws["A2"].style == "Good"
+        assert ws.row_dimensions[2]._style == ws["A2"]._style
+        assert ws["A5"].style == "Normal"
+
+
+    def test_invalid(self, Worksheet):
+        ws = Worksheet(Workbook())
+        with pytest.raises(ValueError):
+            ws.apply_style("A1:", number_format="0.0")
+
+
 @pytest.fixture
 def dummy_worksheet(Worksheet):
     """
@@ -609,6 +757,26 @@ class TestEditableWorksheet:
         assert ws._current_row == 0
 
 
+    @pytest.mark.parametrize("delete", [
+        lambda ws: ws.delete_rows(2, 3),
+        lambda ws: ws.delete_cols(2, 3),
+        lambda ws: ws._remove_merged_cells(CellRange("A1:C3")),
+        lambda ws: ws.__delitem__("B2"),
+    ])
+    def test_delete_cached_values(self, dummy_worksheet, delete):
+        ws = dummy_worksheet
+        ws["B2"] = "=1+1"
+        ws._formula_values[ws["B2"]] = 2
+        ws["F6"] = "=2+2"
+        ws._formula_values[ws["F6"]] = 4
+
+        delete(ws)
+
+        cell, = ws._formula_values
+        assert ws._cells[cell.row, cell.column] is cell
+        assert cell.cached_value == 4
+
+
     def test_delete_cols(self, dummy_worksheet):
         ws = dummy_worksheet
 
@@ -729,6 +897,16 @@ class TestEditableWorksheet:
         assert cr.coord == "B2:C5"
 
 
+    def test_move_merged_range(self, Worksheet):
+        from openpyxl import Workbook
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B2:C3")
+        cr = ws.merged_cells.ranges[0]
+        ws.move_range(cr, rows=10)
+        assert ws.merged_cells.find("C13") is cr
+        assert "B2" not in ws.merged_cells
+
+
     def test_move_empty_range(self, dummy_worksheet):
         ws = dummy_worksheet
         cr = CellRange("A7:E15")
@@ -209,3 +209,52 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+class TestColumnStyle:
+
+
+    def test_set_column_style(self):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+
+        ws.set_column_style("B", font=Font(b=True), number_format="0.00")
+        ws.set_column_style(3, number_format="0.00")
+        assert ws._column_xfs[2] != ws._column_xfs[3]
+        style = wb._cell_styles[int(ws._column_xfs[2])]
+        assert wb._fonts[style.fontId] == Font(b=True)
+        assert style.numFmtId == 2
+
+
+    def test_round_trip(self):
+        from io import BytesIO
+        from openpyxl import Workbook, load_workbook
+        from openpyxl.styles import Font
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.set_column_style("B", font=Font(i=True), number_format="0.000")
+        ws.set_column_style("C", number_format="yyyy-mm-dd")
+        ws.set_column_style("D", font=Font(b=True))
+
+        cell = WriteOnlyCell(ws, 10)
+        cell.font = Font(u="single")
+        day = datetime.datetime(2020, 1, 1)
+        ws.append([1, 2, day, day])
+        ws.append([1, cell, day, "text"])
+
+        out = BytesIO()
+        wb.save(out)
+        ws = load_workbook(out).active
+
+        assert ws["A1"].number_format == "General"
+        assert ws["B1"].number_format == "0.000"
+        assert ws["B1"].font.i
+        assert ws["B2"].font.u == "single"
+        assert not ws["B2"].font.i
+        assert ws["C1"].number_format == "yyyy-mm-dd"
+        assert ws["C2"].value == day
+        assert ws["D1"].font.b
+        assert ws["D1"].is_date
+        assert ws["D2"].font.b
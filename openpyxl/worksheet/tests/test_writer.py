@@ -453,6 +453,17 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_table_headers(self, writer):
+        ws = writer.ws
+        ws.append(["Name", "Value"])
+        table = Table(displayName="Table1", ref="A1:B100000")
+        ws._tables = [table]
+        writer.write_tables()
+
+        assert [col.name for col in table.tableColumns] == ["Name", "Value"]
+        assert len(ws._cells) == 2
+
+
     def test_write_tail(self, writer):
 
         writer.write_tail()
@@ -472,7 +483,7 @@ class TestWorksheetWriter:
         writer.ws.row_dimensions[10] = None
         writer.ws.row_dimensions[2] = None
 
-        assert writer.rows() == [
+        assert list(writer.rows()) == [
             (2, []),
             (10, [writer.ws['A10']])
         ]
@@ -483,10 +494,25 @@ class TestWorksheetWriter:
         for c in ['F1', 'B1', 'A1', 'D1', 'E1', 'C1']:
             ws[c] = 1
 
-        assert writer.rows() == [
+        assert list(writer.rows()) == [
             (1, [ws['A1'], ws['B1'], ws['C1'], ws['D1'], ws['E1'], ws['F1']]),
         ]
 
+
+    def test_rows_unordered(self, writer):
+
+        ws = writer.ws
+        for c in ['B3', 'A5', 'C1', 'A3']:
+            ws[c] = 1
+        ws.row_dimensions[4].height = 20
+
+        assert list(writer.rows()) == [
+            (1, [ws['C1']]),
+            (3, [ws['A3'], ws['B3']]),
+            (4, []),
+            (5, [ws['A5']]),
+        ]
+
     def test_write_rows(self, writer):
 
         writer.ws['F1'] = 10
@@ -5,7 +5,6 @@
 
 # Python stdlib imports
 from itertools import islice, product, chain
-from operator import itemgetter
 from inspect import isgenerator
 
 # compatibility imports
@@ -22,7 +21,9 @@ from openpyxl.utils import (
     absolute_coordinate,
 )
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.comments._writer import CommentWriter
 from openpyxl.formatting.formatting import ConditionalFormattingList
+from openpyxl.styles.styleable import StyleChange
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.workbook.child import _WorkbookChild
 from openpyxl.workbook.defined_name import COL_RANGE_RE, ROW_RANGE_RE
@@ -38,6 +39,7 @@ from .dimensions import (
     ColumnDimension,
     RowDimension,
     DimensionHolder,
+    RowDimensionHolder,
     SheetFormatProperties,
 )
 from .protection import SheetProtection
@@ -48,6 +50,7 @@ from .views import (
     SheetViewList,
 )
 from .cell_range import MultiCellRange, CellRange
+from ._cell_store import CellStore
 from .merge import MergedCellRange
 from .properties import WorksheetProperties
 from .pagebreak import RowBreak, ColBreak
@@ -96,18 +99,19 @@ class Worksheet(_WorkbookChild):
         self._setup()
 
     def _setup(self):
-        self.row_dimensions = DimensionHolder(worksheet=self,
-                                              default_factory=self._add_row)
+        self.row_dimensions = RowDimensionHolder(worksheet=self,
+                                                 default_factory=self._add_row)
         self.column_dimensions = DimensionHolder(worksheet=self,
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        self._cells = CellStore()
+        self._formula_values = {} # cached values of formulae read from a file
         self._charts = []
         self._images = []
         self._rels = RelationshipList()
         self._drawing = None
-        self._comments = []
+        self._comments = CommentWriter()
         self.merged_cells = MultiCellRange()
         self._tables = []
         self._pivots = []
@@ -246,19 +250,33 @@ class Worksheet(_WorkbookChild):
         """
         Internal method for getting a cell from a worksheet.
         Will create a new cell if one doesn't already exist.
+        Cells within merged ranges are created as MergedCells.
         """
-        coordinate = (row, column)
-        if not coordinate in self._cells:
-            cell = Cell(self, row=row, column=column)
+        cell = self._cells.get((row, column))
+        if cell is None:
+            if self.merged_cells.ranges and self._is_merged(row, column):
+                cell = MergedCell(self, row=row, column=column)
+            else:
+                cell = Cell(self, row=row, column=column)
             self._add_cell(cell)
-        return self._cells[coordinate]
+        return cell
+
+
+    def _is_merged(self, row, column):
+        """
+        Check whether a cell is covered by a merged range and is not its
+        top-left cell.
+        """
+        for cr in self.merged_cells.index.find(row, column):
+            return (row, column) != (cr.min_row, cr.min_col)
+        return False
 
 
     def _add_cell(self, cell):
         """
         Internal method for adding cell objects.
         """
-        column = cell.col_idx
+        column = cell.column
         row = cell.row
         self._current_row = max(row, self._current_row)
         self._cells[(row, column)] = cell
@@ -316,7 +334,7 @@ class Worksheet(_WorkbookChild):
     def __delitem__(self, key):
         row, column = coordinate_to_tuple(key)
         if (row, column) in self._cells:
-            del self._cells[(row, column)]
+            self._remove_cell((row, column))
 
 
     @property
@@ -327,8 +345,7 @@ class Worksheet(_WorkbookChild):
         """
         min_row = 1
         if self._cells:
-            rows = set(c[0] for c in self._cells)
-            min_row = min(rows)
+            min_row = self._cells.min_row
         return min_row
 
 
@@ -340,8 +357,11 @@ class Worksheet(_WorkbookChild):
         """
         max_row = 1
         if self._cells:
-            rows = set(c[0] for c in self._cells)
-            max_row = max(rows)
+            max_row = self._cells.max_row
+        merged = self.merged_cells.extent
+        if merged is not None:
+            # merged cells are only stored when accessed
+            max_row = max(max_row, merged[0])
         return max_row
 
 
@@ -353,8 +373,7 @@ class Worksheet(_WorkbookChild):
         """
         min_col = 1
         if self._cells:
-            cols = set(c[1] for c in self._cells)
-            min_col = min(cols)
+            min_col = self._cells.min_col
         return min_col
 
 
@@ -366,8 +385,10 @@ class Worksheet(_WorkbookChild):
         """
         max_col = 1
         if self._cells:
-            cols = set(c[1] for c in self._cells)
-            max_col = max(cols)
+            max_col = self._cells.max_col
+        merged = self.merged_cells.extent
+        if merged is not None:
+            max_col = max(max_col, merged[1])
         return max_col
 
 
@@ -376,19 +397,14 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        if not self._cells:
             return "A1:A1"
 
+        min_col = self.min_column
+        min_row = self.min_row
+        max_col = self.max_column
+        max_row = self.max_row
+
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
 
@@ -398,7 +414,7 @@ class Worksheet(_WorkbookChild):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False, sparse=False):
         """
         Produces cells from the worksheet, by row. Specify the iteration range
         using indices of rows and columns.
@@ -407,6 +423,10 @@ class Worksheet(_WorkbookChild):
 
         If no cells are in the worksheet an empty tuple will be returned.
 
+        If `sparse` is True only existing cells are returned and rows without
+        any are skipped. No cells are created and the range is not limited
+        unless indices are specified.
+
         :param min_col: smallest column index (1-based index)
         :type min_col: int
 
@@ -422,9 +442,15 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param sparse: whether only existing cells should be returned
+        :type sparse: bool
+
         :rtype: generator
         """
 
+        if sparse:
+            return self._existing_cells_by_row(min_col, min_row, max_col, max_row, values_only)
+
         if self._current_row == 0 and not any([min_col, min_row, max_col, max_row ]):
             return ()
 
@@ -445,6 +471,40 @@ class Worksheet(_WorkbookChild):
                 yield tuple(cells)
 
 
+    def _existing_cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+        for row, cells in self._cells.iter_rows(min_row, max_row, min_col, max_col):
+            if values_only:
+                yield tuple(cell.value for cell in cells)
+            else:
+                yield tuple(cells)
+
+
+    def iter_cells(self, min_row=None, max_row=None, min_col=None, max_col=None):
+        """
+        Produces the cells which exist in the worksheet, by row. Specify the
+        iteration range using indices of rows and columns.
+
+        Unlike :func:`iter_rows` no cells are created.
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :rtype: generator
+        """
+        for row, cells in self._cells.iter_rows(min_row, max_row, min_col, max_col):
+            for cell in cells:
+                yield cell
+
+
     @property
     def rows(self):
         """Produces all cells in the worksheet, by row (see :func:`iter_rows`)
@@ -521,6 +581,60 @@ class Worksheet(_WorkbookChild):
         return self.iter_cols()
 
 
+    def apply_style(self, cell_range, font=None, fill=None, border=None,
+                    number_format=None, alignment=None, protection=None,
+                    named_style=None, create=False):
+        """
+        Style a range of cells, such as "A1:D20", or whole rows, "2:5", or
+        columns, "A:C", at once. Only the parts of the style which are given
+        are changed.
+
+        Each part is added to the workbook only once and the new style is
+        worked out once for each different style in the range, which is
+        much faster than styling cells one by one.
+
+        For whole rows or columns the row or column dimensions are also
+        styled. Excel uses these for cells which do not exist so no cells
+        are created. Otherwise only existing cells are styled unless
+        `create` is True.
+
+        :param cell_range: range of cells, rows or columns
+        :type cell_range: string or int
+
+        :param named_style: named style to apply before the other parts
+        :type named_style: string or :class:`openpyxl.styles.NamedStyle`
+
+        :param create: whether missing cells in a range are created
+        :type create: bool
+        """
+        if isinstance(cell_range, int):
+            cell_range = str(cell_range)
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        if not any([min_col, min_row, max_col, max_row]):
+            raise IndexError("{0} is not a valid coordinate or range".format(cell_range))
+
+        change = StyleChange(self.parent, font=font, fill=fill, border=border,
+                             number_format=number_format, alignment=alignment,
+                             protection=protection, named_style=named_style)
+
+        if not min_row:
+            for idx in range(min_col, max_col + 1):
+                dim = self.column_dimensions[get_column_letter(idx)]
+                dim._style = change(dim._style)
+        elif not min_col:
+            for idx in range(min_row, max_row + 1):
+                dim = self.row_dimensions[idx]
+                dim._style = change(dim._style)
+        elif create:
+            for row in range(min_row, max_row + 1):
+                for column in range(min_col, max_col + 1):
+                    self._get_cell(row, column)
+
+        for row, cells in self._cells.iter_rows(min_row, max_row, min_col, max_col):
+            for cell in cells:
+                cell._style = change(cell._style)
+
+
     def set_printer_settings(self, paper_size, orientation):
         """Set printer settings """
 
@@ -557,9 +671,18 @@ class Worksheet(_WorkbookChild):
 
 
     def add_table(self, table):
+        table._worksheet = self
         self._tables.append(table)
 
 
+    @property
+    def tables(self):
+        """
+        Tables in the worksheet by name
+        """
+        return {table.displayName:table for table in self._tables}
+
+
     def add_pivot(self, pivot):
         self._pivots.append(pivot)
 
@@ -579,14 +702,30 @@ class Worksheet(_WorkbookChild):
         Borders are then applied
         """
         mcr = MergedCellRange(self, cr.coord)
-        cells = chain.from_iterable(mcr.rows)
-        next(cells) # skip first cell
-
-        for row, col in cells:
-            self._cells[row, col] = MergedCell(self, row, col)
+        self._remove_merged_cells(mcr)
         mcr.format()
 
 
+    def _remove_merged_cells(self, cr):
+        """
+        Remove any cells apart from the top-left one in a range from the
+        worksheet. Whichever is smaller, the range or the cells in the
+        worksheet, is searched.
+        """
+        min_col, min_row, max_col, max_row = cr.bounds
+        size = (max_col - min_col + 1) * (max_row - min_row + 1)
+        if size < len(self._cells):
+            coords = [c for c in product(range(min_row, max_row + 1), range(min_col, max_col + 1))
+                      if c in self._cells]
+        else:
+            coords = [(row, col) for row, col in self._cells
+                      if min_row <= row <= max_row and min_col <= col <= max_col]
+
+        for coord in coords:
+            if coord != (min_row, min_col):
+                self._remove_cell(coord)
+
+
     @property
     @deprecated("Use ws.merged_cells.ranges")
     def merged_cell_ranges(self):
@@ -603,12 +742,7 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Cell range {0} is not merged".format(cr.coord))
 
         self.merged_cells.remove(cr)
-
-        cells = chain.from_iterable(cr.rows)
-        next(cells) # skip first cell
-
-        for row, col in cells:
-            del self._cells[(row, col)]
+        self._remove_merged_cells(cr)
 
 
     def append(self, iterable):
@@ -630,6 +764,7 @@ class Worksheet(_WorkbookChild):
 
         """
         row_idx = self._current_row + 1
+        cells = {} # added together to the index
 
         if (isinstance(iterable, (list, tuple, range))
             or isgenerator(iterable)):
@@ -644,18 +779,19 @@ class Worksheet(_WorkbookChild):
                     cell.row = row_idx
                 else:
                     cell = Cell(self, row=row_idx, column=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                cells[(row_idx, col_idx)] = cell
 
         elif isinstance(iterable, dict):
             for col_idx, content in iterable.items():
                 if isinstance(col_idx, str):
                     col_idx = column_index_from_string(col_idx)
                 cell = Cell(self, row=row_idx, column=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                cells[(row_idx, col_idx)] = cell
 
         else:
             self._invalid_row(iterable)
 
+        self._cells.update(cells)
         self._current_row = row_idx
 
 
@@ -663,28 +799,16 @@ class Worksheet(_WorkbookChild):
         """
         Move either rows or columns around by the offset
         """
-        reverse = offset > 0 # start at the end if inserting
-        row_offset = 0
-        col_offset = 0
-
         # need to make affected ranges contiguous
         if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
-            row_offset = offset
-            key = 0
+            list(self.iter_rows(min_row=min_row))
+            overwritten = self._cells.move_rows(min_row, offset)
         else:
-            cells = self.iter_cols(min_col=min_col)
-            col_offset = offset
-            key = 1
-        cells = list(cells)
-
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
-                continue
-            elif min_col and column < min_col:
-                continue
+            list(self.iter_cols(min_col=min_col))
+            overwritten = self._cells.move_cols(min_col, offset)
 
-            self._move_cell(row, column, row_offset, col_offset)
+        for cell in overwritten:
+            self._formula_values.pop(cell, None)
 
 
     def insert_rows(self, idx, amount=1):
@@ -717,7 +841,7 @@ class Worksheet(_WorkbookChild):
         for row in remainder:
             for col in range(min_col, max_col):
                 if (row, col) in self._cells:
-                    del self._cells[row, col]
+                    self._remove_cell((row, col))
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
@@ -738,7 +862,7 @@ class Worksheet(_WorkbookChild):
         for col in remainder:
             for row in range(min_row, max_row):
                 if (row, col) in self._cells:
-                    del self._cells[row, col]
+                    self._remove_cell((row, col))
 
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
@@ -780,6 +904,9 @@ class Worksheet(_WorkbookChild):
         cell = self._get_cell(row, column)
         new_row = cell.row + row_offset
         new_col = cell.column + col_offset
+        if self._formula_values:
+            # any cell which is overwritten is removed
+            self._formula_values.pop(self._cells.get((new_row, new_col)), None)
         self._cells[new_row, new_col] = cell
         del self._cells[(cell.row, cell.column)]
         cell.row = new_row
@@ -789,6 +916,14 @@ class Worksheet(_WorkbookChild):
             cell.value = t.translate_formula(row_delta=row_offset, col_delta=col_offset)
 
 
+    def _remove_cell(self, key):
+        """
+        Remove a cell and the cached value of its formula
+        """
+        cell = self._cells.pop(key)
+        self._formula_values.pop(cell, None)
+
+
     def _invalid_row(self, iterable):
         raise TypeError('Value must be a list, tuple, range or generator, or a dict. Supplied value is {0}'.format(
             type(iterable))
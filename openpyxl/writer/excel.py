@@ -3,13 +3,15 @@
 """Write a .xlsx file."""
 
 # Python stdlib imports
+import os
 import re
+from itertools import count
 from tempfile import TemporaryFile
 from zipfile import ZipFile, ZIP_DEFLATED
 
 # package imports
 from openpyxl.compat import deprecated
-from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.utils.exceptions import InvalidFileException, OperationCancelled
 from openpyxl.xml.constants import (
     ARC_SHARED_STRINGS,
     ARC_CONTENT_TYPES,
@@ -24,24 +26,43 @@ from openpyxl.xml.constants import (
     PACKAGE_DRAWINGS,
     PACKAGE_CHARTS,
     PACKAGE_IMAGES,
-    PACKAGE_XL
+    PACKAGE_XL,
+    SHARED_STRINGS,
     )
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.xml.functions import tostring, fromstring, Element
-from openpyxl.packaging.manifest import Manifest
+from openpyxl.utils.progress import get_monitor
+from openpyxl.utils.tracing import span, counter, get_tracer
+from openpyxl.packaging.manifest import Manifest, Override
+from openpyxl.packaging._parts import RawMember
 from openpyxl.packaging.relationship import (
     get_rels_path,
     RelationshipList,
     Relationship,
 )
+from openpyxl.comments.author import AuthorList
 from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.comments.shape_writer import ShapeWriter
 from openpyxl.packaging.extended import ExtendedProperties
 from openpyxl.styles.stylesheet import write_stylesheet
 from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.worksheet._opaque import (
+    is_opaque,
+    opaque_shared_strings,
+    release_source,
+)
+from openpyxl.worksheet.table import Table
 from openpyxl.workbook._writer import WorkbookWriter
+from openpyxl.workbook.external_link.external import StoredExternalLink
 from .theme import theme_xml
 
 
+# parts preserved when keeping VBA
+ARC_VBA = re.compile("|".join(
+    ('xl/vba', r'xl/drawings/.*vmlDrawing\d\.vml',
+     'xl/ctrlProps', 'customUI', 'xl/activeX', r'xl/media/.*\.emf')
+))
+
+
 class ExcelWriter(object):
     """Write a workbook object to an Excel file."""
 
@@ -56,6 +77,7 @@ class ExcelWriter(object):
         self._drawings = []
         self._comments = []
         self._pivots = []
+        self._opaque = []
 
 
     def write_data(self):
@@ -63,57 +85,74 @@ class ExcelWriter(object):
         # cleanup all worksheets
         archive = self._archive
 
-        props = ExtendedProperties()
-        archive.writestr(ARC_APP, tostring(props.to_tree()))
-
-        archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
-        if self.workbook.loaded_theme:
-            archive.writestr(ARC_THEME, self.workbook.loaded_theme)
-        else:
-            archive.writestr(ARC_THEME, theme_xml)
-
-        self._write_worksheets()
-        self._write_chartsheets()
-        self._write_images()
-        self._write_charts()
+        with span("write_properties"):
+            props = ExtendedProperties()
+            archive.writestr(ARC_APP, tostring(props.to_tree()))
+
+            archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
+            if self.workbook.loaded_theme:
+                archive.writestr(ARC_THEME, self.workbook.loaded_theme)
+            else:
+                archive.writestr(ARC_THEME, theme_xml)
+
+        with span("write_worksheets"):
+            self._write_worksheets()
+        with span("write_chartsheets"):
+            self._write_chartsheets()
+        with span("write_images"):
+            self._write_images()
+        with span("write_charts"):
+            self._write_charts()
 
         #self._archive.writestr(ARC_SHARED_STRINGS,
                               #write_string_table(self.workbook.shared_strings))
-        self._write_external_links()
+        with span("write_external_links"):
+            self._write_external_links()
 
-        stylesheet = write_stylesheet(self.workbook)
-        archive.writestr(ARC_STYLE, tostring(stylesheet))
+        with span("write_stylesheet"):
+            stylesheet = write_stylesheet(self.workbook)
+            archive.writestr(ARC_STYLE, tostring(stylesheet))
+        counter("styles", len(self.workbook._cell_styles))
 
-        writer = WorkbookWriter(self.workbook)
-        archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
-        archive.writestr(ARC_WORKBOOK, writer.write())
-        archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+        with span("write_workbook"):
+            writer = WorkbookWriter(self.workbook)
+            archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
+            archive.writestr(ARC_WORKBOOK, writer.write())
+            archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
 
-        self._merge_vba()
+        with span("merge_vba"):
+            self._merge_vba()
+        with span("write_opaque_worksheets"):
+            self._write_opaque_worksheets()
 
-        self.manifest._write(archive, self.workbook)
+        with span("write_manifest"):
+            self.manifest._write(archive, self.workbook)
 
     def _merge_vba(self):
         """
         If workbook contains macros then extract associated files from cache
         of old file and add to archive
         """
-        ARC_VBA = re.compile("|".join(
-            ('xl/vba', r'xl/drawings/.*vmlDrawing\d\.vml',
-             'xl/ctrlProps', 'customUI', 'xl/activeX', r'xl/media/.*\.emf')
-        )
-                             )
-
-        if self.workbook.vba_archive:
-            for name in set(self.workbook.vba_archive.namelist()) - self.vba_modified:
+        vba_archive = self.workbook.vba_archive
+        if vba_archive:
+            # parts of opaque worksheets, and their relationships, are copied
+            # with them
+            opaque = set()
+            for ws, parts in self._opaque:
+                opaque.update(parts.data)
+                opaque.update(get_rels_path(name) for name in parts.rels)
+            for name in set(vba_archive.namelist()) - self.vba_modified - opaque:
                 if ARC_VBA.match(name):
-                    self._archive.writestr(name, self.workbook.vba_archive.read(name))
+                    RawMember.from_archive(vba_archive, name).write(self._archive, name)
 
 
     def _write_images(self):
         # delegate to object
         for img in self._images:
-            self._archive.writestr(img.path[1:], img._data())
+            if img._src is not None: # copy unchanged from the source
+                img._src.write(self._archive, img.path[1:])
+            else:
+                self._archive.writestr(img.path[1:], img._data())
 
 
     def _write_charts(self):
@@ -166,21 +205,23 @@ class ExcelWriter(object):
 
     def _write_comment(self, ws):
 
-        cs = CommentSheet.from_comments(ws._comments)
+        comments = ws._comments
+        cs = CommentSheet(authors=AuthorList(comments.authors), commentList=())
         self._comments.append(cs)
         cs._id = len(self._comments)
-        self._archive.writestr(cs.path[1:], tostring(cs.to_tree()))
+        with self._archive.open(cs.path[1:], "w") as out:
+            comments.write_comments(out)
         self.manifest.append(cs)
 
         if ws.legacy_drawing is None or self.workbook.vba_archive is None:
             ws.legacy_drawing = 'xl/drawings/commentsDrawing{0}.vml'.format(cs._id)
-            vml = None
+            with self._archive.open(ws.legacy_drawing, "w") as out:
+                comments.write_shapes(out)
         else:
+            # merge with the shapes of any controls
             vml = fromstring(self.workbook.vba_archive.read(ws.legacy_drawing))
-
-        vml = cs.write_shapes(vml)
-
-        self._archive.writestr(ws.legacy_drawing, vml)
+            vml = ShapeWriter(comments).write(vml)
+            self._archive.writestr(ws.legacy_drawing, vml)
         self.vba_modified.add(ws.legacy_drawing)
 
         comment_rel = Relationship(Id="comments", type=cs._rel_type, Target=cs.path)
@@ -188,19 +229,36 @@ class ExcelWriter(object):
 
 
     def write_worksheet(self, ws):
-        ws._drawing = SpreadsheetDrawing()
-        ws._drawing.charts = ws._charts
-        ws._drawing.images = ws._images
+        with span("write_worksheet", sheet=ws.title, part=ws.path[1:]):
+            self._write_worksheet(ws)
+
+
+    def _write_worksheet(self, ws):
+        ws._drawing = None
+        if ws._charts or ws._images:
+            # charts are only imported if needed
+            from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+            ws._drawing = SpreadsheetDrawing()
+            ws._drawing.charts = ws._charts
+            ws._drawing.images = ws._images
         if self.workbook.write_only:
             if not ws.closed:
                 ws.close()
             writer = ws._writer
         else:
             writer = WorksheetWriter(ws)
-            writer.write()
+            try:
+                writer.write()
+            except BaseException:
+                # includes cancellation
+                writer.close()
+                writer.cleanup()
+                raise
+            counter("cells", len(ws._cells), sheet=ws.title)
 
         ws._rels = writer._rels
-        self._archive.write(writer.out, ws.path[1:])
+        with span("compress", sheet=ws.title, part=ws.path[1:]):
+            self._archive.write(writer.out, ws.path[1:])
         self.manifest.append(ws)
         writer.cleanup()
 
@@ -208,21 +266,35 @@ class ExcelWriter(object):
     def _write_worksheets(self):
 
         pivot_caches = set()
+        self._opaque = [(ws, ws._parts) for ws in self.workbook.worksheets if is_opaque(ws)]
+        reserved = self._opaque_table_ids()
+        table_ids = (idx for idx in count(1) if idx not in reserved)
+        monitor = get_monitor()
+        worksheets = self.workbook.worksheets
 
-        for idx, ws in enumerate(self.workbook.worksheets, 1):
+        for idx, ws in enumerate(worksheets, 1):
 
             ws._id = idx
+            if is_opaque(ws):
+                # written last so that none of its parts are overwritten
+                continue
+
             self.write_worksheet(ws)
+            if monitor is not None:
+                monitor.report("parts", idx, len(worksheets), ws.path[1:])
+                monitor.report("bytes", self._archive.fp.tell())
 
             if ws._drawing:
-                self._write_drawing(ws._drawing)
+                with span("write_drawing", sheet=ws.title):
+                    self._write_drawing(ws._drawing)
 
                 for r in ws._rels.Relationship:
                     if "drawing" in r.Type:
                         r.Target = ws._drawing.path
 
             if ws._comments:
-                self._write_comment(ws)
+                with span("write_comments", sheet=ws.title):
+                    self._write_comment(ws)
 
             if ws.legacy_drawing is not None:
                 shape_rel = Relationship(type="vmlDrawing", Id="anysvml",
@@ -231,7 +303,7 @@ class ExcelWriter(object):
 
             for t in ws._tables:
                 self._tables.append(t)
-                t.id = len(self._tables)
+                t.id = next(table_ids)
                 t._write(self._archive)
                 self.manifest.append(t)
                 ws._rels[t._rel_id].Target = t.path
@@ -254,6 +326,35 @@ class ExcelWriter(object):
                 self._archive.writestr(rels_path, tostring(tree))
 
 
+    def _opaque_table_ids(self):
+        """
+        Ids of the tables in opaque worksheets which must not be reused
+        """
+        ids = set()
+        for ws, parts in self._opaque:
+            for path in parts.find(Table.mime_type):
+                node = fromstring(parts.read(path))
+                ids.add(int(node.get("id")))
+        return ids
+
+
+    def _write_opaque_worksheets(self):
+        """
+        Copy worksheets which were not loaded and the parts they refer to
+        """
+        if not self._opaque:
+            return
+
+        strings = opaque_shared_strings(self.workbook)
+        if strings is not None:
+            self._archive.writestr(ARC_SHARED_STRINGS, strings)
+            self.manifest.Override.append(Override("/" + ARC_SHARED_STRINGS, SHARED_STRINGS))
+
+        written = {}
+        for ws, parts in self._opaque:
+            parts.write(self._archive, self.manifest, ws.path[1:], written)
+
+
     def _write_external_links(self):
         # delegate to object
         """Write links to external workbooks"""
@@ -262,8 +363,11 @@ class ExcelWriter(object):
             link._id = idx
             rels_path = get_rels_path(link.path[1:])
 
-            xml = link.to_tree()
-            self._archive.writestr(link.path[1:], tostring(xml))
+            if isinstance(link, StoredExternalLink):
+                link._write(self._archive)
+            else:
+                xml = link.to_tree()
+                self._archive.writestr(link.path[1:], tostring(xml))
             rels = RelationshipList()
             rels.append(link.file_link)
             self._archive.writestr(rels_path, tostring(rels.to_tree()))
@@ -272,8 +376,14 @@ class ExcelWriter(object):
 
     def save(self):
         """Write data into the archive."""
-        self.write_data()
-        self._archive.close()
+        with span("save"):
+            self.write_data()
+            if get_tracer() is not None:
+                infos = self._archive.infolist()
+                counter("bytes", sum(info.file_size for info in infos))
+                counter("bytes_compressed", sum(info.compress_size for info in infos))
+            with span("close_archive"):
+                self._archive.close()
 
 
 def save_workbook(workbook, filename):
@@ -288,9 +398,19 @@ def save_workbook(workbook, filename):
     :rtype: bool
 
     """
+    release_source(workbook, filename)
+    if workbook.compact_styles_on_save and not workbook.write_only:
+        workbook.compact_styles()
     archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
     writer = ExcelWriter(workbook, archive)
-    writer.save()
+    try:
+        writer.save()
+    except OperationCancelled:
+        # don't leave an incomplete file behind
+        archive.close()
+        if isinstance(filename, (str, os.PathLike)):
+            os.remove(filename)
+        raise
     return True
 
 
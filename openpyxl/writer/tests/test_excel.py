@@ -189,3 +189,80 @@ def test_write_virtual_workbook():
     saved_wb = save_virtual_workbook(old_wb)
     new_wb = load_workbook(BytesIO(saved_wb))
     assert new_wb
+
+
+def test_opaque_worksheets():
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.title = "Kept"
+    ws1.append(["a", "b"])
+    ws1.append([1, 2])
+    ws1.add_table(Table(displayName="Table1", ref="A1:B2"))
+    ws1["A1"].comment = Comment("A comment", "Author")
+    ws1.print_title_rows = "1:1"
+    ws2 = wb.create_sheet("Edited")
+    ws2.append(["c"])
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out, sheets=["Edited"])
+    ws2 = wb["Edited"]
+    ws2.append([3])
+    ws2.add_table(Table(displayName="Table2", ref="A1:A2"))
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out)
+    ws1 = wb["Kept"]
+    assert ws1["B2"].value == 2
+    assert ws1["A1"].comment.text == "A comment"
+    assert ws1.print_title_rows == "1:1"
+    assert [t.id for t in ws1._tables] == [1]
+    assert wb["Edited"]["A2"].value == 3
+    assert [t.id for t in wb["Edited"]._tables] == [2]
+
+
+def test_lazy_worksheets(tmpdir):
+    tmpdir.chdir()
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.title = "Untouched"
+    ws1.append(["a", "b"])
+    ws1["A1"].comment = Comment("A comment", "Author")
+    ws1.print_title_rows = "1:1"
+    ws2 = wb.create_sheet("Edited")
+    ws2.print_title_rows = "1:2"
+    ws2.sheet_state = "hidden"
+    wb.save("source.xlsx")
+
+    wb = load_workbook("source.xlsx", lazy=True)
+    ws2 = wb["Edited"]
+    ws2["A1"] = 3
+    assert ws2.sheet_state == "hidden"
+    assert ws2.print_title_rows == "1:2"
+    wb.save("copy.xlsx")
+    wb.close()
+
+    src = ZipFile("source.xlsx")
+    out = ZipFile("copy.xlsx")
+    assert out.read("xl/worksheets/sheet1.xml") == src.read("xl/worksheets/sheet1.xml")
+
+    wb = load_workbook("copy.xlsx")
+    assert wb["Untouched"]["A1"].comment.text == "A comment"
+    assert wb["Untouched"].print_title_rows == "1:1"
+    assert wb["Edited"].print_title_rows == "1:2"
+    assert wb["Edited"]["A1"].value == 3
+
+
+def test_lazy_overwrite_source(tmpdir):
+    tmpdir.chdir()
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["a", "b"])
+    wb.save("source.xlsx")
+
+    wb = load_workbook("source.xlsx", lazy=True)
+    wb.save("source.xlsx")
+
+    wb = load_workbook("source.xlsx")
+    assert wb.active["B1"].value == "b"
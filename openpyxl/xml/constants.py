@@ -51,6 +51,8 @@ VML_NS =  REL_NS + "/vmlDrawing"
 VTYPES_NS = DOC_NS + 'docPropsVTypes'
 XPROPS_NS = DOC_NS + 'extended-properties'
 EXTERNAL_LINK_NS = REL_NS + "/externalLink"
+DRAWING_REL_NS = REL_NS + "/drawing"
+PIVOT_TABLE_REL_NS = REL_NS + "/pivotTable"
 
 # Package
 PKG_NS = "http://schemas.openxmlformats.org/package/2006/"